@@ -264,11 +264,11 @@ def time_millis():
     return int(time.time() * 1000)
 
 
-def build_protocol_client(protocol):
+def build_protocol_client(protocol, http_max_clients=HTTPClient.DEFAULT_MAX_CLIENTS, http_curl=False):
     """Factory function to build the protocol client for the given protocol."""
 
     if protocol == Protocols.HTTP:
-        return HTTPClient()
+        return HTTPClient(max_clients=http_max_clients, use_curl=http_curl)
     elif protocol == Protocols.WEBSOCKETS:
         return WebsocketClient()
     elif protocol == Protocols.COAP:
@@ -279,10 +279,10 @@ def build_protocol_client(protocol):
         return MQTTClient()
 
 
-async def fetch_consumed_thing(td_url, protocol):
+async def fetch_consumed_thing(td_url, protocol, **kwargs):
     """Gets the remote Thing Description and returns a ConsumedThing."""
 
-    clients = [build_protocol_client(protocol)]
+    clients = [build_protocol_client(protocol, **kwargs)]
     wot = WoT(servient=Servient(clients=clients))
     consumed_thing = await wot.consume_from_url(td_url)
 
@@ -757,6 +757,19 @@ def parse_args():
     parser_burst_event.add_argument("--lambd", dest="lambd", required=True, type=float)
     parser_burst_event.add_argument("--total", dest="total", required=True, type=int)
 
+    parser.add_argument(
+        "--http-max-clients",
+        dest="http_max_clients",
+        type=int,
+        default=None,
+        help="Maximum number of concurrent HTTP requests (defaults to the number of parallel invocations)")
+
+    parser.add_argument(
+        "--http-curl",
+        dest="http_curl",
+        action="store_true",
+        help="Use the curl-backed HTTP transport that keeps connections alive")
+
     parser_round_trip = subparsers.add_parser(TARGET_ROUND_TRIP)
     parser_round_trip.set_defaults(target=TARGET_ROUND_TRIP)
     parser_round_trip.add_argument("--batches", dest="batches", required=True, type=int)
@@ -781,9 +794,15 @@ def main():
 
     logger.info("Fetching TD from {}".format(args.td_url))
 
+    http_max_clients = args.http_max_clients or max(
+        getattr(args, "parallel", 0),
+        HTTPClient.DEFAULT_MAX_CLIENTS)
+
     consumed_thing = loop.run_until_complete(fetch_consumed_thing(
         args.td_url,
-        args.protocol))
+        args.protocol,
+        http_max_clients=http_max_clients,
+        http_curl=args.http_curl))
 
     logger.info("Consumed Thing: {}".format(consumed_thing))
 
@@ -829,6 +848,9 @@ def main():
     stats = func_map[args.target]()
     stats.update({"now": int(time.time() * 1000)})
 
+    if args.protocol == Protocols.HTTP:
+        stats.update({"httpPool": consumed_thing.servient.clients[Protocols.HTTP].stats})
+
     logger.info("Stats (series have been mapped to length):\n{}".format(pprint.pformat({
         key: len(val) if key.startswith("series") else val
         for key, val in stats.items()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark that measures the throughput and latency of a large number of
+parallel Action invocations from one MQTTClient to Things on two MQTT brokers.
+"""
+
+import argparse
+import json
+import time
+import uuid
+
+import tornado.gen
+import tornado.ioloop
+
+from wotpy.protocols.mqtt.client import MQTTClient
+from wotpy.protocols.mqtt.server import MQTTServer
+from wotpy.wot.servient import Servient
+from wotpy.wot.td import ThingDescription
+
+try:
+    from . import mqtt_latency
+except ImportError:
+    # noinspection PyPackageRequirements,PyUnresolvedReferences
+    import mqtt_latency
+
+DEFAULT_PORTS = [1884, 1885]
+DEFAULT_CALLS = 1000
+ACTION_NAME = "echo"
+
+
+@tornado.gen.coroutine
+def expose_thing(broker_url):
+    """Starts a Servient with an MQTT server on the given broker that exposes
+    a Thing with an echo Action. Returns the Servient and the Thing Description."""
+
+    servient = Servient(catalogue_port=None)
+    servient.add_server(MQTTServer(broker_url, servient_id=uuid.uuid4().hex))
+    wot = yield servient.start()
+
+    exposed_thing = wot.produce(json.dumps({
+        "id": uuid.uuid4().urn,
+        "title": "Benchmark Thing",
+        "actions": {ACTION_NAME: {}}
+    }))
+
+    @tornado.gen.coroutine
+    def echo(params):
+        raise tornado.gen.Return(params["input"])
+
+    exposed_thing.set_action_handler(ACTION_NAME, echo)
+    exposed_thing.expose()
+
+    raise tornado.gen.Return((servient, ThingDescription.from_thing(exposed_thing.thing)))
+
+
+@tornado.gen.coroutine
+def measure(broker_urls, num_calls):
+    """Returns the total time (s) and the latency (ms) of each of the given number
+    of parallel Action invocations distributed evenly across the brokers."""
+
+    exposed = yield [expose_thing(broker_url) for broker_url in broker_urls]
+    tds = [td for _, td in exposed]
+
+    client = MQTTClient()
+
+    @tornado.gen.coroutine
+    def invoke(idx):
+        time_start = time.time()
+        result = yield client.invoke_action(tds[idx % len(tds)], ACTION_NAME, idx)
+        assert result == idx
+        raise tornado.gen.Return(1e3 * (time.time() - time_start))
+
+    try:
+        time_start = time.time()
+        latencies = yield [invoke(idx) for idx in range(num_calls)]
+        time_total = time.time() - time_start
+    finally:
+        yield [servient.shutdown() for servient, _ in exposed]
+
+    raise tornado.gen.Return({
+        "total": time_total,
+        "latencies": latencies
+    })
+
+
+def parse_args():
+    """Parses and returns the command line arguments."""
+
+    parser = argparse.ArgumentParser(description="MQTT parallel Action invocations benchmark")
+
+    parser.add_argument(
+        '--brokers',
+        dest="brokers",
+        nargs="+",
+        default=None,
+        help="URLs of external MQTT brokers (two in-process brokers are started by default)")
+
+    parser.add_argument(
+        '--ports',
+        dest="ports",
+        nargs="+",
+        type=int,
+        default=DEFAULT_PORTS,
+        help="Ports of the in-process MQTT brokers")
+
+    parser.add_argument(
+        '--calls',
+        dest="calls",
+        type=int,
+        default=DEFAULT_CALLS,
+        help="Number of parallel Action invocations")
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entrypoint."""
+
+    args = parse_args()
+
+    @tornado.gen.coroutine
+    def run():
+        brokers = []
+        broker_urls = args.brokers
+
+        if broker_urls is None:
+            brokers = [mqtt_latency.build_broker(port) for port in args.ports]
+            broker_urls = ["mqtt://127.0.0.1:{}".format(port) for port in args.ports]
+            yield [broker.start() for broker in brokers]
+
+        try:
+            res = yield measure(broker_urls, args.calls)
+        finally:
+            yield [broker.shutdown() for broker in brokers]
+
+        raise tornado.gen.Return(res)
+
+    res = tornado.ioloop.IOLoop.current().run_sync(run)
+
+    print("{:>10} {:>14} {:>14} {:>14} {:>14}".format(
+        "calls", "total (s)", "calls/s", "median (ms)", "p99 (ms)"))
+
+    print("{:>10} {:>14.3f} {:>14.1f} {:>14.3f} {:>14.3f}".format(
+        len(res["latencies"]),
+        res["total"],
+        len(res["latencies"]) / res["total"],
+        mqtt_latency.percentile(res["latencies"], 50),
+        mqtt_latency.percentile(res["latencies"], 99)))
+
+
+if __name__ == "__main__":
+    main()
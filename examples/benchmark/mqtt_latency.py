@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark that measures the latency between a message being published
+on the broker and the message being handled by an MQTTHandlerRunner, as well
+as the CPU time consumed by an idle runner.
+"""
+
+import argparse
+import json
+import math
+import time
+
+import tornado.gen
+import tornado.ioloop
+import tornado.locks
+from hbmqtt.broker import Broker
+from hbmqtt.client import MQTTClient
+from hbmqtt.mqtt.constants import QOS_0
+
+from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
+from wotpy.protocols.mqtt.runner import MQTTHandlerRunner
+
+DEFAULT_PORT = 1884
+DEFAULT_MESSAGES = 1000
+DEFAULT_INTERVAL_MS = 2
+DEFAULT_IDLE_SECS = 5.0
+TOPIC_LATENCY = "wotpy-benchmark/latency"
+
+
+class LatencyMQTTHandler(BaseMQTTHandler):
+    """MQTT handler that records the latency of each received message."""
+
+    def __init__(self, num_messages):
+        super(LatencyMQTTHandler, self).__init__(mqtt_server=None)
+        self.latencies = []
+        self.num_messages = num_messages
+        self.event_done = tornado.locks.Event()
+
+    @property
+    def topics(self):
+        return [("{}/#".format(TOPIC_LATENCY), QOS_0)]
+
+    @tornado.gen.coroutine
+    def handle_message(self, msg):
+        sent = json.loads(msg.data.decode())["time"]
+        self.latencies.append(time.perf_counter() - sent)
+
+        if len(self.latencies) >= self.num_messages:
+            self.event_done.set()
+
+
+def build_broker(port):
+    """Builds an in-process hbmqtt broker that listens on the given port."""
+
+    return Broker({
+        "listeners": {
+            "default": {
+                "type": "tcp",
+                "bind": "127.0.0.1:{}".format(port)
+            }
+        },
+        "sys_interval": 0,
+        "auth": {
+            "allow-anonymous": True,
+            "plugins": ["auth_anonymous"]
+        },
+        "topic-check": {
+            "enabled": False
+        }
+    })
+
+
+def percentile(values, pct):
+    """Returns the nearest-rank percentile of the given values."""
+
+    values = sorted(values)
+    idx = max(int(math.ceil(pct / 100.0 * len(values))) - 1, 0)
+
+    return values[idx]
+
+
+@tornado.gen.coroutine
+def measure(broker_url, num_messages, interval_ms, idle_secs):
+    """Returns the publish-to-handle latencies (ms) and the
+    CPU time (ms) consumed by an idle MQTTHandlerRunner."""
+
+    handler = LatencyMQTTHandler(num_messages)
+    runner = MQTTHandlerRunner(broker_url=broker_url, mqtt_handlers=[handler])
+
+    yield runner.start()
+
+    cpu_start = time.process_time()
+    yield tornado.gen.sleep(idle_secs)
+    cpu_idle = 1e3 * (time.process_time() - cpu_start)
+
+    client = MQTTClient()
+    yield client.connect(broker_url)
+
+    try:
+        for idx in range(num_messages):
+            payload = json.dumps({"time": time.perf_counter()}).encode()
+            yield client.publish("{}/{}".format(TOPIC_LATENCY, idx), payload, qos=QOS_0)
+            yield tornado.gen.sleep(interval_ms / 1e3)
+
+        yield handler.event_done.wait()
+    finally:
+        yield client.disconnect()
+        yield runner.stop()
+
+    raise tornado.gen.Return({
+        "latencies": [1e3 * item for item in handler.latencies],
+        "cpu_idle": cpu_idle
+    })
+
+
+def parse_args():
+    """Parses and returns the command line arguments."""
+
+    parser = argparse.ArgumentParser(description="MQTT runner latency benchmark")
+
+    parser.add_argument(
+        '--broker',
+        dest="broker",
+        default=None,
+        help="URL of an external MQTT broker (an in-process broker is started by default)")
+
+    parser.add_argument(
+        '--port',
+        dest="port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="Port of the in-process MQTT broker")
+
+    parser.add_argument(
+        '--messages',
+        dest="messages",
+        type=int,
+        default=DEFAULT_MESSAGES,
+        help="Number of published messages")
+
+    parser.add_argument(
+        '--interval',
+        dest="interval",
+        type=float,
+        default=DEFAULT_INTERVAL_MS,
+        help="Time (ms) between published messages")
+
+    parser.add_argument(
+        '--idle',
+        dest="idle",
+        type=float,
+        default=DEFAULT_IDLE_SECS,
+        help="Time (s) the runner is left idle to measure its CPU usage")
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entrypoint."""
+
+    args = parse_args()
+
+    @tornado.gen.coroutine
+    def run():
+        broker = None
+        broker_url = args.broker
+
+        if broker_url is None:
+            broker = build_broker(args.port)
+            broker_url = "mqtt://127.0.0.1:{}".format(args.port)
+            yield broker.start()
+
+        try:
+            res = yield measure(broker_url, args.messages, args.interval, args.idle)
+        finally:
+            if broker is not None:
+                yield broker.shutdown()
+
+        raise tornado.gen.Return(res)
+
+    res = tornado.ioloop.IOLoop.current().run_sync(run)
+
+    print("{:>10} {:>14} {:>14} {:>14} {:>14}".format(
+        "messages", "median (ms)", "p99 (ms)", "max (ms)", "idle cpu (ms)"))
+
+    print("{:>10} {:>14.3f} {:>14.3f} {:>14.3f} {:>14.3f}".format(
+        len(res["latencies"]),
+        percentile(res["latencies"], 50),
+        percentile(res["latencies"], 99),
+        max(res["latencies"]),
+        res["cpu_idle"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark that measures the cost of enabling ExposedThings
+on a Servient (i.e. the startup cost) as the number of Things grows.
+"""
+
+import argparse
+import time
+import uuid
+
+from wotpy.protocols.http.server import HTTPServer
+from wotpy.protocols.ws.server import WebsocketServer
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.interaction import Property, Action, Event
+from wotpy.wot.servient import Servient
+from wotpy.wot.thing import Thing
+
+DEFAULT_SIZES = [10, 100, 1000, 5000]
+DEFAULT_PORT_HTTP = 9494
+DEFAULT_PORT_WS = 9393
+
+
+def build_servient(size):
+    """Builds a stopped Servient that contains the given number of disabled ExposedThings."""
+
+    servient = Servient(catalogue_port=None)
+    servient.add_server(HTTPServer(port=DEFAULT_PORT_HTTP))
+    servient.add_server(WebsocketServer(port=DEFAULT_PORT_WS))
+
+    for idx in range(size):
+        thing = Thing(id=uuid.uuid4().urn, title="Thing {}".format(idx))
+        thing.add_interaction(Property(thing=thing, name="prop", type="string"))
+        thing.add_interaction(Action(thing=thing, name="action"))
+        thing.add_interaction(Event(thing=thing, name="event"))
+        servient.add_exposed_thing(ExposedThing(servient=servient, thing=thing))
+
+    return servient
+
+
+def measure(size):
+    """Returns the total time (ms) spent enabling the given number
+    of ExposedThings one by one and all at once in bulk."""
+
+    servient = build_servient(size)
+    thing_ids = [exp_thing.id for exp_thing in servient.exposed_things]
+    time_start = time.time()
+
+    for thing_id in thing_ids:
+        servient.enable_exposed_thing(thing_id)
+
+    time_single = 1e3 * (time.time() - time_start)
+
+    servient = build_servient(size)
+    thing_ids = [exp_thing.id for exp_thing in servient.exposed_things]
+    time_start = time.time()
+    servient.enable_exposed_things(thing_ids)
+    time_bulk = 1e3 * (time.time() - time_start)
+
+    return {
+        "single": time_single,
+        "bulk": time_bulk
+    }
+
+
+def parse_args():
+    """Parses and returns the command line arguments."""
+
+    parser = argparse.ArgumentParser(description="Servient startup benchmark")
+
+    parser.add_argument(
+        '--sizes',
+        dest="sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="Number of ExposedThings enabled in each measurement")
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entrypoint."""
+
+    args = parse_args()
+
+    print("{:>10} {:>14} {:>14} {:>14}".format(
+        "things", "single (ms)", "bulk (ms)", "per thing (µs)"))
+
+    for size in args.sizes:
+        res = measure(size)
+
+        print("{:>10} {:>14.3f} {:>14.3f} {:>14.3f}".format(
+            size, res["single"], res["bulk"], 1e3 * res["bulk"] / size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark that compares the cost of building ThingDescription
+objects from large TD documents with the different validation modes.
+"""
+
+import argparse
+import timeit
+import uuid
+
+import jsonschema
+
+from wotpy.wot.td import ThingDescription
+from wotpy.wot.validation import SCHEMA_THING
+
+DEFAULT_SIZES = [1, 10, 100, 500]
+DEFAULT_REPEATS = 10
+
+
+def build_td_doc(size):
+    """Builds a TD document that contains the given number of interactions of each type."""
+
+    form = {"href": "http://localhost:9494/{}".format(uuid.uuid4().hex)}
+
+    return {
+        "id": uuid.uuid4().urn,
+        "title": "Large Thing",
+        "properties": {
+            "prop{}".format(idx): {"type": "string", "observable": True, "forms": [form]}
+            for idx in range(size)
+        },
+        "actions": {
+            "action{}".format(idx): {"input": {"type": "number"}, "forms": [form]}
+            for idx in range(size)
+        },
+        "events": {
+            "event{}".format(idx): {"data": {"type": "object"}, "forms": [form]}
+            for idx in range(size)
+        }
+    }
+
+
+def build_td_legacy(doc):
+    """Builds a ThingDescription building a new validator for the document
+    (the behaviour of ThingDescription before pre-compiled validators)."""
+
+    td = ThingDescription(doc, validate=False)
+    jsonschema.validate(td.to_dict(), SCHEMA_THING)
+
+    return td
+
+
+def measure(size, repeats):
+    """Returns the mean cost (ms) of building a ThingDescription in each mode."""
+
+    doc = build_td_doc(size)
+
+    def run(func):
+        return 1e3 * timeit.timeit(func, number=repeats) / repeats
+
+    return {
+        "legacy": run(lambda: build_td_legacy(doc)),
+        "compiled": run(lambda: ThingDescription(doc)),
+        "trusted": run(lambda: ThingDescription(doc, validate=False))
+    }
+
+
+def parse_args():
+    """Parses and returns the command line arguments."""
+
+    parser = argparse.ArgumentParser(description="ThingDescription validation benchmark")
+
+    parser.add_argument(
+        '--sizes',
+        dest="sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="Number of interactions of each type in each measured TD")
+
+    parser.add_argument(
+        '--repeats',
+        dest="repeats",
+        type=int,
+        default=DEFAULT_REPEATS,
+        help="Number of TDs built for each measurement")
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entrypoint."""
+
+    args = parse_args()
+
+    print("{:>14} {:>14} {:>14} {:>14}".format(
+        "interactions", "legacy (ms)", "compiled (ms)", "trusted (ms)"))
+
+    for size in args.sizes:
+        res = measure(size, args.repeats)
+
+        print("{:>14} {:>14.3f} {:>14.3f} {:>14.3f}".format(
+            3 * size, res["legacy"], res["compiled"], res["trusted"]))
+
+
+if __name__ == "__main__":
+    main()
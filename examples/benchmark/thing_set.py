@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark that measures the cost of looking up ExposedThings
+in an ExposedThingSet as the number of Things grows.
+"""
+
+import argparse
+import random
+import timeit
+import uuid
+
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.exposed.thing_set import ExposedThingSet
+from wotpy.wot.interaction import Property
+from wotpy.wot.thing import Thing
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+DEFAULT_LOOKUPS = 10000
+
+
+def build_thing_set(size):
+    """Builds an ExposedThingSet that contains the given number of ExposedThings."""
+
+    exp_thing_set = ExposedThingSet()
+
+    for idx in range(size):
+        thing = Thing(id=uuid.uuid4().urn, title="Thing {}".format(idx))
+        thing.add_interaction(Property(thing=thing, name="prop", type="string"))
+        exp_thing_set.add(ExposedThing(servient=None, thing=thing))
+
+    return exp_thing_set
+
+
+def measure(exp_thing_set, num_lookups):
+    """Returns the mean cost (µs) of each type of lookup on the given set."""
+
+    exp_things = list(exp_thing_set.exposed_things)
+    targets = [random.choice(exp_things) for _ in range(num_lookups)]
+    ids = [item.thing.id for item in targets]
+    url_names = [item.thing.url_name for item in targets]
+    interactions = [item.thing.properties["prop"] for item in targets]
+
+    def run(func, args):
+        secs = timeit.timeit(lambda: [func(arg) for arg in args], number=1)
+        return 1e6 * secs / len(args)
+
+    return {
+        "id": run(exp_thing_set.find_by_thing_id, ids),
+        "url_name": run(exp_thing_set.find_by_thing_id, url_names),
+        "interaction": run(exp_thing_set.find_by_interaction, interactions),
+        "contains": run(exp_thing_set.contains, targets)
+    }
+
+
+def parse_args():
+    """Parses and returns the command line arguments."""
+
+    parser = argparse.ArgumentParser(description="ExposedThingSet lookups benchmark")
+
+    parser.add_argument(
+        '--sizes',
+        dest="sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="Number of ExposedThings in each measured set")
+
+    parser.add_argument(
+        '--lookups',
+        dest="lookups",
+        type=int,
+        default=DEFAULT_LOOKUPS,
+        help="Number of lookups of each type for each set")
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entrypoint."""
+
+    args = parse_args()
+
+    print("{:>10} {:>14} {:>14} {:>14} {:>14}".format(
+        "things", "id (µs)", "url_name (µs)", "intrct (µs)", "contains (µs)"))
+
+    for size in args.sizes:
+        res = measure(build_thing_set(size), args.lookups)
+
+        print("{:>10} {:>14.3f} {:>14.3f} {:>14.3f} {:>14.3f}".format(
+            size, res["id"], res["url_name"], res["interaction"], res["contains"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -82,6 +82,7 @@ setup(
     install_requires=install_requires,
     extras_require={
         'tests': test_requires,
-        'uvloop': ['uvloop>=0.12.2,<0.13.0']
+        'uvloop': ['uvloop>=0.12.2,<0.13.0'],
+        'curl': ['pycurl>=7.43.0,<8.0']
     }
 )
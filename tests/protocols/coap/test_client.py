@@ -6,6 +6,7 @@ from tests.protocols.helpers import \
     client_test_on_event, \
     client_test_read_property, \
     client_test_write_property, \
+    client_test_read_write_properties, \
     client_test_invoke_action, \
     client_test_invoke_action_error, \
     client_test_on_property_change_error
@@ -24,6 +25,12 @@ def test_write_property(coap_servient):
     client_test_write_property(coap_servient, CoAPClient)
 
 
+def test_read_write_properties(coap_servient):
+    """The CoAP client can read and write multiple properties in one request."""
+
+    client_test_read_write_properties(coap_servient, CoAPClient)
+
+
 def test_on_property_change(coap_servient):
     """The CoAP client can subscribe to property updates."""
 
@@ -3,6 +3,7 @@
 
 import datetime
 import json
+import uuid
 
 import aiocoap
 import pytest
@@ -147,6 +148,84 @@ def test_property_write(coap_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_properties_read_write(coap_server):
+    """Multiple Properties exposed in an CoAP server can be read
+    and updated with a single request to the Thing-level Form."""
+
+    exposed_thing = next(coap_server.exposed_things)
+    prop_names = list(six.iterkeys(exposed_thing.thing.properties))
+    thing_forms = coap_server.build_thing_forms("localhost", exposed_thing.thing)
+    href = thing_forms[0].href
+
+    assert InteractionVerbs.READ_MULTIPLE_PROPERTIES in thing_forms[0].op
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        values = {name: Faker().pyint() for name in prop_names}
+        coap_client = yield aiocoap.Context.create_client_context()
+        payload = json.dumps({"values": values}).encode("utf-8")
+        request_msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
+        response = yield coap_client.request(request_msg).response
+
+        assert response.code.is_successful()
+        assert (yield exposed_thing.read_properties()) == values
+
+        href_one = "{}&name={}".format(href, prop_names[0])
+        request_msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href_one)
+        response = yield coap_client.request(request_msg).response
+
+        assert response.code.is_successful()
+        assert json.loads(response.payload).get("values") == {prop_names[0]: values[prop_names[0]]}
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_properties_errors(coap_server):
+    """Requests to the Thing-level Form for unknown Properties or with invalid payloads are rejected
+    with client errors while errors raised by the Property handlers are reported as server errors."""
+
+    exposed_thing = next(coap_server.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.thing.properties))
+    thing_forms = coap_server.build_thing_forms("localhost", exposed_thing.thing)
+    href = thing_forms[0].href
+
+    # noinspection PyUnusedLocal
+    @tornado.gen.coroutine
+    def read_handler(*args, **kwargs):
+        raise KeyError("handler error")
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        coap_client = yield aiocoap.Context.create_client_context()
+        unknown_name = uuid.uuid4().hex
+
+        request_msg = aiocoap.Message(code=aiocoap.Code.GET, uri="{}&name={}".format(href, unknown_name))
+        response = yield coap_client.request(request_msg).response
+
+        assert response.code == aiocoap.Code.NOT_FOUND
+
+        payload = json.dumps({"values": {unknown_name: Faker().pyint()}}).encode("utf-8")
+        request_msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
+        response = yield coap_client.request(request_msg).response
+
+        assert response.code == aiocoap.Code.NOT_FOUND
+
+        payload = json.dumps([Faker().pyint()]).encode("utf-8")
+        request_msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
+        response = yield coap_client.request(request_msg).response
+
+        assert response.code == aiocoap.Code.BAD_REQUEST
+
+        exposed_thing.set_property_read_handler(prop_name, read_handler)
+
+        request_msg = aiocoap.Message(code=aiocoap.Code.GET, uri="{}&name={}".format(href, prop_name))
+        response = yield coap_client.request(request_msg).response
+
+        assert response.code == aiocoap.Code.INTERNAL_SERVER_ERROR
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_property_subscription(coap_server):
     """Properties exposed in an CoAP server can be observed for value updates."""
 
@@ -250,6 +329,38 @@ def test_action_clear_invocation(coap_server):
     run_test_coroutine(test_coroutine)
 
 
+@pytest.mark.parametrize("coap_server", [{"action_clear_ms": 5000, "action_max_pending": 1}], indirect=True)
+def test_action_pending_limit(coap_server):
+    """The CoAP server responds with 5.03 when there are too many pending invocations."""
+
+    exposed_thing = next(coap_server.exposed_things)
+    action_name = next(six.iterkeys(exposed_thing.thing.actions))
+    href = _get_action_href(exposed_thing, action_name, coap_server)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        coap_client = yield aiocoap.Context.create_client_context()
+
+        @tornado.gen.coroutine
+        def invoke():
+            payload = json.dumps({"input": Faker().pyint()}).encode("utf-8")
+            msg = aiocoap.Message(code=aiocoap.Code.POST, payload=payload, uri=href)
+            response = yield coap_client.request(msg).response
+            raise tornado.gen.Return(response)
+
+        response = yield invoke()
+
+        assert response.code.is_successful()
+        assert coap_server.stats["invocations"]["size"] == 1
+
+        response = yield invoke()
+
+        assert response.code == aiocoap.Code.SERVICE_UNAVAILABLE
+        assert coap_server.stats["invocations"]["rejected"] == 1
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_action_invoke_parallel(coap_server):
     """Actions exposed in a CoAP server can be invoked in parallel."""
 
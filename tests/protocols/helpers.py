@@ -179,6 +179,55 @@ def client_test_write_property(servient, protocol_client_cls, timeout=None):
     run_test_coroutine(test_coroutine)
 
 
+def client_test_read_write_properties(servient, protocol_client_cls, timeout=None):
+    """Helper function to test reads and writes of multiple Properties on bindings
+    clients. The single Property methods of the client should not be used."""
+
+    exposed_thing = next(servient.exposed_things)
+
+    prop_names = [uuid.uuid4().hex for _ in range(3)]
+
+    for prop_name in prop_names:
+        exposed_thing.add_property(prop_name, PropertyFragmentDict({
+            "type": "string",
+            "observable": True
+        }), value=Faker().sentence())
+
+    servient.refresh_forms()
+
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        protocol_client = protocol_client_cls()
+
+        def raise_single(*args, **kwargs):
+            raise AssertionError("Single Property method called")
+
+        protocol_client.read_property = raise_single
+        protocol_client.write_property = raise_single
+
+        values_all = yield protocol_client.read_properties(td, timeout=timeout)
+        expected_all = yield exposed_thing.read_properties()
+
+        assert values_all == expected_all
+        assert set(prop_names).issubset(set(values_all.keys()))
+
+        values_some = yield protocol_client.read_properties(td, names=prop_names[:2], timeout=timeout)
+
+        assert values_some == {name: expected_all[name] for name in prop_names[:2]}
+
+        values_write = {name: Faker().sentence() for name in prop_names[1:]}
+
+        yield protocol_client.write_properties(td, values_write, timeout=timeout)
+
+        values_curr = yield exposed_thing.read_properties(prop_names)
+
+        assert values_curr == dict(values_write, **{prop_names[0]: expected_all[prop_names[0]]})
+
+    run_test_coroutine(test_coroutine)
+
+
 def client_test_invoke_action(servient, protocol_client_cls, timeout=None):
     """Helper function to test Action invocations on bindings clients."""
 
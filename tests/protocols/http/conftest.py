@@ -17,8 +17,8 @@ from wotpy.wot.td import ThingDescription
 from wotpy.wot.thing import Thing
 
 
-@pytest.fixture
-def http_server():
+@pytest.fixture(params=[{}])
+def http_server(request):
     """Builds an HTTPServer instance that contains an ExposedThing."""
 
     exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
@@ -52,7 +52,7 @@ def http_server():
 
     port = find_free_port()
 
-    server = HTTPServer(port=port)
+    server = HTTPServer(port=port, **request.param)
     server.add_exposed_thing(exposed_thing)
 
     @tornado.gen.coroutine
@@ -1,15 +1,32 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import json
+
+import pytest
+import six
+import tornado.concurrent
+import tornado.gen
+import tornado.ioloop
+import tornado.web
+from faker import Faker
+from rx import Observable
+
 from tests.protocols.helpers import \
     client_test_on_property_change, \
     client_test_on_event, \
     client_test_read_property, \
     client_test_write_property, \
+    client_test_read_write_properties, \
     client_test_invoke_action, \
     client_test_invoke_action_error, \
     client_test_on_property_change_error
+from tests.utils import run_test_coroutine, find_free_port
+from wotpy.protocols.exceptions import ClientRequestTimeout
 from wotpy.protocols.http.client import HTTPClient
+from wotpy.protocols.http.enums import HTTPSubprotocols
+from wotpy.protocols.http.pool import HTTPClientPool
+from wotpy.wot.td import ThingDescription
 
 
 def test_read_property(http_servient):
@@ -24,6 +41,12 @@ def test_write_property(http_servient):
     client_test_write_property(http_servient, HTTPClient)
 
 
+def test_read_write_properties(http_servient):
+    """The HTTP client can read and write multiple properties in one request."""
+
+    client_test_read_write_properties(http_servient, HTTPClient)
+
+
 def test_invoke_action(http_servient):
     """The HTTP client can invoke actions."""
 
@@ -53,3 +76,302 @@ def test_on_property_change_error(http_servient):
     observation are propagated to the subscription as expected."""
 
     client_test_on_property_change_error(http_servient, HTTPClient)
+
+
+def _set_slow_read_handler(exposed_thing, prop_name, sleep_secs, state):
+    """Sets a Property read handler that sleeps and tracks the number of concurrent reads."""
+
+    @tornado.gen.coroutine
+    def read_handler():
+        state["current"] += 1
+        state["max"] = max(state["max"], state["current"])
+        yield tornado.gen.sleep(sleep_secs)
+        state["current"] -= 1
+        raise tornado.gen.Return(state["max"])
+
+    exposed_thing.set_property_read_handler(prop_name, read_handler)
+
+
+def test_pool_max_clients_per_host(http_servient):
+    """The HTTP client limits the number of concurrent requests
+    to the same host and accounts for the time spent waiting."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    state = {"current": 0, "max": 0}
+    _set_slow_read_handler(exposed_thing, prop_name, 0.05, state)
+
+    num_reads = 6
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = HTTPClient(max_clients=num_reads, max_clients_per_host=2)
+
+        yield [http_client.read_property(td, prop_name) for _ in range(num_reads)]
+
+        stats = http_client.stats
+
+        assert state["max"] == 2
+        assert stats["requests"] == num_reads
+        assert stats["active"] == 0
+        assert stats["queued"] == 0
+        assert stats["wait_max"] > 0
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_pool_queue_timeout(http_servient):
+    """Requests that wait for a free connection longer than their timeout are rejected."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+
+    state = {"current": 0, "max": 0}
+    _set_slow_read_handler(exposed_thing, prop_name, 0.5, state)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = HTTPClient(max_clients=1)
+
+        future_read = http_client.read_property(td, prop_name)
+
+        with pytest.raises(ClientRequestTimeout):
+            yield http_client.read_property(td, prop_name, timeout=0.05)
+
+        yield future_read
+
+        assert http_client.stats["queue_timeouts"] == 1
+        assert http_client.stats["requests"] == 1
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_pool_loop_change():
+    """The HTTP client pool closes the Tornado client of the previous IOLoop when the IOLoop changes."""
+
+    pool = HTTPClientPool()
+    tornado_clients = []
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        tornado_clients.append(pool.http_client)
+        assert pool.http_client is tornado_clients[-1]
+
+    run_test_coroutine(test_coroutine)
+
+    io_loop_other = tornado.ioloop.IOLoop(make_current=False)
+
+    try:
+        io_loop_other.run_sync(test_coroutine)
+    finally:
+        io_loop_other.close(all_fds=True)
+
+    assert tornado_clients[0] is not tornado_clients[1]
+    assert tornado_clients[0]._closed
+    assert not tornado_clients[1]._closed
+
+
+def test_invoke_action_inline(http_servient):
+    """Action results are returned inline by the server for fast Actions
+    and the client falls back to check the invocation for slow ones."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    action_name = next(six.iterkeys(exposed_thing.actions))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    http_server = next(six.itervalues(http_servient.servers))
+
+    @tornado.gen.coroutine
+    def action_handler(parameters):
+        yield tornado.gen.sleep(parameters.get("input"))
+        raise tornado.gen.Return(parameters.get("input"))
+
+    exposed_thing.set_action_handler(action_name, action_handler)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        num_pending = len(http_server.pending_actions)
+
+        result = yield HTTPClient().invoke_action(td, action_name, 0)
+
+        assert result == 0
+        assert len(http_server.pending_actions) == num_pending
+
+        result = yield HTTPClient(action_wait=0.01).invoke_action(td, action_name, 0.2)
+
+        assert result == 0.2
+        assert len(http_server.pending_actions) == num_pending + 1
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_on_property_change_longpoll(http_servient):
+    """The HTTP client falls back to long-polling when
+    the Server-Sent Events streams are not advertised."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td_dict = ThingDescription.from_thing(exposed_thing.thing).to_dict()
+
+    td_dict["properties"][prop_name]["forms"] = [
+        form for form in td_dict["properties"][prop_name]["forms"]
+        if form.get("subprotocol") != HTTPSubprotocols.SSE
+    ]
+
+    td = ThingDescription(td_dict)
+    value = Faker().sentence()
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        future_value = tornado.concurrent.Future()
+
+        def on_next(item):
+            item.data.value == value and not future_value.done() and future_value.set_result(True)
+
+        subscription = HTTPClient().on_property_change(td, prop_name).subscribe(on_next)
+
+        periodic_write = tornado.ioloop.PeriodicCallback(
+            lambda: exposed_thing.properties[prop_name].write(value), 20)
+
+        periodic_write.start()
+
+        yield future_value
+
+        periodic_write.stop()
+        subscription.dispose()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_stream_unsubscribe_closes_connection(http_servient):
+    """Server-Sent Events streams do not take connections from the pool
+    and are closed as soon as the Observer unsubscribes."""
+
+    exposed_thing = next(http_servient.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    value = Faker().sentence()
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = HTTPClient(max_clients=1, max_clients_per_host=1)
+        future_value = tornado.concurrent.Future()
+
+        def on_next(item):
+            item.data.value == value and not future_value.done() and future_value.set_result(True)
+
+        subscription = http_client.on_property_change(td, prop_name).subscribe(on_next)
+
+        periodic_write = tornado.ioloop.PeriodicCallback(
+            lambda: exposed_thing.properties[prop_name].write(value), 20)
+
+        periodic_write.start()
+
+        yield future_value
+
+        periodic_write.stop()
+
+        assert http_client.stats["streams"] == 1
+        assert (yield http_client.read_property(td, prop_name, timeout=1)) == value
+
+        subscription.dispose()
+
+        yield tornado.gen.sleep(0.1)
+
+        assert http_client.stats["streams"] == 0
+        assert (yield http_client.read_property(td, prop_name, timeout=1)) == value
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_stream_split_multibyte_chars():
+    """Characters split across chunks of a Server-Sent Events stream are decoded properly."""
+
+    value = u"caf\u00e9 \u2713"
+    data = json.dumps({"name": "prop", "value": value}, ensure_ascii=False)
+    message = u"event: property\ndata: {}\n\n".format(data).encode("utf-8")
+    idx_split = message.index(u"\u2713".encode("utf-8")) + 1
+
+    class SplitStreamHandler(tornado.web.RequestHandler):
+        @tornado.gen.coroutine
+        def get(self):
+            self.write(message[:idx_split])
+            yield self.flush()
+            yield tornado.gen.sleep(0.05)
+            self.write(message[idx_split:])
+            yield self.flush()
+            yield tornado.gen.sleep(5)
+
+    port = find_free_port()
+    server = tornado.web.Application([(r"/stream", SplitStreamHandler)]).listen(port)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        future_data = tornado.concurrent.Future()
+
+        # noinspection PyProtectedMember
+        subscribe = HTTPClient()._build_stream_subscribe(
+            "http://localhost:{}/stream".format(port), lambda data: data)
+
+        def on_error(err):
+            not future_data.done() and future_data.set_exception(err)
+
+        subscription = Observable.create(subscribe).subscribe(
+            lambda data: not future_data.done() and future_data.set_result(data),
+            on_error)
+
+        data = yield future_data
+
+        assert data == {"name": "prop", "value": value}
+
+        subscription.dispose()
+
+    try:
+        run_test_coroutine(test_coroutine)
+    finally:
+        server.stop()
+
+
+def test_stream_reconnect_backoff():
+    """Streams ended by the server are reopened with an exponential
+    backoff that is reset each time a message is received."""
+
+    message = u"event: property\ndata: {}\n\n".format(json.dumps({"name": "prop", "value": 1})).encode("utf-8")
+    requests = {"empty": 0, "message": 0}
+
+    class ClosingStreamHandler(tornado.web.RequestHandler):
+        def get(self, name):
+            requests[name] += 1
+
+            if name == "message":
+                self.write(message)
+
+    port = find_free_port()
+    server = tornado.web.Application([(r"/(empty|message)", ClosingStreamHandler)]).listen(port)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        values = []
+
+        # noinspection PyProtectedMember
+        subscriptions = [
+            Observable.create(HTTPClient()._build_stream_subscribe(
+                "http://localhost:{}/{}".format(port, name), lambda data: data)).subscribe(values.append)
+            for name in ["empty", "message"]
+        ]
+
+        yield tornado.gen.sleep(0.8)
+
+        for subscription in subscriptions:
+            subscription.dispose()
+
+        assert 1 < requests["empty"] <= 5
+        assert requests["message"] >= 8
+        assert len(values) >= requests["message"] - 1
+
+    try:
+        run_test_coroutine(test_coroutine)
+    finally:
+        server.stop()
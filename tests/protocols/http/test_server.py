@@ -16,8 +16,9 @@ from six.moves.urllib import parse
 from tornado.concurrent import Future
 
 from tests.utils import find_free_port, run_test_coroutine
-from wotpy.protocols.enums import InteractionVerbs
-from wotpy.protocols.http.enums import HTTPSchemes
+from wotpy.protocols.enums import InteractionVerbs, InvocationOverflowPolicies
+from wotpy.protocols.http.enums import HTTPSchemes, HTTPSubprotocols
+from wotpy.protocols.http.handlers.stream import parse_sse_message
 from wotpy.protocols.http.server import HTTPServer
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
 from wotpy.wot.exposed.thing import ExposedThing
@@ -118,6 +119,97 @@ def test_property_set_json(http_server):
     _test_property_set(http_server, body, prop_value, headers=JSON_HEADERS)
 
 
+def test_properties_get_set(http_server):
+    """Multiple Properties exposed in an HTTP server can be read
+    and updated with a single request to the Thing-level Form."""
+
+    exposed_thing = next(http_server.exposed_things)
+    prop_names = list(six.iterkeys(exposed_thing.thing.properties))
+    thing_forms = http_server.build_thing_forms("localhost", exposed_thing.thing)
+
+    href = next(
+        item.href for item in thing_forms
+        if InteractionVerbs.READ_MULTIPLE_PROPERTIES in item.op)
+
+    assert all(
+        verb in thing_forms[0].op for verb in [
+            InteractionVerbs.READ_ALL_PROPERTIES,
+            InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+            InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+        ])
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        values = {name: Faker().pyint() for name in prop_names}
+        body = json.dumps({"values": values})
+        http_request = tornado.httpclient.HTTPRequest(href, method="PUT", body=body, headers=JSON_HEADERS)
+        yield http_client.fetch(http_request)
+
+        for name in prop_names:
+            value = yield exposed_thing.properties[name].read()
+            assert value == values[name]
+
+        http_request = tornado.httpclient.HTTPRequest(href, method="GET")
+        response = yield http_client.fetch(http_request)
+
+        assert json.loads(response.body).get("values") == values
+
+        href_one = "{}?{}".format(href, parse.urlencode({"name": prop_names[0]}))
+        http_request = tornado.httpclient.HTTPRequest(href_one, method="GET")
+        response = yield http_client.fetch(http_request)
+
+        assert json.loads(response.body).get("values") == {prop_names[0]: values[prop_names[0]]}
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_properties_errors(http_server):
+    """Requests to the Thing-level Form for unknown Properties are rejected with 400
+    while errors raised by the Property handlers are reported as server errors."""
+
+    exposed_thing = next(http_server.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.thing.properties))
+    thing_forms = http_server.build_thing_forms("localhost", exposed_thing.thing)
+
+    href = next(
+        item.href for item in thing_forms
+        if InteractionVerbs.READ_MULTIPLE_PROPERTIES in item.op)
+
+    # noinspection PyUnusedLocal
+    @tornado.gen.coroutine
+    def read_handler(*args, **kwargs):
+        raise KeyError("handler error")
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        http_client = tornado.httpclient.AsyncHTTPClient()
+        unknown_name = uuid.uuid4().hex
+
+        href_unknown = "{}?{}".format(href, parse.urlencode({"name": unknown_name}))
+        http_request = tornado.httpclient.HTTPRequest(href_unknown, method="GET")
+        response = yield http_client.fetch(http_request, raise_error=False)
+
+        assert response.code == 400
+
+        body = json.dumps({"values": {unknown_name: Faker().pyint()}})
+        http_request = tornado.httpclient.HTTPRequest(href, method="PUT", body=body, headers=JSON_HEADERS)
+        response = yield http_client.fetch(http_request, raise_error=False)
+
+        assert response.code == 400
+
+        exposed_thing.set_property_read_handler(prop_name, read_handler)
+
+        href_one = "{}?{}".format(href, parse.urlencode({"name": prop_name}))
+        http_request = tornado.httpclient.HTTPRequest(href_one, method="GET")
+        response = yield http_client.fetch(http_request, raise_error=False)
+
+        assert response.code == 500
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_property_subscribe(http_server):
     """Properties exposed in an HTTP server can be subscribed to with an HTTP GET request."""
 
@@ -241,6 +333,141 @@ def test_action_run_error(http_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_action_run_inline(http_server):
+    """Action results are returned inline when the Action finishes within the time
+    the client is willing to wait and the invocation URL is returned otherwise."""
+
+    exposed_thing = next(http_server.exposed_things)
+    action_name = next(six.iterkeys(exposed_thing.thing.actions))
+    href = _get_action_href(exposed_thing, action_name, http_server)
+
+    @tornado.gen.coroutine
+    def action_handler(parameters):
+        yield tornado.gen.sleep(parameters.get("input"))
+        raise tornado.gen.Return(parameters.get("input"))
+
+    exposed_thing.set_action_handler(action_name, action_handler)
+
+    http_client = tornado.httpclient.AsyncHTTPClient()
+
+    @tornado.gen.coroutine
+    def invoke(url, input_value, headers=None):
+        headers = dict(headers or {})
+        headers.update(JSON_HEADERS)
+        body = json.dumps({"input": input_value})
+        http_request = tornado.httpclient.HTTPRequest(url, method="POST", body=body, headers=headers)
+        response = yield http_client.fetch(http_request)
+        raise tornado.gen.Return(json.loads(response.body))
+
+    @tornado.gen.coroutine
+    def fetch_invocation(invocation_url, headers=None):
+        href_invoc = "http://localhost:{}/{}".format(http_server.port, invocation_url.lstrip("/"))
+        http_request = tornado.httpclient.HTTPRequest(href_invoc, method="GET", headers=headers)
+        response = yield http_client.fetch(http_request)
+        raise tornado.gen.Return(json.loads(response.body))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        num_pending = len(http_server.pending_actions)
+
+        invocation = yield invoke(href, 0, headers={"Prefer": "wait=5"})
+
+        assert invocation == {"done": True, "result": 0}
+        assert len(http_server.pending_actions) == num_pending
+
+        invocation = yield invoke("{}?wait=0.01".format(href), 0.2)
+        invocation_url = invocation.get("invocation")
+
+        assert invocation_url is not None
+        assert len(http_server.pending_actions) == num_pending + 1
+
+        invocation = yield fetch_invocation(invocation_url, headers={"Prefer": "wait=0.01"})
+
+        assert invocation == {"done": False}
+
+        invocation = yield fetch_invocation(invocation_url)
+
+        assert invocation == {"done": True, "result": 0.2}
+
+        num_pending = len(http_server.pending_actions)
+
+        invocation = yield invoke(href, 0.05, headers={"Prefer": "wait=nan"})
+        invocation_url = invocation.get("invocation")
+
+        assert invocation_url is not None
+        assert len(http_server.pending_actions) == num_pending + 1
+
+        invocation = yield fetch_invocation(invocation_url)
+
+        assert invocation == {"done": True, "result": 0.05}
+
+        invocation = yield invoke("{}?wait=inf".format(href), 0)
+
+        assert invocation == {"done": True, "result": 0}
+
+    run_test_coroutine(test_coroutine)
+
+
+@pytest.mark.parametrize("http_server", [{
+    "action_ttl_secs": 0.05,
+    "action_max_pending": 2,
+    "action_overflow_policy": InvocationOverflowPolicies.REJECT
+}], indirect=True)
+def test_action_pending_limits(http_server):
+    """Invocations that are never checked expire after the TTL and the
+    server responds with 503 when there are too many pending invocations."""
+
+    exposed_thing = next(http_server.exposed_things)
+    action_name = next(six.iterkeys(exposed_thing.thing.actions))
+    href = _get_action_href(exposed_thing, action_name, http_server)
+
+    futures = {}
+
+    @tornado.gen.coroutine
+    def action_handler(parameters):
+        yield futures[parameters.get("input")]
+
+    exposed_thing.set_action_handler(action_name, action_handler)
+
+    http_client = tornado.httpclient.AsyncHTTPClient()
+
+    @tornado.gen.coroutine
+    def invoke(input_value):
+        futures[input_value] = Future()
+        body = json.dumps({"input": input_value})
+        http_request = tornado.httpclient.HTTPRequest(href, method="POST", body=body, headers=JSON_HEADERS)
+        response = yield http_client.fetch(http_request, raise_error=False)
+        raise tornado.gen.Return(response)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        responses = yield [invoke(idx) for idx in range(2)]
+
+        assert all(response.code == 200 for response in responses)
+        assert http_server.stats["invocations"]["pending"] == 2
+
+        response = yield invoke(2)
+
+        assert response.code == 503
+        assert http_server.stats["invocations"]["rejected"] == 1
+
+        futures[0].set_result(True)
+
+        yield tornado.gen.sleep(0.2)
+
+        assert http_server.stats["invocations"]["size"] == 1
+        assert http_server.stats["invocations"]["expired"] == 1
+
+        response = yield invoke(3)
+
+        assert response.code == 200
+        assert len(http_server.pending_actions) == 2
+
+        [fut.set_result(True) for fut in futures.values() if not fut.done()]
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_event_subscribe(http_server):
     """Events exposed in an HTTP server can be subscribed to with an HTTP GET request."""
 
@@ -271,6 +498,87 @@ def test_event_subscribe(http_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_thing_stream(http_server):
+    """Property updates and Event emissions can be observed as a stream of Server-Sent
+    Events on a single request that is advertised in the Thing-level Forms."""
+
+    exposed_thing = next(http_server.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.thing.properties))
+    event_name = next(six.iterkeys(exposed_thing.thing.events))
+
+    prop_forms = http_server.build_forms("localhost", exposed_thing.thing.properties[prop_name])
+    form_stream = next(item for item in prop_forms if item.subprotocol == HTTPSubprotocols.SSE)
+
+    assert InteractionVerbs.OBSERVE_PROPERTY in form_stream.op
+
+    thing_forms = http_server.build_thing_forms("localhost", exposed_thing.thing)
+    form_thing_stream = next(item for item in thing_forms if item.subprotocol == HTTPSubprotocols.SSE)
+
+    assert InteractionVerbs.OBSERVE_PROPERTY in form_thing_stream.op
+    assert InteractionVerbs.SUBSCRIBE_EVENT in form_thing_stream.op
+
+    href_thing_stream = form_thing_stream.href
+
+    values = [Faker().pyint() for _ in range(5)]
+    payloads = [Faker().pystr() for _ in range(5)]
+
+    @tornado.gen.coroutine
+    def emit_next():
+        if values:
+            yield exposed_thing.properties[prop_name].write(values.pop(0))
+            yield exposed_thing.emit_event(event_name, payloads.pop(0))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        messages = {"property": [], "event": []}
+        future_done = Future()
+        futures_connected = [Future(), Future()]
+
+        def streaming_callback(chunk):
+            for raw_message in chunk.decode().split("\n\n"):
+                message = parse_sse_message(raw_message)
+
+                if message is not None:
+                    messages[message[0]].append(message[1])
+
+            if len(messages["event"]) == 5 and len(messages["property"]) == 10 and not future_done.done():
+                future_done.set_result(True)
+
+        def build_header_callback(future_connected):
+            def header_callback(line):
+                not line.strip() and not future_connected.done() and future_connected.set_result(True)
+
+            return header_callback
+
+        streams = [
+            tornado.httpclient.HTTPRequest(
+                href, method="GET",
+                streaming_callback=streaming_callback,
+                header_callback=build_header_callback(future_connected))
+            for href, future_connected in zip([form_stream.href, href_thing_stream], futures_connected)
+        ]
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+        [http_client.fetch(http_request, raise_error=False) for http_request in streams]
+
+        yield futures_connected
+
+        expected_values = list(values)
+        expected_payloads = list(payloads)
+
+        periodic_emit = tornado.ioloop.PeriodicCallback(emit_next, 20)
+        periodic_emit.start()
+
+        yield future_done
+
+        periodic_emit.stop()
+
+        assert [item["payload"] for item in messages["event"]] == expected_payloads
+        assert sorted(item["value"] for item in messages["property"]) == sorted(expected_values * 2)
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_ssl_context(self_signed_ssl_context):
     """An SSL context can be passed to the HTTP server to enable encryption."""
 
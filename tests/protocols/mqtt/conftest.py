@@ -21,7 +21,7 @@ collect_ignore = []
 
 if not is_mqtt_supported():
     logging.warning("Skipping MQTT tests due to unsupported platform")
-    collect_ignore += ["test_server.py", "test_client.py"]
+    collect_ignore += ["test_server.py", "test_client.py", "test_client_mock.py", "test_runner.py"]
 
 
 @pytest.fixture(params=[{"property_callback_ms": None}])
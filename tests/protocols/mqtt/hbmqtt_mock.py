@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import asyncio
+import datetime
+import json
+
+import tornado.gen
+import tornado.ioloop
+import tornado.queues
+from mock import MagicMock
+
+from wotpy.protocols.mqtt.enums import MQTTCodesACK
+from wotpy.protocols.mqtt.runner import topic_matches
+
+
+class MockMessage(object):
+    """Message delivered by the mocked hbmqtt clients."""
+
+    def __init__(self, topic, data, qos=None, retain=False):
+        self.topic = topic
+        self.data = data
+        self.qos = qos
+        self.retain = retain
+
+
+class MockBroker(object):
+    """Routes the messages published by mocks of the hbmqtt client class
+    to the mocked clients subscribed to a matching topic filter.
+
+    The on_connect, on_publish and on_subscribe hooks are coroutine functions that
+    are called before each connection, publication or subscription is acknowledged
+    and may be used to delay or fail the handshakes. The on_message hook is called with
+    the topic and decoded data of each publication (e.g. to answer requests)."""
+
+    def __init__(self):
+        self.clients = []
+        self.retained = {}
+        self.published = []
+        self.on_connect = None
+        self.on_publish = None
+        self.on_subscribe = None
+        self.on_message = None
+
+    def build_client_cls(self):
+        """Returns a mock of the hbmqtt client class that builds clients connected to this broker."""
+
+        mock_cls = MagicMock()
+        mock_cls.side_effect = self._build_client
+
+        return mock_cls
+
+    def published_on(self, topic):
+        """Returns the decoded data of the messages published in the given topic."""
+
+        return [json.loads(data.decode()) for item_topic, data, _, _ in self.published if item_topic == topic]
+
+    def publish(self, topic, data, qos=None, retain=False):
+        """Delivers a message to the clients subscribed to the topic (e.g. to simulate a server)."""
+
+        data = data if isinstance(data, bytes) else json.dumps(data).encode()
+
+        if retain:
+            self.retained[topic] = data
+
+        for client in self.clients:
+            if any(topic_matches(topic_filter, topic) for topic_filter in client.subs):
+                client.messages.put_nowait(MockMessage(topic, data, qos=qos))
+
+    # noinspection PyUnusedLocal
+    def _build_client(self, *args, **kwargs):
+        """Builds a new mocked hbmqtt client."""
+
+        client = MagicMock()
+        client.subs = set()
+        client.messages = tornado.queues.Queue()
+
+        # noinspection PyUnusedLocal
+        @tornado.gen.coroutine
+        def connect(uri, *con_args, **con_kwargs):
+            if self.on_connect is not None:
+                yield self.on_connect(uri)
+
+            yield tornado.gen.moment
+            raise tornado.gen.Return(MQTTCodesACK.CON_OK)
+
+        @tornado.gen.coroutine
+        def disconnect():
+            client.subs.clear()
+            yield tornado.gen.moment
+
+        @tornado.gen.coroutine
+        def subscribe(topics):
+            if self.on_subscribe is not None:
+                yield self.on_subscribe(topics)
+
+            for topic_filter, _ in topics:
+                client.subs.add(topic_filter)
+
+                for topic, data in list(self.retained.items()):
+                    if topic_matches(topic_filter, topic):
+                        client.messages.put_nowait(MockMessage(topic, data, retain=True))
+
+            yield tornado.gen.moment
+            raise tornado.gen.Return([qos for _, qos in topics])
+
+        @tornado.gen.coroutine
+        def unsubscribe(topics):
+            [client.subs.discard(topic) for topic in topics]
+            yield tornado.gen.moment
+
+        @tornado.gen.coroutine
+        def publish(topic, message, qos=None, retain=False):
+            if self.on_publish is not None:
+                yield self.on_publish(topic, message, qos, retain)
+
+            self.published.append((topic, message, qos, retain))
+            self.publish(topic, message, qos=qos, retain=retain)
+
+            if self.on_message is not None:
+                self.on_message(topic, json.loads(message.decode()))
+
+            yield tornado.gen.moment
+
+        @tornado.gen.coroutine
+        def deliver_message(timeout=None):
+            try:
+                timeout = datetime.timedelta(seconds=timeout) if timeout is not None else None
+                message = yield client.messages.get(timeout=timeout)
+            except tornado.gen.TimeoutError:
+                raise asyncio.TimeoutError
+
+            raise tornado.gen.Return(message)
+
+        client.connect.side_effect = connect
+        client.disconnect.side_effect = disconnect
+        client.subscribe.side_effect = subscribe
+        client.unsubscribe.side_effect = unsubscribe
+        client.publish.side_effect = publish
+        client.deliver_message.side_effect = deliver_message
+
+        self.clients.append(client)
+
+        return client
+
+
+@tornado.gen.coroutine
+def wait_until(condition, timeout=2.0, interval=0.01):
+    """Waits until the given condition function returns True.
+    Raises a timeout error if the condition is not met in time."""
+
+    deadline = tornado.ioloop.IOLoop.current().time() + timeout
+
+    while not condition():
+        if tornado.ioloop.IOLoop.current().time() > deadline:
+            raise tornado.gen.TimeoutError("Condition not met")
+
+        yield tornado.gen.sleep(interval)
@@ -8,6 +8,7 @@ import pytest
 import six
 import tornado.gen
 from faker import Faker
+from hbmqtt.mqtt.constants import QOS_0, QOS_1, QOS_2
 from mock import MagicMock, patch
 
 from tests.protocols.helpers import \
@@ -15,12 +16,14 @@ from tests.protocols.helpers import \
     client_test_on_event, \
     client_test_read_property, \
     client_test_write_property, \
+    client_test_read_write_properties, \
     client_test_invoke_action, \
     client_test_invoke_action_error
 from tests.protocols.mqtt.broker import is_test_broker_online, BROKER_SKIP_REASON
 from tests.utils import run_test_coroutine, DEFAULT_TIMEOUT_SECS
 from wotpy.protocols.exceptions import ClientRequestTimeout
 from wotpy.protocols.mqtt.client import MQTTClient
+from wotpy.protocols.mqtt.enums import MQTTVocabularyKeys
 from wotpy.wot.td import ThingDescription
 
 pytestmark = pytest.mark.skipif(is_test_broker_online() is False, reason=BROKER_SKIP_REASON)
@@ -38,6 +41,12 @@ def test_write_property(mqtt_servient):
     client_test_write_property(mqtt_servient, MQTTClient)
 
 
+def test_read_write_properties(mqtt_servient):
+    """The MQTT client can read and write multiple properties in one request."""
+
+    client_test_read_write_properties(mqtt_servient, MQTTClient)
+
+
 def test_invoke_action(mqtt_servient):
     """Actions may be invoked using the MQTT binding client."""
 
@@ -180,6 +189,64 @@ def test_timeout_write_property(mqtt_servient):
     run_test_coroutine(test_coroutine)
 
 
+def test_form_qos_hints(mqtt_servient):
+    """The QoS level advertised in the Forms is used to publish messages, while
+    the result topic is subscribed with the default or the given QoS level."""
+
+    exposed_thing = next(mqtt_servient.exposed_things)
+    action_name = next(six.iterkeys(exposed_thing.actions))
+    prop_name = next(six.iterkeys(exposed_thing.properties))
+    td_dict = ThingDescription.from_thing(exposed_thing.thing).to_dict()
+    mqtt_mock = _build_hbmqtt_mock(_effect_raise_timeout)
+
+    qos = random.choice([QOS_0, QOS_2])
+
+    forms = td_dict["actions"][action_name]["forms"] + td_dict["properties"][prop_name]["forms"]
+
+    for form in forms:
+        form[MQTTVocabularyKeys.OPTIONS] = [{
+            MQTTVocabularyKeys.OPTION_NAME: MQTTVocabularyKeys.OPTION_NAME_QOS,
+            MQTTVocabularyKeys.OPTION_VALUE: qos
+        }]
+
+    td = ThingDescription(td_dict)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mqtt_mock):
+            mqtt_client = MQTTClient()
+
+            with pytest.raises(ClientRequestTimeout):
+                yield mqtt_client.invoke_action(td, action_name, Faker().pystr(), timeout=random.random())
+
+            _, kwargs = mqtt_mock.return_value.publish.call_args
+            assert kwargs["qos"] == qos
+
+            args, _ = mqtt_mock.return_value.subscribe.call_args
+            assert [qos_sub for _, qos_sub in args[0]] == [QOS_1]
+
+            mqtt_mock.return_value.subscribe.reset_mock()
+
+            with pytest.raises(ClientRequestTimeout):
+                yield mqtt_client.invoke_action(
+                    td, action_name, Faker().pystr(),
+                    timeout=random.random(), qos_subscribe=QOS_2)
+
+            args, _ = mqtt_mock.return_value.subscribe.call_args
+            assert [qos_sub for _, qos_sub in args[0]] == [QOS_2]
+
+            with pytest.raises(ClientRequestTimeout):
+                yield mqtt_client.write_property(td, prop_name, Faker().pystr(), timeout=random.random())
+
+            _, kwargs = mqtt_mock.return_value.publish.call_args
+            assert kwargs["qos"] == qos
+
+            args, _ = mqtt_mock.return_value.subscribe.call_args
+            assert [qos_sub for _, qos_sub in args[0]] == [QOS_1]
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_stop_timeout(mqtt_servient):
     """Attempting to stop an unresponsive connection does not result in an indefinite wait."""
 
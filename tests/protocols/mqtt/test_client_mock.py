@@ -0,0 +1,504 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the MQTT binding client that run against a mocked hbmqtt client.
+"""
+
+import time
+import uuid
+
+import pytest
+import tornado.gen
+from hbmqtt.mqtt.constants import QOS_1
+from mock import patch
+
+from tests.protocols.mqtt.hbmqtt_mock import MockBroker, wait_until
+from tests.utils import run_test_coroutine
+from wotpy.protocols.enums import InteractionVerbs
+from wotpy.protocols.exceptions import ClientRequestTimeout
+from wotpy.protocols.mqtt.client import MQTTClient
+from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
+from wotpy.protocols.mqtt.server import MQTTServer
+from wotpy.wot.dictionaries.interaction import ActionFragmentDict, EventFragmentDict, PropertyFragmentDict
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.servient import Servient
+from wotpy.wot.td import ThingDescription
+from wotpy.wot.thing import Thing
+
+BROKER_URL = "mqtt://localhost:1883"
+DELIVER_TIMEOUT_SECS = 0.05
+
+
+def build_thing_description(broker_url=BROKER_URL):
+    """Builds a TD with MQTT Forms for one Property, Action and Event
+    without connecting to the broker. Returns the TD and the interaction names."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+    exposed_thing = ExposedThing(servient=Servient(), thing=thing)
+
+    names = {
+        "property": uuid.uuid4().hex,
+        "action": uuid.uuid4().hex,
+        "event": uuid.uuid4().hex
+    }
+
+    exposed_thing.add_property(names["property"], PropertyFragmentDict({
+        "type": "number",
+        "observable": True
+    }), value=0)
+
+    exposed_thing.add_action(names["action"], ActionFragmentDict({
+        "input": {"type": "number"},
+        "output": {"type": "number"}
+    }))
+
+    exposed_thing.add_event(names["event"], EventFragmentDict({
+        "type": "number"
+    }))
+
+    server = MQTTServer(broker_url=broker_url)
+
+    for interaction in thing.interactions:
+        for form in server.build_forms(hostname=None, interaction=interaction):
+            interaction.add_form(form)
+
+    return ThingDescription.from_thing(thing), names
+
+
+def topic_for_form(form):
+    """Returns the MQTT topic of the given Form."""
+
+    # noinspection PyProtectedMember
+    return MQTTClient._parse_href(form.href)["topic"]
+
+
+def test_concurrent_invocations_correlated():
+    """Concurrent Action invocations that share one broker connection
+    are resolved with the result that matches their own request."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    td, names = build_thing_description()
+
+    topic_invoke = topic_for_form(td.get_action_forms(names["action"])[0])
+    topic_result = ActionMQTTHandler.to_result_topic(topic_invoke)
+
+    num_invocations = 10
+    requests = []
+
+    def on_message(topic, data):
+        if topic != topic_invoke:
+            return
+
+        requests.append(data)
+
+        if len(requests) < num_invocations:
+            return
+
+        broker.publish(topic_result, {"id": uuid.uuid4().hex, "result": None})
+
+        for item in reversed(requests):
+            broker.publish(topic_result, {"id": item["id"], "result": item["input"] * 2})
+
+    broker.on_message = on_message
+
+    with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mock_cls):
+        mqtt_client = MQTTClient(deliver_timeout_secs=DELIVER_TIMEOUT_SECS)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            inputs = list(range(num_invocations))
+
+            results = yield [
+                mqtt_client.invoke_action(td, names["action"], item, timeout=2)
+                for item in inputs
+            ]
+
+            assert results == [item * 2 for item in inputs]
+            assert mock_cls.call_count == 1
+            assert len(broker.published_on(topic_invoke)) == num_invocations
+            assert len(set(item["id"] for item in requests)) == num_invocations
+
+            # noinspection PyProtectedMember
+            assert not mqtt_client._clients and not mqtt_client._pending
+
+        run_test_coroutine(test_coroutine)
+
+
+def test_shared_observation_release():
+    """Observations of the same topic share one subscription and the
+    connection is released once the last Observer is disposed."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    td, names = build_thing_description()
+
+    forms = td.get_property_forms(names["property"])
+    topic_observe = next(topic_for_form(form) for form in forms if InteractionVerbs.OBSERVE_PROPERTY in form.op)
+
+    with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mock_cls):
+        mqtt_client = MQTTClient(deliver_timeout_secs=DELIVER_TIMEOUT_SECS)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            values_a = []
+            values_b = []
+
+            observable = mqtt_client.on_property_change(td, names["property"])
+            subscription_a = observable.subscribe(lambda item: values_a.append(item.data.value))
+            subscription_b = observable.subscribe(lambda item: values_b.append(item.data.value))
+
+            yield wait_until(lambda: len(broker.clients) and topic_observe in broker.clients[0].subs)
+
+            client = broker.clients[0]
+
+            broker.publish(topic_observe, {"value": 1})
+
+            yield wait_until(lambda: values_a == [1] and values_b == [1])
+
+            subscription_a.dispose()
+
+            yield tornado.gen.sleep(DELIVER_TIMEOUT_SECS)
+
+            assert not client.unsubscribe.called
+            assert not client.disconnect.called
+
+            broker.publish(topic_observe, {"value": 2})
+
+            yield wait_until(lambda: values_b == [1, 2])
+
+            subscription_b.dispose()
+
+            yield wait_until(lambda: client.disconnect.called)
+
+            client.unsubscribe.assert_called_once_with([topic_observe])
+
+            assert values_a == [1]
+            assert mock_cls.call_count == 1
+            assert client.subscribe.call_count == 1
+
+            # noinspection PyProtectedMember
+            assert not mqtt_client._clients and not mqtt_client._observers
+
+        run_test_coroutine(test_coroutine)
+
+
+def build_property_responder(broker, topic_read, topic_observe):
+    """Answers the Property read requests in the mocked broker with an increasing
+    counter in the updates topic. Returns the list of received read requests."""
+
+    requests = []
+
+    def on_message(topic, data):
+        if topic != topic_read or data.get("action") != "read":
+            return
+
+        requests.append(data)
+        broker.publish(topic_observe, {"value": len(requests)})
+
+    broker.on_message = on_message
+
+    return requests
+
+
+def property_topics(td, name):
+    """Returns the broker URL and the read and observe topics of a Property."""
+
+    forms = td.get_property_forms(name)
+    form_read = next(form for form in forms if InteractionVerbs.READ_PROPERTY in form.op)
+    form_observe = next(form for form in forms if InteractionVerbs.OBSERVE_PROPERTY in form.op)
+
+    # noinspection PyProtectedMember
+    broker_url = MQTTClient._parse_href(form_observe.href)["broker_url"]
+
+    return broker_url, topic_for_form(form_read), topic_for_form(form_observe)
+
+
+def test_property_cache_hit():
+    """Property reads within the max age of the cache do not send a read request."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    td, names = build_thing_description()
+    _, topic_read, topic_observe = property_topics(td, names["property"])
+    requests = build_property_responder(broker, topic_read, topic_observe)
+
+    with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mock_cls):
+        mqtt_client = MQTTClient(
+            deliver_timeout_secs=DELIVER_TIMEOUT_SECS,
+            property_cache_max_age_secs=60)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 1
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 1
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 1
+            assert len(requests) == 1
+
+            yield mqtt_client.clear_property_cache()
+
+        run_test_coroutine(test_coroutine)
+
+
+def test_property_cache_stale():
+    """Property reads fall back to a read request when the cached value is too old."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    td, names = build_thing_description()
+    _, topic_read, topic_observe = property_topics(td, names["property"])
+    requests = build_property_responder(broker, topic_read, topic_observe)
+    max_age = 0.1
+
+    with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mock_cls):
+        mqtt_client = MQTTClient(
+            deliver_timeout_secs=DELIVER_TIMEOUT_SECS,
+            property_cache_max_age_secs=max_age)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 1
+
+            yield tornado.gen.sleep(max_age * 2)
+
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 2
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 2
+            assert len(requests) == 2
+
+            yield mqtt_client.clear_property_cache()
+
+        run_test_coroutine(test_coroutine)
+
+
+def test_property_cache_retained():
+    """The cache is filled by the retained and pushed updates of the Property."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    td, names = build_thing_description()
+    broker_url, topic_read, topic_observe = property_topics(td, names["property"])
+    requests = build_property_responder(broker, topic_read, topic_observe)
+
+    broker.publish(topic_observe, {"value": 10}, retain=True)
+
+    with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mock_cls):
+        mqtt_client = MQTTClient(
+            deliver_timeout_secs=DELIVER_TIMEOUT_SECS,
+            property_cache_max_age_secs=60)
+
+        # noinspection PyProtectedMember
+        def cached_value():
+            cached = mqtt_client._get_cached_property(broker_url, topic_observe)
+            return cached.get("value") if cached is not None else None
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            # noinspection PyProtectedMember
+            yield mqtt_client._cache_property(broker_url, topic_observe, QOS_1)
+
+            yield wait_until(lambda: cached_value() == 10)
+
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 10
+
+            broker.publish(topic_observe, {"value": 20}, retain=True)
+
+            yield wait_until(lambda: cached_value() == 20)
+
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 20
+            assert not len(requests)
+
+            yield mqtt_client.clear_property_cache()
+
+        run_test_coroutine(test_coroutine)
+
+
+def test_property_cache_clear():
+    """Clearing the cache unsubscribes from the updates and releases the connection."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    td, names = build_thing_description()
+    _, topic_read, topic_observe = property_topics(td, names["property"])
+    requests = build_property_responder(broker, topic_read, topic_observe)
+
+    with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mock_cls):
+        mqtt_client = MQTTClient(
+            deliver_timeout_secs=DELIVER_TIMEOUT_SECS,
+            property_cache_max_age_secs=60)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 1
+
+            client = broker.clients[0]
+
+            assert not client.disconnect.called
+            assert topic_observe in client.subs
+
+            yield mqtt_client.clear_property_cache()
+
+            client.unsubscribe.assert_called_once_with([topic_observe])
+
+            assert client.disconnect.called
+
+            # noinspection PyProtectedMember
+            assert not mqtt_client._clients and not mqtt_client._property_cache
+
+            assert (yield mqtt_client.read_property(td, names["property"], timeout=2)) == 2
+            assert len(requests) == 2
+            assert mock_cls.call_count == 2
+
+            yield mqtt_client.clear_property_cache()
+
+        run_test_coroutine(test_coroutine)
+
+
+def build_action_responder(broker, topic_invoke):
+    """Answers the Action invocations in the mocked broker with the doubled input."""
+
+    topic_result = ActionMQTTHandler.to_result_topic(topic_invoke)
+
+    def on_message(topic, data):
+        if topic == topic_invoke:
+            broker.publish(topic_result, {"id": data["id"], "result": data["input"] * 2})
+
+    broker.on_message = on_message
+
+
+def test_subscribe_error_shared():
+    """Callers waiting for a subscription started by another caller
+    fail with the same error if the subscription is rejected."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    td, names = build_thing_description()
+    topic_invoke = topic_for_form(td.get_action_forms(names["action"])[0])
+
+    build_action_responder(broker, topic_invoke)
+
+    class SubscribeError(Exception):
+        pass
+
+    # noinspection PyUnusedLocal
+    @tornado.gen.coroutine
+    def on_subscribe(topics):
+        yield tornado.gen.sleep(0.1)
+        raise SubscribeError()
+
+    broker.on_subscribe = on_subscribe
+
+    with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mock_cls):
+        mqtt_client = MQTTClient(deliver_timeout_secs=DELIVER_TIMEOUT_SECS)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            timeout = 5
+            ini = time.time()
+
+            futures = [
+                mqtt_client.invoke_action(td, names["action"], item, timeout=timeout)
+                for item in range(2)
+            ]
+
+            for future in futures:
+                with pytest.raises(SubscribeError):
+                    yield future
+
+            assert (time.time() - ini) < (timeout / 2.0)
+            assert broker.clients[0].subscribe.call_count == 1
+            assert not len(broker.published_on(topic_invoke))
+
+            # noinspection PyProtectedMember
+            assert not mqtt_client._clients and not mqtt_client._subscriptions
+
+            broker.on_subscribe = None
+
+            assert (yield mqtt_client.invoke_action(td, names["action"], 3, timeout=timeout)) == 6
+
+        run_test_coroutine(test_coroutine)
+
+
+def test_broker_lock_single_client():
+    """Concurrent requests to the same broker wait for a single connection."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    td, names = build_thing_description()
+    topic_invoke = topic_for_form(td.get_action_forms(names["action"])[0])
+
+    build_action_responder(broker, topic_invoke)
+
+    # noinspection PyUnusedLocal
+    @tornado.gen.coroutine
+    def on_connect(uri):
+        yield tornado.gen.sleep(0.1)
+
+    broker.on_connect = on_connect
+
+    with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mock_cls):
+        mqtt_client = MQTTClient(deliver_timeout_secs=DELIVER_TIMEOUT_SECS)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            inputs = list(range(5))
+
+            results = yield [
+                mqtt_client.invoke_action(td, names["action"], item, timeout=2)
+                for item in inputs
+            ]
+
+            assert results == [item * 2 for item in inputs]
+            assert mock_cls.call_count == 1
+            assert broker.clients[0].connect.call_count == 1
+            assert broker.clients[0].disconnect.call_count == 1
+
+        run_test_coroutine(test_coroutine)
+
+
+def test_broker_lock_independent_brokers():
+    """A slow connection to one broker does not block the requests to other brokers."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+
+    broker_url_slow = "mqtt://slow.localhost:1883"
+    td_slow, names_slow = build_thing_description(broker_url=broker_url_slow)
+    td_fast, names_fast = build_thing_description()
+    topic_invoke_fast = topic_for_form(td_fast.get_action_forms(names_fast["action"])[0])
+
+    build_action_responder(broker, topic_invoke_fast)
+
+    connect_delay = 1.0
+
+    @tornado.gen.coroutine
+    def on_connect(uri):
+        if uri.startswith(broker_url_slow):
+            yield tornado.gen.sleep(connect_delay)
+
+    broker.on_connect = on_connect
+
+    with patch('wotpy.protocols.mqtt.client.hbmqtt.client.MQTTClient', new=mock_cls):
+        mqtt_client = MQTTClient(deliver_timeout_secs=DELIVER_TIMEOUT_SECS)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            future_slow = mqtt_client.invoke_action(td_slow, names_slow["action"], 1, timeout=0.1)
+
+            ini = time.time()
+
+            inputs = list(range(5))
+
+            results = yield [
+                mqtt_client.invoke_action(td_fast, names_fast["action"], item, timeout=2)
+                for item in inputs
+            ]
+
+            assert results == [item * 2 for item in inputs]
+            assert (time.time() - ini) < (connect_delay / 2.0)
+            assert not future_slow.done()
+
+            with pytest.raises(ClientRequestTimeout):
+                yield future_slow
+
+        run_test_coroutine(test_coroutine)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the MQTT handler runner that run against a mocked hbmqtt client.
+"""
+
+import asyncio
+import json
+import time
+
+import tornado.gen
+import tornado.locks
+from hbmqtt.mqtt.constants import QOS_1
+from mock import patch
+
+from tests.protocols.mqtt.hbmqtt_mock import MockBroker, wait_until
+from tests.utils import run_test_coroutine
+from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
+from wotpy.protocols.mqtt.runner import MQTTHandlerRunner
+
+BROKER_URL = "mqtt://localhost:1883"
+
+
+class EchoMQTTHandler(BaseMQTTHandler):
+    """MQTT handler that publishes the data of each request in the related response topic."""
+
+    def __init__(self):
+        super(EchoMQTTHandler, self).__init__(mqtt_server=None)
+        self.handled = []
+
+    @property
+    def topics(self):
+        return [("echo/requests/#", QOS_1)]
+
+    @classmethod
+    def build_message(cls, idx):
+        """Returns a publish queue message for the response topic of the given index."""
+
+        return {
+            "topic": "echo/responses/{}".format(idx),
+            "data": json.dumps({"idx": idx}).encode(),
+            "qos": QOS_1,
+            "retain": False
+        }
+
+    @tornado.gen.coroutine
+    def handle_message(self, msg):
+        idx = msg.topic.split("/")[-1]
+        self.handled.append((idx, time.time()))
+        yield self.queue.put(self.build_message(idx))
+
+
+def test_stop_cancels_tasks():
+    """Stopping the runner promptly cancels the loops and the
+    pending publications without leaving any tasks behind."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    handler = EchoMQTTHandler()
+
+    # noinspection PyUnusedLocal
+    @tornado.gen.coroutine
+    def on_publish(topic, message, qos, retain):
+        yield tornado.gen.sleep(60)
+
+    broker.on_publish = on_publish
+
+    with patch('wotpy.protocols.mqtt.runner.MQTTClient', new=mock_cls):
+        runner = MQTTHandlerRunner(broker_url=BROKER_URL, mqtt_handlers=[handler])
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            tasks_before = asyncio.all_tasks()
+
+            yield runner.start()
+
+            broker.publish("echo/requests/1", {})
+
+            yield wait_until(lambda: runner.stats["publish"]["in_flight"] == 1)
+
+            ini = time.time()
+
+            yield runner.stop()
+
+            assert (time.time() - ini) < 0.5
+            assert asyncio.all_tasks() == tasks_before
+            assert runner.stats["publish"]["in_flight"] == 0
+            assert broker.clients[0].disconnect.called
+
+        run_test_coroutine(test_coroutine)
+
+
+def test_deliver_after_start():
+    """Messages delivered right after the runner starts are handled without delay."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    handler = EchoMQTTHandler()
+
+    with patch('wotpy.protocols.mqtt.runner.MQTTClient', new=mock_cls):
+        runner = MQTTHandlerRunner(broker_url=BROKER_URL, mqtt_handlers=[handler])
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            yield runner.start()
+
+            ini = time.time()
+
+            broker.publish("echo/requests/1", {})
+
+            yield wait_until(lambda: len(handler.handled), interval=0.001)
+
+            assert (handler.handled[0][1] - ini) < 0.1
+
+            yield wait_until(lambda: len(broker.published_on("echo/responses/1")), interval=0.001)
+
+            assert (time.time() - ini) < 0.1
+
+            yield runner.stop()
+
+        run_test_coroutine(test_coroutine)
+
+
+def test_publish_window():
+    """Up to publish_window messages wait for the broker handshake
+    at the same time while the rest stay in the publish queue."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    handler = EchoMQTTHandler()
+    gate = tornado.locks.Event()
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    # noinspection PyUnusedLocal
+    @tornado.gen.coroutine
+    def on_publish(topic, message, qos, retain):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        yield gate.wait()
+        state["in_flight"] -= 1
+
+    broker.on_publish = on_publish
+
+    window = 4
+    num_msgs = 20
+
+    with patch('wotpy.protocols.mqtt.runner.MQTTClient', new=mock_cls):
+        runner = MQTTHandlerRunner(broker_url=BROKER_URL, mqtt_handlers=[handler], publish_window=window)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            yield runner.start()
+
+            for idx in range(num_msgs):
+                yield handler.queue.put(EchoMQTTHandler.build_message(idx))
+
+            yield wait_until(lambda: runner.stats["publish"]["in_flight"] == window)
+            yield tornado.gen.sleep(0.05)
+
+            assert runner.stats["publish"] == {
+                "queue_depth": num_msgs - window - 1,
+                "in_flight": window,
+                "published": 0,
+                "retries": 0
+            }
+
+            gate.set()
+
+            yield wait_until(lambda: runner.stats["publish"]["published"] == num_msgs)
+
+            assert state["max_in_flight"] == window
+            assert len(broker.published) == num_msgs
+            assert runner.stats["publish"] == {
+                "queue_depth": 0,
+                "in_flight": 0,
+                "published": num_msgs,
+                "retries": 0
+            }
+
+            yield runner.stop()
+
+        run_test_coroutine(test_coroutine)
+
+
+def test_publish_retries_ordered():
+    """Failed publications are retried in order before their slot in the window is
+    released, so later messages are not started until the retries succeed."""
+
+    broker = MockBroker()
+    mock_cls = broker.build_client_cls()
+    handler = EchoMQTTHandler()
+    failing = {1, 2}
+    attempts = []
+
+    class PublishError(Exception):
+        pass
+
+    # noinspection PyUnusedLocal
+    @tornado.gen.coroutine
+    def on_publish(topic, message, qos, retain):
+        idx = json.loads(message.decode())["idx"]
+        attempts.append(idx)
+        yield tornado.gen.sleep(0.01)
+
+        if idx in failing and attempts.count(idx) == 1:
+            raise PublishError()
+
+    broker.on_publish = on_publish
+
+    window = 4
+    num_msgs = 10
+
+    with patch('wotpy.protocols.mqtt.runner.MQTTClient', new=mock_cls):
+        runner = MQTTHandlerRunner(
+            broker_url=BROKER_URL,
+            mqtt_handlers=[handler],
+            publish_window=window,
+            sleep_error_reconnect=0.02)
+
+        @tornado.gen.coroutine
+        def test_coroutine():
+            yield runner.start()
+
+            for idx in range(num_msgs):
+                yield handler.queue.put(EchoMQTTHandler.build_message(idx))
+
+            yield wait_until(lambda: runner.stats["publish"]["published"] == num_msgs)
+
+            assert runner.stats["publish"] == {
+                "queue_depth": 0,
+                "in_flight": 0,
+                "published": num_msgs,
+                "retries": len(failing)
+            }
+
+            assert len(attempts) == num_msgs + len(failing)
+            assert sorted(json.loads(data.decode())["idx"] for _, data, _, _ in broker.published) == \
+                list(range(num_msgs))
+
+            def retry_pos(idx):
+                return attempts.index(idx, attempts.index(idx) + 1)
+
+            assert retry_pos(1) < retry_pos(2)
+
+            for idx in failing:
+                assert retry_pos(idx) < attempts.index(idx + window)
+
+            yield runner.stop()
+
+        run_test_coroutine(test_coroutine)
@@ -14,14 +14,24 @@ import tornado.gen
 import tornado.ioloop
 from faker import Faker
 from hbmqtt.client import MQTTClient
-from hbmqtt.mqtt.constants import QOS_2, QOS_0
+from hbmqtt.mqtt.constants import QOS_2, QOS_1, QOS_0
 
 from tests.protocols.mqtt.broker import is_test_broker_online, BROKER_SKIP_REASON, get_test_broker_url
 from tests.utils import run_test_coroutine
 from wotpy.protocols.enums import InteractionVerbs
+from wotpy.protocols.mqtt.enums import MQTTOverflowPolicies, MQTTVocabularyKeys
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
+from wotpy.protocols.mqtt.handlers.ping import PingMQTTHandler
+from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
+from wotpy.protocols.mqtt.handlers.queues import LatestValueQueue, OverflowQueue
+from wotpy.protocols.mqtt.handlers.subs import InteractionsSubscriber
+from wotpy.protocols.mqtt.runner import MQTTTopicRouter, MQTTHandlerPool
 from wotpy.protocols.mqtt.server import MQTTServer
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict, ActionFragmentDict
+from wotpy.wot.enums import InteractionTypes
+from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.servient import Servient
+from wotpy.wot.thing import Thing
 
 pytestmark = pytest.mark.skipif(is_test_broker_online() is False, reason=BROKER_SKIP_REASON)
 
@@ -137,6 +147,221 @@ def test_servient_id():
     run_test_coroutine(test_coroutine)
 
 
+def test_topic_router():
+    """The MQTT topic router dispatches each message topic to the handler that subscribed to it."""
+
+    mqtt_server = MQTTServer(broker_url=get_test_broker_url())
+
+    handler_ping = PingMQTTHandler(mqtt_server=mqtt_server)
+    handler_prop = PropertyMQTTHandler(mqtt_server=mqtt_server)
+    handler_action = ActionMQTTHandler(mqtt_server=mqtt_server)
+
+    router = MQTTTopicRouter([handler_ping, handler_prop, handler_action])
+    sid = mqtt_server.servient_id
+
+    assert router.route("{}/ping".format(sid)) is handler_ping
+    assert router.route("{}/property/requests/thing/prop".format(sid)) is handler_prop
+    assert router.route("{}/action/invocation/thing/action".format(sid)) is handler_action
+    assert router.route("{}/pong".format(sid)) is None
+    assert router.route("{}/ping/other".format(sid)) is None
+    assert router.route("{}/property/updates/thing/prop".format(sid)) is None
+
+
+def test_handler_pool_ordering():
+    """MQTT handler pools bound the handler concurrency and keep the order of the messages that share a key."""
+
+    class TopicMessage(object):
+        def __init__(self, topic):
+            self.topic = topic
+
+    class RecorderHandler(object):
+        def __init__(self):
+            self.handled = []
+            self.max_in_flight = 0
+            self.in_flight = 0
+
+        def ordering_key(self, msg):
+            return msg.topic.split("/")[0]
+
+        @tornado.gen.coroutine
+        def handle_message(self, msg):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            yield tornado.gen.sleep(0.002 * (num_msgs - int(msg.topic.split("/")[1])))
+            self.handled.append(msg.topic)
+            self.in_flight -= 1
+
+    num_keys = 4
+    num_msgs = 10
+    concurrency = 6
+
+    handler = RecorderHandler()
+    pool = MQTTHandlerPool(handler, concurrency=concurrency, max_queued=10, ordered=True)
+
+    topics = ["{}/{}".format(key, idx) for idx in range(num_msgs) for key in range(num_keys)]
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        pool.start()
+
+        for topic in topics:
+            yield pool.submit(TopicMessage(topic))
+
+        while pool.handled < len(topics):
+            yield tornado.gen.sleep(0.01)
+
+        assert handler.max_in_flight <= concurrency
+        assert pool.stats["queue_depth"] == 0
+        assert pool.stats["in_flight"] == 0
+        assert pool.stats["dropped"] == 0
+
+        for key in range(num_keys):
+            handled_key = [item for item in handler.handled if item.startswith("{}/".format(key))]
+            assert handled_key == ["{}/{}".format(key, idx) for idx in range(num_msgs)]
+
+        yield pool.stop()
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_latest_value_queue():
+    """Property update queues keep only the latest message for each topic."""
+
+    queue = LatestValueQueue()
+
+    for idx in range(10):
+        queue.put_nowait({"topic": "a", "data": idx})
+        queue.put_nowait({"topic": "b", "data": idx})
+
+    assert queue.qsize() == 2
+    assert queue.coalesced == 18
+    assert queue.get_nowait() == {"topic": "a", "data": 9}
+    assert queue.get_nowait() == {"topic": "b", "data": 9}
+
+
+def test_overflow_queue():
+    """Event queues apply the configured overflow policy and count the dropped messages."""
+
+    queue_oldest = OverflowQueue(maxsize=3, policy=MQTTOverflowPolicies.DROP_OLDEST)
+    queue_newest = OverflowQueue(maxsize=3, policy=MQTTOverflowPolicies.DROP_NEWEST)
+    queue_block = OverflowQueue(maxsize=3, policy=MQTTOverflowPolicies.BLOCK, timeout=0.05)
+
+    for idx in range(5):
+        queue_oldest.offer(idx)
+        queue_newest.offer(idx)
+        queue_block.offer(idx)
+
+    assert queue_oldest.dropped == 2
+    assert [queue_oldest.get_nowait() for _ in range(3)] == [2, 3, 4]
+
+    assert queue_newest.dropped == 2
+    assert [queue_newest.get_nowait() for _ in range(3)] == [0, 1, 2]
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        assert (yield queue_block.get()) == 0
+        yield tornado.gen.sleep(0.1)
+        assert queue_block.dropped == 1
+        assert [queue_block.get_nowait() for _ in range(3)] == [1, 2, 3]
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_interactions_subscriber_push():
+    """Interaction subscribers react to ExposedThings being added to and removed
+    from the server and to their Properties being added and removed."""
+
+    mqtt_server = MQTTServer(broker_url=get_test_broker_url())
+
+    subscriber = InteractionsSubscriber(
+        interaction_type=InteractionTypes.PROPERTY,
+        server=mqtt_server,
+        on_next_builder=lambda exp_thing, prop: lambda item: None)
+
+    subscriber.start()
+
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    prop_name = uuid.uuid4().hex
+
+    def thing_subs():
+        return subscriber._subs.get(exposed_thing, None)
+
+    mqtt_server.add_exposed_thing(exposed_thing)
+
+    assert thing_subs() == {}
+
+    exposed_thing.add_property(prop_name, PropertyFragmentDict({
+        "type": "number",
+        "observable": True
+    }), value=Faker().pyint())
+
+    assert list(thing_subs().keys()) == [exposed_thing.thing.properties[prop_name]]
+
+    exposed_thing.remove_property(prop_name)
+
+    assert thing_subs() == {}
+
+    mqtt_server.remove_exposed_thing(exposed_thing.id)
+
+    assert thing_subs() is None
+
+    subscriber.dispose()
+
+
+def test_form_options():
+    """Forms advertise the QoS level and retain flag of each
+    Interaction, which may be overridden before exposing the Thing."""
+
+    mqtt_server = MQTTServer(broker_url=get_test_broker_url(), property_retain=True)
+
+    exposed_thing = ExposedThing(servient=Servient(), thing=Thing(id=uuid.uuid4().urn))
+    prop_name = uuid.uuid4().hex
+    action_name = uuid.uuid4().hex
+
+    exposed_thing.add_property(prop_name, PropertyFragmentDict({
+        "type": "number",
+        "observable": True
+    }), value=Faker().pyint())
+
+    exposed_thing.add_action(action_name, ActionFragmentDict({}))
+
+    prop = exposed_thing.thing.properties[prop_name]
+    action = exposed_thing.thing.actions[action_name]
+
+    mqtt_server.set_form_options(prop, InteractionVerbs.WRITE_PROPERTY, qos=QOS_0)
+    mqtt_server.set_form_options(action, InteractionVerbs.INVOKE_ACTION, qos=QOS_1, retain=True)
+
+    def form_options(interaction, op):
+        form = next(
+            form for form in mqtt_server.build_forms(None, interaction)
+            if form.op == op)
+
+        return {
+            item[MQTTVocabularyKeys.OPTION_NAME]: item[MQTTVocabularyKeys.OPTION_VALUE]
+            for item in form.form_dict.to_dict()[MQTTVocabularyKeys.OPTIONS]
+        }
+
+    assert form_options(prop, InteractionVerbs.READ_PROPERTY) == {
+        MQTTVocabularyKeys.OPTION_NAME_QOS: QOS_2,
+        MQTTVocabularyKeys.OPTION_NAME_RETAIN: False
+    }
+
+    assert form_options(prop, InteractionVerbs.WRITE_PROPERTY) == {
+        MQTTVocabularyKeys.OPTION_NAME_QOS: QOS_0,
+        MQTTVocabularyKeys.OPTION_NAME_RETAIN: False
+    }
+
+    assert form_options(prop, InteractionVerbs.OBSERVE_PROPERTY) == {
+        MQTTVocabularyKeys.OPTION_NAME_QOS: QOS_0,
+        MQTTVocabularyKeys.OPTION_NAME_RETAIN: True
+    }
+
+    assert form_options(action, InteractionVerbs.INVOKE_ACTION) == {
+        MQTTVocabularyKeys.OPTION_NAME_QOS: QOS_1,
+        MQTTVocabularyKeys.OPTION_NAME_RETAIN: True
+    }
+
+
 def test_property_read(mqtt_server):
     """Current Property values may be requested using the MQTT binding."""
 
@@ -221,6 +446,57 @@ def test_property_write(mqtt_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_properties_read_write(mqtt_server):
+    """Multiple Property values may be read and updated with
+    a single request to the Thing-level Form of the MQTT binding."""
+
+    exposed_thing = next(mqtt_server.exposed_things)
+    prop_names = list(six.iterkeys(exposed_thing.thing.properties))
+    thing_form = mqtt_server.build_thing_forms(None, exposed_thing.thing)[0]
+
+    assert InteractionVerbs.WRITE_MULTIPLE_PROPERTIES in thing_form.op
+
+    topic_requests = "/".join(thing_form.href.split("/")[3:])
+    topic_result = PropertyMQTTHandler.to_properties_result_topic(topic_requests)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        client_requests = yield connect_broker(topic_requests)
+        client_result = yield connect_broker(topic_result)
+
+        values = {name: Faker().sentence() for name in prop_names}
+
+        data_write = {
+            "id": uuid.uuid4().hex,
+            "action": "write",
+            "values": values
+        }
+
+        yield client_requests.publish(topic_requests, json.dumps(data_write).encode(), qos=QOS_2)
+
+        msg = yield client_result.deliver_message()
+        msg_data = json.loads(msg.data.decode())
+
+        assert msg_data.get("id") == data_write.get("id")
+        assert msg_data.get("error", None) is None
+
+        data_read = {
+            "id": uuid.uuid4().hex,
+            "action": "read",
+            "names": prop_names[:1]
+        }
+
+        yield client_requests.publish(topic_requests, json.dumps(data_read).encode(), qos=QOS_2)
+
+        msg = yield client_result.deliver_message()
+        msg_data = json.loads(msg.data.decode())
+
+        assert msg_data.get("id") == data_read.get("id")
+        assert msg_data.get("values") == {prop_names[0]: values[prop_names[0]]}
+
+    run_test_coroutine(test_coroutine)
+
+
 CALLBACK_MS = 50
 
 
@@ -347,6 +623,42 @@ def test_observe_property_changes(mqtt_server):
     run_test_coroutine(test_coroutine)
 
 
+@pytest.mark.parametrize("mqtt_server", [{"property_callback_ms": None, "property_retain": True}], indirect=True)
+def test_observe_property_retained(mqtt_server):
+    """Property updates are published as retained messages if property_retain is set."""
+
+    exposed_thing = next(mqtt_server.exposed_things)
+    prop_name = next(six.iterkeys(exposed_thing.thing.properties))
+    prop = exposed_thing.thing.properties[prop_name]
+    topic_observe = build_topic(mqtt_server, prop, InteractionVerbs.OBSERVE_PROPERTY)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        client_observe = yield connect_broker(topic_observe)
+
+        updated_value = Faker().sentence()
+
+        yield exposed_thing.properties[prop_name].write(updated_value)
+
+        msg = yield client_observe.deliver_message()
+
+        assert json.loads(msg.data.decode()).get("value") == updated_value
+
+        yield client_observe.disconnect()
+
+        client_late = yield connect_broker(topic_observe)
+
+        msg = yield client_late.deliver_message(timeout=DEFAULT_PING_TIMEOUT)
+
+        assert msg.retain
+        assert json.loads(msg.data.decode()).get("value") == updated_value
+
+        yield client_late.publish(topic_observe, b"", qos=QOS_0, retain=True)
+        yield client_late.disconnect()
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_observe_event(mqtt_server):
     """Events may be observed using the MQTT binding."""
 
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import tornado.gen
+from tornado.concurrent import Future
+
+from tests.utils import run_test_coroutine
+from wotpy.protocols.enums import InvocationOverflowPolicies
+from wotpy.protocols.invocations import InvocationRegistry, InvocationRegistryFull
+
+
+def test_expire_after_completion():
+    """Invocations are removed from the registry once the TTL
+    has elapsed since they were completed, even if never checked."""
+
+    registry = InvocationRegistry(ttl_secs=0.05)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        fut_done = Future()
+        fut_pending = Future()
+
+        id_done = registry.add(fut_done)
+        id_pending = registry.add(fut_pending)
+
+        yield tornado.gen.sleep(0.1)
+
+        assert id_done in registry
+        assert id_pending in registry
+        assert registry.stats["pending"] == 2
+
+        fut_done.set_result(True)
+
+        yield tornado.gen.moment
+
+        assert registry.get(id_done) is fut_done
+        assert registry.stats["completed"] == 1
+
+        yield tornado.gen.sleep(0.1)
+
+        assert id_done not in registry
+        assert registry.get(id_done) is None
+        assert id_pending in registry
+        assert registry.stats["expired"] == 1
+        assert registry.stats["size"] == 1
+
+        fut_pending.set_result(True)
+
+        yield tornado.gen.sleep(0.1)
+
+        assert len(registry) == 0
+        assert registry.stats["expired"] == 2
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_overflow_reject():
+    """New invocations are rejected when the registry is full and the policy is reject."""
+
+    registry = InvocationRegistry(max_size=2, overflow_policy=InvocationOverflowPolicies.REJECT)
+
+    ids = [registry.add(Future()) for _ in range(2)]
+
+    assert registry.full()
+
+    with pytest.raises(InvocationRegistryFull):
+        registry.check_capacity()
+
+    with pytest.raises(InvocationRegistryFull):
+        registry.add(Future())
+
+    registry.remove(ids[0])
+    registry.check_capacity()
+
+    assert registry.add(Future())
+    assert registry.stats["rejected"] == 2
+    assert len(registry) == 2
+
+
+def test_overflow_evict_oldest():
+    """The oldest invocations are evicted when the registry is full and the policy is evict oldest."""
+
+    registry = InvocationRegistry(max_size=2, overflow_policy=InvocationOverflowPolicies.EVICT_OLDEST)
+
+    futs = [Future() for _ in range(3)]
+    futs[0].set_result(True)
+    ids = [registry.add(fut) for fut in futs]
+
+    registry.check_capacity()
+
+    assert ids[0] not in registry
+    assert ids[1] in registry and ids[2] in registry
+    assert registry.stats == {
+        "size": 2,
+        "max_size": 2,
+        "pending": 2,
+        "completed": 0,
+        "expired": 0,
+        "evicted": 1,
+        "rejected": 0
+    }
+
+
+def test_remove_before_done_callback():
+    """Invocations removed after completing but before the done callback
+    runs are not counted as completed nor started in the expiry queue."""
+
+    registry = InvocationRegistry(max_size=1, overflow_policy=InvocationOverflowPolicies.EVICT_OLDEST)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        fut_evicted = Future()
+        registry.add(fut_evicted)
+        fut_evicted.set_result(True)
+
+        fut_removed = Future()
+        id_removed = registry.add(fut_removed)
+        fut_removed.set_result(True)
+        registry.remove(id_removed)
+
+        fut_pending = Future()
+        registry.add(fut_pending)
+
+        assert registry.stats["pending"] == 1
+        assert registry.stats["completed"] == 0
+
+        yield tornado.gen.moment
+
+        assert registry.stats["size"] == 1
+        assert registry.stats["pending"] == 1
+        assert registry.stats["completed"] == 0
+        assert registry.stats["evicted"] == 1
+
+    run_test_coroutine(test_coroutine)
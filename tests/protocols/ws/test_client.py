@@ -8,7 +8,6 @@ import six
 import tornado.concurrent
 import tornado.gen
 import tornado.ioloop
-import tornado.locks
 import tornado.websocket
 from mock import patch
 from rx.concurrency import IOLoopScheduler
@@ -18,6 +17,7 @@ from tests.protocols.helpers import \
     client_test_on_event, \
     client_test_read_property, \
     client_test_write_property, \
+    client_test_read_write_properties, \
     client_test_invoke_action, \
     client_test_invoke_action_error, \
     client_test_on_property_change_error
@@ -55,6 +55,12 @@ def test_write_property(websocket_servient):
     client_test_write_property(websocket_servient, WebsocketClient)
 
 
+def test_read_write_properties(websocket_servient):
+    """The Websockets client can read and write multiple properties in one request."""
+
+    client_test_read_write_properties(websocket_servient, WebsocketClient)
+
+
 def test_invoke_action(websocket_servient):
     """The Websockets client can invoke actions."""
 
@@ -150,12 +156,12 @@ def test_on_property_change_error(websocket_servient):
 
 
 # noinspection PyUnusedLocal
-def _condition_coro(*args, **kwargs):
-    """Coroutine mock side effect that returns a Condition that is never notified."""
+def _pending_response_coro(*args, **kwargs):
+    """Coroutine mock side effect that returns a response Future that is never resolved."""
 
     @tornado.gen.coroutine
     def _coro():
-        raise tornado.gen.Return(tornado.locks.Condition())
+        raise tornado.gen.Return(Future())
 
     return _coro()
 
@@ -164,7 +170,7 @@ def test_timeout_read_property(websocket_servient):
     """Timeouts can be defined on Property reads."""
 
     # noinspection PyUnresolvedReferences
-    with patch.object(WebsocketClient, '_send_message', _condition_coro):
+    with patch.object(WebsocketClient, '_send_message', _pending_response_coro):
         with pytest.raises(ClientRequestTimeout):
             client_test_read_property(websocket_servient, WebsocketClient, timeout=random.random())
 
@@ -173,7 +179,7 @@ def test_timeout_write_property(websocket_servient):
     """Timeouts can be defined on Property writes."""
 
     # noinspection PyUnresolvedReferences
-    with patch.object(WebsocketClient, '_send_message', _condition_coro):
+    with patch.object(WebsocketClient, '_send_message', _pending_response_coro):
         with pytest.raises(ClientRequestTimeout):
             client_test_write_property(websocket_servient, WebsocketClient, timeout=random.random())
 
@@ -182,6 +188,95 @@ def test_timeout_invoke_action(websocket_servient):
     """Timeouts can be defined on Action invocations."""
 
     # noinspection PyUnresolvedReferences
-    with patch.object(WebsocketClient, '_send_message', _condition_coro):
+    with patch.object(WebsocketClient, '_send_message', _pending_response_coro):
         with pytest.raises(ClientRequestTimeout):
             client_test_invoke_action(websocket_servient, WebsocketClient, timeout=random.random())
+
+
+def test_persistent_connection(websocket_servient):
+    """Requests are pipelined over a single connection that is closed when idle."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_name = next(six.iterkeys(td.properties))
+    idle_timeout = 0.2
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient(idle_timeout_secs=idle_timeout)
+        prop_value = uuid.uuid4().hex
+
+        yield exposed_thing.write_property(prop_name, prop_value)
+
+        with patch.object(tornado.websocket, 'websocket_connect', wraps=tornado.websocket.websocket_connect) as mock:
+            values = yield [ws_client.read_property(td, prop_name) for _ in range(10)]
+
+            assert values == [prop_value] * 10
+
+            for _ in range(5):
+                value = yield ws_client.read_property(td, prop_name)
+                assert value == prop_value
+
+            assert mock.call_count == 1
+
+            yield tornado.gen.sleep(idle_timeout * 2)
+
+            value = yield ws_client.read_property(td, prop_name)
+
+            assert value == prop_value
+            assert mock.call_count == 2
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_shared_subscriptions(websocket_servient):
+    """Subscriptions to the same Thing share a single connection
+    and disposing one subscription does not affect the others."""
+
+    exposed_thing = next(websocket_servient.exposed_things)
+    td = ThingDescription.from_thing(exposed_thing.thing)
+    prop_names = list(td.properties.keys())[:2]
+    num_subscriptions = 10
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        ws_client = WebsocketClient()
+        received = {prop_name: [] for prop_name in prop_names}
+
+        def build_on_next(prop_name):
+            return lambda ev: received[prop_name].append(ev.data.value)
+
+        with patch.object(tornado.websocket, 'websocket_connect', wraps=tornado.websocket.websocket_connect) as mock:
+            subscriptions = {
+                prop_name: [
+                    ws_client.on_property_change(td, prop_name).subscribe(build_on_next(prop_name))
+                    for _ in range(num_subscriptions)
+                ]
+                for prop_name in prop_names
+            }
+
+            while any(len(received[prop_name]) < num_subscriptions for prop_name in prop_names):
+                for prop_name in prop_names:
+                    yield exposed_thing.write_property(prop_name, uuid.uuid4().hex)
+                yield tornado.gen.sleep(0.05)
+
+            assert mock.call_count == 1
+
+        for subscription in subscriptions[prop_names[0]]:
+            subscription.dispose()
+
+        received = {prop_name: [] for prop_name in prop_names}
+        value = uuid.uuid4().hex
+
+        while len(received[prop_names[1]]) < num_subscriptions:
+            yield exposed_thing.write_property(prop_names[0], uuid.uuid4().hex)
+            yield exposed_thing.write_property(prop_names[1], value)
+            yield tornado.gen.sleep(0.05)
+
+        assert not len(received[prop_names[0]])
+        assert value in received[prop_names[1]]
+
+        for subscription in subscriptions[prop_names[1]]:
+            subscription.dispose()
+
+    run_test_coroutine(test_coroutine)
@@ -153,6 +153,67 @@ def test_write_property(websocket_server):
     run_test_coroutine(test_coroutine)
 
 
+def test_read_write_properties(websocket_server):
+    """Multiple Properties can be retrieved and updated with one Websockets message."""
+
+    url_thing_01 = websocket_server.pop("url_thing_01")
+    exposed_thing_01 = websocket_server.pop("exposed_thing_01")
+    prop_name_01 = websocket_server.pop("prop_name_01")
+    prop_name_02 = websocket_server.pop("prop_name_02")
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        conn = yield tornado.websocket.websocket_connect(url_thing_01)
+
+        updated_values = {
+            prop_name_01: Faker().pystr(),
+            prop_name_02: Faker().pystr()
+        }
+
+        ws_request_write = WebsocketMessageRequest(
+            method=WebsocketMethods.WRITE_PROPERTIES,
+            params={"values": updated_values},
+            msg_id=uuid.uuid4().hex)
+
+        conn.write_message(ws_request_write.to_json())
+        raw_response = yield conn.read_message()
+        ws_response = WebsocketMessageResponse.from_raw(raw_response)
+
+        assert ws_response.id == ws_request_write.id
+
+        values = yield exposed_thing_01.read_properties([prop_name_01, prop_name_02])
+
+        assert values == updated_values
+
+        ws_request_read = WebsocketMessageRequest(
+            method=WebsocketMethods.READ_PROPERTIES,
+            params={"names": [prop_name_02]},
+            msg_id=uuid.uuid4().hex)
+
+        conn.write_message(ws_request_read.to_json())
+        raw_response = yield conn.read_message()
+        ws_response = WebsocketMessageResponse.from_raw(raw_response)
+
+        assert ws_response.result == {prop_name_02: updated_values[prop_name_02]}
+
+        ws_request_read_all = WebsocketMessageRequest(
+            method=WebsocketMethods.READ_PROPERTIES,
+            params={},
+            msg_id=uuid.uuid4().hex)
+
+        conn.write_message(ws_request_read_all.to_json())
+        raw_response = yield conn.read_message()
+        ws_response = WebsocketMessageResponse.from_raw(raw_response)
+
+        values = yield exposed_thing_01.read_properties()
+
+        assert ws_response.result == values
+
+        yield conn.close()
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_invoke_action(websocket_server):
     """Actions can be invoked using Websockets."""
 
@@ -150,6 +150,32 @@ def test_write_property(consumed_exposed_pair):
     run_test_coroutine(test_coroutine)
 
 
+def test_read_write_properties(consumed_exposed_pair):
+    """A ConsumedThing is able to read and write multiple properties at once."""
+
+    consumed_thing = consumed_exposed_pair.pop("consumed_thing")
+    exposed_thing = consumed_exposed_pair.pop("exposed_thing")
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        prop_names = list(six.iterkeys(consumed_thing.td.properties))
+
+        result_exposed = yield exposed_thing.read_properties()
+        result_consumed = yield consumed_thing.read_properties()
+
+        assert result_consumed == result_exposed
+
+        values = {name: Faker().sentence() for name in prop_names}
+
+        yield consumed_thing.write_properties(values)
+
+        result_consumed = yield consumed_thing.read_properties(prop_names)
+
+        assert result_consumed == values
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_invoke_action(consumed_exposed_pair):
     """A ConsumedThing is able to invoke actions."""
 
@@ -54,6 +54,21 @@ def test_form_dict():
         FormDict({"type": Faker().pystr()})
 
 
+def test_form_dict_extensions():
+    """Form dictionaries keep the prefixed terms from other vocabularies."""
+
+    options = [{"mqtt:optionName": "mqtt:qos", "mqtt:optionValue": 0}]
+
+    form_dict = FormDict({
+        "href": Faker().url(),
+        "mqtt:options": options
+    })
+
+    assert form_dict.extensions == {"mqtt:options": options}
+    assert form_dict.to_dict().get("mqtt:options") == options
+    assert FormDict(form_dict.to_dict()).extensions == form_dict.extensions
+
+
 def test_property_fragment():
     """Property fragment dictionaries can be represented and serialized."""
 
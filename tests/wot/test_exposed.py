@@ -19,6 +19,8 @@ from wotpy.wot.dictionaries.interaction import PropertyFragmentDict
 from wotpy.wot.dictionaries.thing import ThingFragment
 from wotpy.wot.enums import TDChangeMethod, TDChangeType, DataType
 from wotpy.wot.exposed.thing import ExposedThing
+from wotpy.wot.exposed.thing_set import ExposedThingSet
+from wotpy.wot.interaction import Action
 from wotpy.wot.servient import Servient
 from wotpy.wot.thing import Thing
 
@@ -141,6 +143,75 @@ def test_write_non_writable_property(exposed_thing):
     run_test_coroutine(test_coroutine)
 
 
+def test_read_write_properties(exposed_thing, property_fragment):
+    """Multiple Properties may be read and updated at once on ExposedThings.
+    The read handlers are called concurrently."""
+
+    prop_names = [uuid.uuid4().hex for _ in range(3)]
+    state = {"current": 0, "max": 0}
+
+    for prop_name in prop_names:
+        exposed_thing.add_property(prop_name, property_fragment, value=Faker().sentence())
+
+    @tornado.gen.coroutine
+    def read_handler():
+        state["current"] += 1
+        state["max"] = max(state["max"], state["current"])
+        yield tornado.gen.sleep(0.05)
+        state["current"] -= 1
+        raise tornado.gen.Return(state["max"])
+
+    for slow_name in [uuid.uuid4().hex for _ in range(2)]:
+        exposed_thing.add_property(slow_name, property_fragment)
+        exposed_thing.set_property_read_handler(slow_name, read_handler)
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        values_all = yield exposed_thing.read_properties()
+
+        assert set(values_all.keys()) == set(exposed_thing.thing.properties.keys())
+        assert state["max"] == 2
+
+        values_write = {name: Faker().sentence() for name in prop_names[:2]}
+
+        yield exposed_thing.write_properties(values_write)
+
+        values = yield exposed_thing.read_properties(prop_names[:2])
+
+        assert values == values_write
+
+    run_test_coroutine(test_coroutine)
+
+
+def test_write_properties_non_writable(exposed_thing, property_fragment):
+    """No Property is updated when writing multiple Properties if any of them is non-writable."""
+
+    prop_name = uuid.uuid4().hex
+    prop_name_non_writable = uuid.uuid4().hex
+    prop_value = Faker().sentence()
+
+    exposed_thing.add_property(prop_name, property_fragment, value=prop_value)
+
+    exposed_thing.add_property(prop_name_non_writable, PropertyFragmentDict({
+        "type": "string",
+        "readOnly": True
+    }))
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        with pytest.raises(TypeError):
+            yield exposed_thing.write_properties({
+                prop_name: Faker().sentence(),
+                prop_name_non_writable: Faker().sentence()
+            })
+
+        value = yield exposed_thing.read_property(prop_name)
+
+        assert value == prop_value
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_invoke_action(exposed_thing, action_fragment):
     """Actions can be invoked on ExposedThings."""
 
@@ -307,6 +378,33 @@ def test_on_event(exposed_thing, event_fragment):
     subscription.dispose()
 
 
+def test_on_event_isolated(exposed_thing, event_fragment):
+    """Event emissions are only dispatched to the subscribers of that event."""
+
+    event_names = [Faker().pystr() for _ in range(3)]
+
+    for event_name in event_names:
+        exposed_thing.add_event(event_name, event_fragment)
+
+    emitted = {event_name: [] for event_name in event_names}
+
+    subscriptions = [
+        exposed_thing.on_event(event_name).subscribe(lambda ev: emitted[ev.name].append(ev.data))
+        for event_name in event_names
+        for _ in range(10)
+    ]
+
+    payload = Faker().pystr()
+    exposed_thing.emit_event(event_names[0], payload)
+
+    assert emitted[event_names[0]] == [payload] * 10
+    assert not len(emitted[event_names[1]])
+    assert not len(emitted[event_names[2]])
+
+    for subscription in subscriptions:
+        subscription.dispose()
+
+
 def test_on_td_change(exposed_thing, property_fragment, event_fragment, action_fragment):
     """Thing Description changes can be observed."""
 
@@ -662,3 +760,47 @@ def test_interaction_name_url_safe():
     """ExposedThing interaction names are equivalent in a URL-safe fashion."""
 
     _test_equivalent_interaction_names("url_UnSafE-Str", lambda name: slugify(name))
+
+
+def test_exposed_thing_set_lookups():
+    """ExposedThings may be retrieved from an ExposedThingSet by ID,
+    URL-safe name and Interaction, even after the title is updated."""
+
+    servient = Servient()
+    exp_thing_set = ExposedThingSet()
+
+    exp_things = [
+        ExposedThing(servient=servient, thing=Thing(id=uuid.uuid4().urn, title=Faker().sentence()))
+        for _ in range(5)
+    ]
+
+    for exp_thing in exp_things:
+        exp_thing_set.add(exp_thing)
+
+    assert len(exp_thing_set) == len(exp_things)
+
+    exp_thing = exp_things[0]
+    action = Action(thing=exp_thing.thing, name=Faker().pystr())
+    exp_thing.thing.add_interaction(action)
+
+    assert exp_thing_set.contains(exp_thing)
+    assert exp_thing_set.find_by_thing_id(exp_thing.id) is exp_thing
+    assert exp_thing_set.find_by_thing_id(exp_thing.url_name) is exp_thing
+    assert exp_thing_set.find_by_interaction(action) is exp_thing
+
+    url_name_original = exp_thing.url_name
+    exp_thing.title = Faker().sentence()
+
+    assert exp_thing.url_name != url_name_original
+    assert exp_thing_set.find_by_thing_id(url_name_original) is None
+    assert exp_thing_set.find_by_thing_id(exp_thing.url_name) is exp_thing
+
+    exp_thing_set.remove(exp_thing.url_name)
+
+    assert not exp_thing_set.contains(exp_thing)
+    assert exp_thing_set.find_by_thing_id(exp_thing.id) is None
+    assert exp_thing_set.find_by_interaction(action) is None
+    assert len(exp_thing_set) == len(exp_things) - 1
+
+    with pytest.raises(ValueError):
+        exp_thing_set.remove(exp_thing.id)
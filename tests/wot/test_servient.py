@@ -109,6 +109,61 @@ def test_servient_td_catalogue(servient):
     run_test_coroutine(test_coroutine)
 
 
+def test_servient_td_catalogue_etag(servient):
+    """The servient TD catalogue answers conditional requests
+    with 304 Not Modified until the Thing is updated."""
+
+    @tornado.gen.coroutine
+    def test_coroutine():
+        wot = WoT(servient=servient)
+        exposed_thing = wot.produce(json.dumps(TD_DICT_01))
+        exposed_thing.expose()
+
+        http_client = tornado.httpclient.AsyncHTTPClient()
+        urls_map = yield fetch_catalogue(servient)
+        thing_path = urls_map[TD_DICT_01["id"]].lstrip("/")
+
+        td_url = "http://localhost:{}/{}".format(servient.catalogue_port, thing_path)
+        expanded_url = "http://localhost:{}/?expanded=true".format(servient.catalogue_port)
+
+        for url in [td_url, expanded_url]:
+            response = yield http_client.fetch(url)
+            etag = response.headers.get("Etag")
+
+            assert response.code == 200
+            assert etag
+
+            response_cached = yield http_client.fetch(
+                url, headers={"If-None-Match": etag}, raise_error=False)
+
+            assert response_cached.code == 304
+            assert not response_cached.body
+
+        td_json_01, etag_01 = servient.get_thing_description_json(exposed_thing)
+        td_json_02, etag_02 = servient.get_thing_description_json(exposed_thing)
+
+        assert td_json_01 is td_json_02
+        assert etag_01 == etag_02
+
+        exposed_thing.add_event(uuid.uuid4().hex, {"type": "string"})
+
+        for url in [td_url, expanded_url]:
+            response = yield http_client.fetch(url)
+            etag = response.headers.get("Etag")
+
+            response_stale = yield http_client.fetch(
+                url, headers={"If-None-Match": etag_01}, raise_error=False)
+
+            assert response_stale.code == 200
+            assert response_stale.headers.get("Etag") == etag
+
+        response = yield http_client.fetch(td_url)
+
+        assert len(json.loads(response.body)["events"]) == 1
+
+    run_test_coroutine(test_coroutine)
+
+
 def test_servient_start_stop():
     """The servient and contained ExposedThings can be started and stopped."""
 
@@ -271,3 +326,49 @@ def test_clients_config():
     servient = Servient(clients_config={Protocols.HTTP: {"connect_timeout": connect_timeout}})
 
     assert servient.clients[Protocols.HTTP].connect_timeout == connect_timeout
+
+
+def test_enable_exposed_things():
+    """ExposedThings may be enabled in bulk and enabling or disabling
+    an ExposedThing does not regenerate the Forms of the others."""
+
+    servient = Servient(catalogue_port=None)
+    servient.add_server(WebsocketServer(port=find_free_port()))
+    wot = WoT(servient=servient)
+
+    def build_td_str():
+        return json.dumps({
+            "id": uuid.uuid4().urn,
+            "title": Faker().sentence(),
+            "properties": {"status": {"type": "string"}}
+        })
+
+    exp_things = [wot.produce(build_td_str()) for _ in range(3)]
+
+    def get_forms(exp_thing):
+        return exp_thing.thing.properties["status"].forms
+
+    servient.enable_exposed_things([exp_thing.id for exp_thing in exp_things[:2]])
+
+    assert len(list(servient.enabled_exposed_things)) == 2
+    assert len(get_forms(exp_things[0])) == 1
+    assert len(get_forms(exp_things[1])) == 1
+    assert not len(get_forms(exp_things[2]))
+
+    form_01 = get_forms(exp_things[0])[0]
+
+    servient.enable_exposed_thing(exp_things[2].id)
+
+    assert len(get_forms(exp_things[2])) == 1
+    assert get_forms(exp_things[0])[0] is form_01
+
+    servient.disable_exposed_thing(exp_things[1].id)
+
+    assert not len(get_forms(exp_things[1]))
+    assert get_forms(exp_things[0])[0] is form_01
+
+    with pytest.raises(ValueError):
+        servient.enable_exposed_things([exp_things[1].id, uuid.uuid4().urn])
+
+    assert not len(get_forms(exp_things[1]))
+    assert exp_things[1] not in list(servient.enabled_exposed_things)
@@ -107,3 +107,20 @@ def test_build_thing():
     assert_same_keys(thing.properties, td_dict.get("properties", {}))
     assert_same_keys(thing.actions, td_dict.get("actions", {}))
     assert_same_keys(thing.events, td_dict.get("events", {}))
+
+
+def test_validation_disabled():
+    """Validation may be skipped for Thing Descriptions that come from trusted sources."""
+
+    td_err = copy.deepcopy(TD_EXAMPLE)
+    td_err.update({"actions": "hello-interactions"})
+
+    with pytest.raises(InvalidDescription):
+        ThingDescription(td_err)
+
+    ThingDescription(td_err, validate=False)
+
+    thing = ThingDescription(TD_EXAMPLE).build_thing()
+    td_trusted = ThingDescription.from_thing(thing, validate=False)
+
+    assert td_trusted.to_dict() == ThingDescription.from_thing(thing).to_dict()
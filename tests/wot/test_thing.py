@@ -11,7 +11,8 @@ import pytest
 # noinspection PyPackageRequirements
 from slugify import slugify
 
-from wotpy.protocols.enums import Protocols
+from wotpy.protocols.enums import Protocols, InteractionVerbs
+from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.td import ThingDescription
 from wotpy.wot.form import Form
 from wotpy.wot.interaction import Action
@@ -83,6 +84,9 @@ def test_find_interaction():
     assert thing.find_interaction(interaction_02.name) is interaction_02
     assert thing.find_interaction(slugify(interaction_01.name)) is interaction_01
     assert thing.find_interaction(slugify(interaction_02.name)) is interaction_02
+    assert thing.find_interaction(interaction_01.name, interaction_type=InteractionTypes.ACTION) is interaction_01
+    assert thing.find_interaction(interaction_01.name, interaction_type=InteractionTypes.PROPERTY) is None
+    assert thing.find_interaction("unknown") is None
 
 
 def test_remove_interaction():
@@ -157,3 +161,69 @@ def test_duplicated_forms():
 
     with pytest.raises(ValueError):
         interaction.add_form(form_06)
+
+
+def test_thing_forms():
+    """Forms for the operations that apply to the whole Thing are
+    serialized in the Thing Description and can be retrieved from it."""
+
+    thing = Thing(id=uuid.uuid4().urn)
+
+    form = Form(
+        interaction=None,
+        protocol=Protocols.HTTP,
+        href="http://localhost/properties",
+        op=[InteractionVerbs.READ_ALL_PROPERTIES, InteractionVerbs.WRITE_MULTIPLE_PROPERTIES])
+
+    thing.add_form(form)
+
+    with pytest.raises(ValueError):
+        thing.add_form(Form(interaction=None, protocol=Protocols.HTTP, href=form.href, op=form.op))
+
+    td = ThingDescription.from_thing(thing)
+
+    assert len(td.get_thing_forms()) == 1
+    assert td.get_thing_forms()[0].href == form.href
+    assert InteractionVerbs.READ_ALL_PROPERTIES in td.get_thing_forms()[0].op
+
+    thing.remove_form(form)
+
+    assert not len(ThingDescription.from_thing(thing).get_thing_forms())
+
+
+def test_thing_fragment_cache():
+    """The cached ThingFragment and derived identifiers
+    are refreshed each time the Thing is modified."""
+
+    thing = Thing(id=uuid.uuid4().urn, title="Original title")
+
+    url_name_original = thing.url_name
+    revision_original = thing.revision
+
+    assert thing.thing_fragment is thing.thing_fragment
+    assert thing.url_name == url_name_original
+
+    thing.title = "Updated title"
+
+    assert thing.revision > revision_original
+    assert thing.url_name != url_name_original
+    assert thing.thing_fragment.title == "Updated title"
+
+    interaction = Action(thing=thing, name="my_interaction")
+    thing.add_interaction(interaction)
+
+    assert "my_interaction" in thing.thing_fragment.actions
+    assert not len(thing.thing_fragment.actions["my_interaction"].forms)
+
+    form = Form(interaction=interaction, protocol=Protocols.HTTP, href="/href-01")
+    interaction.add_form(form)
+
+    assert len(thing.thing_fragment.actions["my_interaction"].forms) == 1
+
+    interaction.remove_form(form)
+
+    assert not len(thing.thing_fragment.actions["my_interaction"].forms)
+
+    thing.remove_interaction(interaction.name)
+
+    assert "my_interaction" not in thing.thing_fragment.actions
@@ -13,3 +13,4 @@ class MediaTypes(EnumListMixin):
 
     JSON = "application/json"
     TEXT = "text/plain"
+    EVENT_STREAM = "text/event-stream"
@@ -14,6 +14,7 @@ Implementations of the supported Protocol Binding templates.
     wotpy.protocols.client
     wotpy.protocols.enums
     wotpy.protocols.exceptions
+    wotpy.protocols.invocations
     wotpy.protocols.server
     wotpy.protocols.utils
 """
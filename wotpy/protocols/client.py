@@ -7,6 +7,9 @@ Class that represents the abstract client interface.
 
 from abc import ABCMeta, abstractmethod
 
+import six
+import tornado.gen
+
 
 class BaseProtocolClient(object):
     """Base protocol client class.
@@ -50,6 +53,29 @@ class BaseProtocolClient(object):
 
         raise NotImplementedError()
 
+    @tornado.gen.coroutine
+    def read_properties(self, td, names=None, timeout=None):
+        """Reads the values of multiple Properties (all if names is undefined) on a remote Thing.
+        Returns a Future that resolves with a dict of Property names to values.
+        This default implementation reads each Property concurrently; clients
+        override it to use the Thing-level Forms of their Protocol Binding."""
+
+        names = list(td.properties.keys()) if names is None else list(names)
+        values = yield [self.read_property(td, name, timeout=timeout) for name in names]
+
+        raise tornado.gen.Return(dict(zip(names, values)))
+
+    @tornado.gen.coroutine
+    def write_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing.
+        Returns a Future. This default implementation writes each Property concurrently;
+        clients override it to use the Thing-level Forms of their Protocol Binding."""
+
+        yield [
+            self.write_property(td, name, value, timeout=timeout)
+            for name, value in six.iteritems(values)
+        ]
+
     @abstractmethod
     def on_event(self, td, name):
         """Subscribes to an event on a remote Thing.
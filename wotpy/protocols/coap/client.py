@@ -16,7 +16,7 @@ import tornado.gen
 import tornado.ioloop
 import tornado.locks
 from rx import Observable
-from six.moves.urllib_parse import urlparse
+from six.moves.urllib_parse import urlparse, urlencode
 
 from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.coap.enums import CoAPSchemes
@@ -298,6 +298,64 @@ class CoAPClient(BaseProtocolClient):
         finally:
             await coap_client.shutdown()
 
+    async def read_properties(self, td, names=None, timeout=None):
+        """Reads the values of multiple Properties (all if names is undefined) on
+        a remote Thing with a single request to the Thing-level Form if available."""
+
+        op = InteractionVerbs.READ_ALL_PROPERTIES if names is None else InteractionVerbs.READ_MULTIPLE_PROPERTIES
+        href = self._pick_coap_href(td, td.get_thing_forms(), op=op)
+
+        if href is None:
+            return await super(CoAPClient, self).read_properties(td, names=names, timeout=timeout)
+
+        if names is not None:
+            href = "{}&{}".format(href, urlencode([("name", name) for name in names]))
+
+        coap_client = await aiocoap.Context.create_client_context()
+
+        try:
+            msg = aiocoap.Message(code=aiocoap.Code.GET, uri=href)
+            request = coap_client.request(msg)
+
+            try:
+                response = await asyncio.wait_for(request.response, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise ClientRequestTimeout
+
+            self._assert_success(response)
+
+            return json.loads(response.payload).get("values")
+        finally:
+            await coap_client.shutdown()
+
+    async def write_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing
+        with a single request to the Thing-level Form if available."""
+
+        href = self._pick_coap_href(
+            td, td.get_thing_forms(),
+            op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        if href is None:
+            await super(CoAPClient, self).write_properties(td, values, timeout=timeout)
+            return
+
+        coap_client = await aiocoap.Context.create_client_context()
+
+        try:
+            payload = json.dumps({"values": values}).encode("utf-8")
+            msg = aiocoap.Message(code=aiocoap.Code.PUT, payload=payload, uri=href)
+            request = coap_client.request(msg)
+
+            try:
+                response = await asyncio.wait_for(request.response, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise ClientRequestTimeout
+
+            self._assert_success(response)
+        finally:
+            await coap_client.shutdown()
+
     def on_property_change(self, td, name):
         """Subscribes to property changes on a remote Thing.
         Returns an Observable"""
@@ -5,19 +5,18 @@
 CoAP resources to deal with Action interactions.
 """
 
-import datetime
 import json
 import logging
-import uuid
 
 import aiocoap
 import aiocoap.error
 import aiocoap.resource
 import tornado.concurrent
 import tornado.gen
-import tornado.ioloop
 
 from wotpy.protocols.coap.resources.utils import parse_request_opt_query
+from wotpy.protocols.invocations import InvocationRegistry, InvocationRegistryFull
+from wotpy.wot.enums import InteractionTypes
 
 JSON_CONTENT_FORMAT = 50
 
@@ -38,24 +37,30 @@ def get_thing_action(server, request):
     if not exposed_thing:
         raise aiocoap.error.NotFound("Thing not found")
 
-    try:
-        return next(
-            exposed_thing.actions[key] for key in exposed_thing.actions
-            if exposed_thing.actions[key].url_name == url_name_action)
-    except StopIteration:
+    interaction = exposed_thing.thing.find_interaction(
+        url_name_action, interaction_type=InteractionTypes.ACTION)
+
+    if interaction is None:
         raise aiocoap.error.NotFound("Action not found")
 
+    return exposed_thing.actions[interaction.name]
+
+
+class ServiceUnavailable(aiocoap.error.ConstructionRenderableError):
+    """Error rendered when the server is temporarily unable to handle the request."""
+
+    code = aiocoap.Code.SERVICE_UNAVAILABLE
+
 
 class ActionResource(aiocoap.resource.ObservableResource):
     """CoAP resource to invoke Actions and observe those invocations."""
 
-    DEFAULT_CLEAR_MS = 1000 * 60 * 5
+    DEFAULT_CLEAR_MS = 1000 * InvocationRegistry.DEFAULT_TTL_SECS
 
-    def __init__(self, server, clear_ms=None):
+    def __init__(self, server):
         super(ActionResource, self).__init__()
         self._server = server
-        self._clear_ms = self.DEFAULT_CLEAR_MS if clear_ms is None else clear_ms
-        self._pending_actions = {}
+        self._pending_actions = server.pending_actions
         self._logr = logging.getLogger(__name__)
 
     @tornado.gen.coroutine
@@ -70,10 +75,10 @@ class ActionResource(aiocoap.resource.ObservableResource):
         if invocation_id is None:
             raise aiocoap.error.BadRequest("Missing invocation ID")
 
-        if invocation_id not in self._pending_actions:
-            raise aiocoap.error.NotFound("Unknown invocation")
+        future_result = self._pending_actions.get(invocation_id)
 
-        future_result = self._pending_actions[invocation_id]
+        if future_result is None:
+            raise aiocoap.error.NotFound("Unknown invocation")
 
         def raise_response(the_resp_dict):
             response_payload = json.dumps(the_resp_dict).encode("utf-8")
@@ -134,7 +139,8 @@ class ActionResource(aiocoap.resource.ObservableResource):
 
     @tornado.gen.coroutine
     def render_post(self, request):
-        """Handler for action invocations."""
+        """Handler for action invocations.
+        Responds with 5.03 without invoking the action if there are too many pending invocations."""
 
         thing_action = get_thing_action(self._server, request)
 
@@ -145,22 +151,17 @@ class ActionResource(aiocoap.resource.ObservableResource):
         if "input" not in request_payload:
             raise aiocoap.error.BadRequest("Missing input value")
 
-        invocation_id = uuid.uuid4().hex
-
-        def clear_cb():
-            self._logr.debug("Removing pending invocation: {}".format(invocation_id))
-            self._pending_actions.pop(invocation_id, None)
-
-        # noinspection PyUnusedLocal
-        def done_cb(fut):
-            loop = tornado.ioloop.IOLoop.current()
-            self._logr.debug("Invocation done ({}): cleaning on {} ms".format(invocation_id, self._clear_ms))
-            loop.add_timeout(datetime.timedelta(milliseconds=self._clear_ms), clear_cb)
+        try:
+            self._pending_actions.check_capacity()
+        except InvocationRegistryFull:
+            raise ServiceUnavailable("Too many pending invocations")
 
         input_value = request_payload.get("input")
         fut_action = tornado.gen.convert_yielded(thing_action.invoke(input_value))
-        tornado.concurrent.future_add_done_callback(fut_action, done_cb)
-        self._pending_actions[invocation_id] = fut_action
+        invocation_id = self._pending_actions.add(fut_action)
+
+        self._logr.debug("Pending invocation: {}".format(invocation_id))
+
         response_payload = json.dumps({"id": invocation_id}).encode("utf-8")
         response = aiocoap.Message(code=aiocoap.Code.CREATED, payload=response_payload)
         response.opt.content_format = JSON_CONTENT_FORMAT
@@ -15,6 +15,7 @@ import aiocoap.resource
 import tornado.gen
 
 from wotpy.protocols.coap.resources.utils import parse_request_opt_query
+from wotpy.wot.enums import InteractionTypes
 
 JSON_CONTENT_FORMAT = 50
 
@@ -35,13 +36,14 @@ def get_thing_event(server, request):
     if not exposed_thing:
         raise aiocoap.error.NotFound("Thing not found")
 
-    try:
-        return next(
-            exposed_thing.events[key] for key in exposed_thing.events
-            if exposed_thing.events[key].url_name == url_name_event)
-    except StopIteration:
+    interaction = exposed_thing.thing.find_interaction(
+        url_name_event, interaction_type=InteractionTypes.EVENT)
+
+    if interaction is None:
         raise aiocoap.error.NotFound("Event not found")
 
+    return exposed_thing.events[interaction.name]
+
 
 class EventResource(aiocoap.resource.ObservableResource):
     """CoAP resource to observe Event emissions."""
@@ -12,8 +12,10 @@ import aiocoap
 import aiocoap.error
 import aiocoap.resource
 import tornado.gen
+from six.moves.urllib import parse
 
 from wotpy.protocols.coap.resources.utils import parse_request_opt_query
+from wotpy.wot.enums import InteractionTypes
 
 JSON_CONTENT_FORMAT = 50
 
@@ -46,13 +48,31 @@ def get_thing_property(server, request):
     if not exposed_thing:
         raise aiocoap.error.NotFound("Thing not found")
 
-    try:
-        return next(
-            exposed_thing.properties[key] for key in exposed_thing.properties
-            if exposed_thing.properties[key].url_name == url_name_prop)
-    except StopIteration:
+    interaction = exposed_thing.thing.find_interaction(
+        url_name_prop, interaction_type=InteractionTypes.PROPERTY)
+
+    if interaction is None:
         raise aiocoap.error.NotFound("Property not found")
 
+    return exposed_thing.properties[interaction.name]
+
+
+def get_exposed_thing(server, request):
+    """Takes a CoAP request and returns the ExposedThing
+    identified by the request arguments."""
+
+    url_name_thing = parse_request_opt_query(request).get("thing")
+
+    if not url_name_thing:
+        raise aiocoap.error.BadRequest("Missing query arguments")
+
+    exposed_thing = server.exposed_thing_set.find_by_thing_id(url_name_thing)
+
+    if not exposed_thing:
+        raise aiocoap.error.NotFound("Thing not found")
+
+    return exposed_thing
+
 
 class PropertyResource(aiocoap.resource.Resource):
     """CoAP resource that implements the Property read, write and observe verbs."""
@@ -112,3 +132,51 @@ class PropertyResource(aiocoap.resource.Resource):
         response = aiocoap.Message(code=aiocoap.Code.CHANGED)
 
         raise tornado.gen.Return(response)
+
+
+class PropertiesResource(aiocoap.resource.Resource):
+    """CoAP resource that implements reads and writes of multiple Properties of a Thing at once."""
+
+    def __init__(self, server):
+        super(PropertiesResource, self).__init__()
+        self._server = server
+
+    @classmethod
+    def _check_names(cls, exposed_thing, names):
+        """Raises a NotFound error if any of the given names is not a Property of the Thing."""
+
+        if any(name not in exposed_thing.thing.properties for name in names):
+            raise aiocoap.error.NotFound("Property not found")
+
+    @tornado.gen.coroutine
+    def render_get(self, request):
+        """Returns a CoAP response with the values of the Properties in the
+        name query arguments, or the values of all the Properties if there are none."""
+
+        exposed_thing = get_exposed_thing(self._server, request)
+        names = parse.parse_qs("&".join(request.opt.uri_query)).get("name") or None
+        self._check_names(exposed_thing, names or [])
+        values = yield exposed_thing.read_properties(names)
+
+        payload = json.dumps({"values": values}).encode("utf-8")
+        response = aiocoap.Message(code=aiocoap.Code.CONTENT, payload=payload)
+        response.opt.content_format = JSON_CONTENT_FORMAT
+
+        raise tornado.gen.Return(response)
+
+    @tornado.gen.coroutine
+    def render_put(self, request):
+        """Updates the Properties with the values retrieved from the CoAP request payload."""
+
+        exposed_thing = get_exposed_thing(self._server, request)
+        request_payload = json.loads(request.payload)
+
+        if not isinstance(request_payload, dict) or not isinstance(request_payload.get("values"), dict):
+            raise aiocoap.error.BadRequest()
+
+        self._check_names(exposed_thing, request_payload.get("values"))
+        yield exposed_thing.write_properties(request_payload.get("values"))
+
+        response = aiocoap.Message(code=aiocoap.Code.CHANGED)
+
+        raise tornado.gen.Return(response)
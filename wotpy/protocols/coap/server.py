@@ -20,8 +20,9 @@ from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.coap.enums import CoAPSchemes
 from wotpy.protocols.coap.resources.action import ActionResource
 from wotpy.protocols.coap.resources.event import EventResource
-from wotpy.protocols.coap.resources.property import PropertyResource
+from wotpy.protocols.coap.resources.property import PropertyResource, PropertiesResource
 from wotpy.protocols.enums import Protocols, InteractionVerbs
+from wotpy.protocols.invocations import InvocationRegistry
 from wotpy.protocols.server import BaseProtocolServer
 from wotpy.utils.utils import get_main_ipv4_address
 from wotpy.wot.enums import InteractionTypes
@@ -33,12 +34,19 @@ class CoAPServer(BaseProtocolServer):
 
     DEFAULT_PORT = 5683
 
-    def __init__(self, port=DEFAULT_PORT, ssl_context=None, action_clear_ms=None):
+    def __init__(self, port=DEFAULT_PORT, ssl_context=None, action_clear_ms=None,
+                 action_max_pending=InvocationRegistry.DEFAULT_MAX_SIZE, action_overflow_policy=None):
         super(CoAPServer, self).__init__(port=port)
         self._server = None
         self._server_lock = tornado.locks.Lock()
         self._ssl_context = ssl_context
         self._action_clear_ms = action_clear_ms
+
+        self._pending_actions = InvocationRegistry(
+            ttl_secs=self.action_clear_ms / 1000.0,
+            max_size=action_max_pending,
+            overflow_policy=action_overflow_policy)
+
         self._logr = logging.getLogger(__name__)
 
     @property
@@ -66,6 +74,18 @@ class CoAPServer(BaseProtocolServer):
 
         return self._action_clear_ms if self._action_clear_ms else ActionResource.DEFAULT_CLEAR_MS
 
+    @property
+    def pending_actions(self):
+        """Registry of pending action invocations represented as Futures."""
+
+        return self._pending_actions
+
+    @property
+    def stats(self):
+        """Dict with the gauges of the pending Action invocations registry."""
+
+        return {"invocations": self.pending_actions.stats}
+
     def _build_forms_property(self, proprty, hostname):
         """Builds and returns the CoAP Form instances for the given Property interaction."""
 
@@ -143,6 +163,27 @@ class CoAPServer(BaseProtocolServer):
 
         return intrct_type_map[interaction.interaction_type](interaction, hostname)
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns a list with all Form that are linked to this server
+        for the operations that apply to the whole Thing (e.g. readallproperties)."""
+
+        href_properties = "{}://{}:{}/properties?thing={}".format(
+            self.scheme, hostname.rstrip("/").lstrip("/"),
+            self.port, thing.url_name)
+
+        form_properties = Form(
+            interaction=None,
+            protocol=self.protocol,
+            href=href_properties,
+            content_type=MediaTypes.JSON,
+            op=[
+                InteractionVerbs.READ_ALL_PROPERTIES,
+                InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+            ])
+
+        return [form_properties]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
@@ -167,9 +208,13 @@ class CoAPServer(BaseProtocolServer):
             ("property",),
             PropertyResource(self))
 
+        root.add_resource(
+            ("properties",),
+            PropertiesResource(self))
+
         root.add_resource(
             ("action",),
-            ActionResource(self, clear_ms=self._action_clear_ms))
+            ActionResource(self))
 
         root.add_resource(
             ("event",),
@@ -28,3 +28,14 @@ class InteractionVerbs(EnumListMixin):
     INVOKE_ACTION = "invokeaction"
     SUBSCRIBE_EVENT = "subscribeevent"
     UNSUBSCRIBE_EVENT = "unsubscribeevent"
+    READ_ALL_PROPERTIES = "readallproperties"
+    READ_MULTIPLE_PROPERTIES = "readmultipleproperties"
+    WRITE_MULTIPLE_PROPERTIES = "writemultipleproperties"
+
+
+class InvocationOverflowPolicies(EnumListMixin):
+    """Enumeration of policies applied when a new Action
+    invocation arrives while the invocations registry is full."""
+
+    REJECT = "reject"
+    EVICT_OLDEST = "evict_oldest"
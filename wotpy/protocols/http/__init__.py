@@ -10,5 +10,6 @@ HTTP Protocol Binding implementation.
     wotpy.protocols.http.handlers
     wotpy.protocols.http.client
     wotpy.protocols.http.enums
+    wotpy.protocols.http.pool
     wotpy.protocols.http.server
 """
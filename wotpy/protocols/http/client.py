@@ -5,6 +5,7 @@
 Classes that contain the client logic for the HTTP protocol.
 """
 
+import codecs
 import json
 import logging
 import time
@@ -17,10 +18,14 @@ from rx import Observable
 from six.moves.urllib import parse
 from tornado.simple_httpclient import HTTPTimeoutError
 
+from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.exceptions import FormNotFoundException, ClientRequestTimeout
-from wotpy.protocols.http.enums import HTTPSchemes
+from wotpy.protocols.http.handlers.stream import SSE_EVENT_ERROR, parse_sse_message
+from wotpy.protocols.http.handlers.utils import build_prefer_wait_header
+from wotpy.protocols.http.enums import HTTPSchemes, HTTPSubprotocols
+from wotpy.protocols.http.pool import HTTPClientPool
 from wotpy.protocols.utils import is_scheme_form
 from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.events import EmittedEvent, PropertyChangeEmittedEvent, PropertyChangeEventInit
@@ -32,16 +37,36 @@ class HTTPClient(BaseProtocolClient):
     JSON_HEADERS = {"Content-Type": "application/json"}
     DEFAULT_CON_TIMEOUT = 60
     DEFAULT_REQ_TIMEOUT = 60
-
-    def __init__(self, connect_timeout=DEFAULT_CON_TIMEOUT, request_timeout=DEFAULT_REQ_TIMEOUT):
+    DEFAULT_MAX_CLIENTS = HTTPClientPool.DEFAULT_MAX_CLIENTS
+    DEFAULT_ACTION_WAIT = 10
+    INVOCATION_BACKOFF_MIN = 0.05
+    INVOCATION_BACKOFF_MAX = 2.0
+    STREAM_BACKOFF_MIN = INVOCATION_BACKOFF_MIN
+    STREAM_BACKOFF_MAX = INVOCATION_BACKOFF_MAX
+
+    def __init__(self, connect_timeout=DEFAULT_CON_TIMEOUT, request_timeout=DEFAULT_REQ_TIMEOUT,
+                 max_clients=DEFAULT_MAX_CLIENTS, max_clients_per_host=None, use_curl=False,
+                 action_wait=DEFAULT_ACTION_WAIT):
         self._connect_timeout = connect_timeout
         self._request_timeout = request_timeout
+        self._action_wait = action_wait
         self._logr = logging.getLogger(__name__)
+
+        # All requests share a pool of at most max_clients concurrent connections
+        # (max_clients_per_host to the same host). Connections are kept alive
+        # and reused if the curl transport is enabled with use_curl.
+
+        self._pool = HTTPClientPool(
+            max_clients=max_clients,
+            max_clients_per_host=max_clients_per_host,
+            use_curl=use_curl)
+
         super(HTTPClient, self).__init__()
 
     @classmethod
-    def pick_http_href(cls, td, forms, op=None):
-        """Picks the most appropriate HTTP form href from the given list of forms."""
+    def pick_http_href(cls, td, forms, op=None, subprotocol=None):
+        """Picks the most appropriate HTTP form href from the given list of forms.
+        Only the forms for the given subprotocol are considered if defined."""
 
         def is_op_form(form):
             try:
@@ -49,11 +74,14 @@ class HTTPClient(BaseProtocolClient):
             except TypeError:
                 return False
 
+        def is_subprotocol_form(form):
+            return subprotocol is None or form.subprotocol == subprotocol
+
         def find_href(scheme):
             try:
                 return next(
                     form.href for form in forms
-                    if is_scheme_form(form, td.base, scheme) and is_op_form(form))
+                    if is_scheme_form(form, td.base, scheme) and is_op_form(form) and is_subprotocol_form(form))
             except StopIteration:
                 return None
 
@@ -68,6 +96,13 @@ class HTTPClient(BaseProtocolClient):
 
         return Protocols.HTTP
 
+    @property
+    def stats(self):
+        """Dict with the utilization of the connection pool and
+        the time requests have been waiting for a free connection."""
+
+        return self._pool.stats
+
     @property
     def connect_timeout(self):
         """Returns the default connection timeout for all HTTP requests."""
@@ -93,14 +128,35 @@ class HTTPClient(BaseProtocolClient):
 
         return len(forms_http) > 0
 
+    @classmethod
+    def _parse_invocation_status(cls, status):
+        """Takes the status of an Action invocation and returns a tuple with a flag
+        indicating if the invocation is done and the result (or exception) to raise."""
+
+        if not status.get("done"):
+            return False, None
+
+        if status.get("error") is not None:
+            return True, Exception(status.get("error"))
+        else:
+            return True, tornado.gen.Return(status.get("result"))
+
     @tornado.gen.coroutine
     def invoke_action(self, td, name, input_value, timeout=None):
         """Invokes an Action on a remote Thing.
+        The server is asked to wait up to action_wait seconds and return the result in the
+        response. Slower invocations are checked afterwards with long-polling requests.
         Returns a Future."""
 
         con_timeout = timeout if timeout else self._connect_timeout
         req_timeout = timeout if timeout else self._request_timeout
 
+        # The server waits for at most half the request timeout
+        # to leave some margin for the response to arrive in time.
+
+        wait = min(self._action_wait, req_timeout / 2.0) if self._action_wait else None
+        headers_wait = build_prefer_wait_header(wait) if wait else {}
+
         now = time.time()
 
         href = self.pick_http_href(td, td.get_action_forms(name))
@@ -109,20 +165,29 @@ class HTTPClient(BaseProtocolClient):
             raise FormNotFoundException()
 
         body = json.dumps({"input": input_value})
-        http_client = tornado.httpclient.AsyncHTTPClient()
+
+        headers = dict(self.JSON_HEADERS)
+        headers.update(headers_wait)
 
         try:
             http_request = tornado.httpclient.HTTPRequest(
                 href, method="POST",
                 body=body,
-                headers=self.JSON_HEADERS,
+                headers=headers,
                 connect_timeout=con_timeout,
                 request_timeout=req_timeout)
         except HTTPTimeoutError:
             raise ClientRequestTimeout
 
-        response = yield http_client.fetch(http_request)
-        invocation_url = json.loads(response.body).get("invocation")
+        response = yield self._pool.fetch(http_request)
+        response_body = json.loads(response.body)
+
+        done, result = self._parse_invocation_status(response_body)
+
+        if done:
+            raise result
+
+        invocation_url = response_body.get("invocation")
 
         @tornado.gen.coroutine
         def check_invocation():
@@ -135,26 +200,21 @@ class HTTPClient(BaseProtocolClient):
 
             invoc_http_req = tornado.httpclient.HTTPRequest(
                 invoc_href, method="GET",
+                headers=headers_wait,
                 connect_timeout=con_timeout,
                 request_timeout=req_timeout)
 
             self._logr.debug("Checking invocation: {}".format(invocation_url))
 
             try:
-                invoc_res = yield http_client.fetch(invoc_http_req)
+                invoc_res = yield self._pool.fetch(invoc_http_req)
             except HTTPTimeoutError:
                 self._logr.debug("Timeout checking invocation: {}".format(invocation_url))
                 raise tornado.gen.Return((False, None))
 
-            status = json.loads(invoc_res.body)
+            raise tornado.gen.Return(self._parse_invocation_status(json.loads(invoc_res.body)))
 
-            if status.get("done") is False:
-                raise tornado.gen.Return((False, None))
-
-            if status.get("error") is not None:
-                raise tornado.gen.Return((True, Exception(status.get("error"))))
-            else:
-                raise tornado.gen.Return((True, tornado.gen.Return(status.get("result"))))
+        backoff = self.INVOCATION_BACKOFF_MIN
 
         while True:
             done, result = yield check_invocation()
@@ -164,6 +224,9 @@ class HTTPClient(BaseProtocolClient):
             elif timeout and (time.time() - now) > timeout:
                 raise ClientRequestTimeout
 
+            yield tornado.gen.sleep(backoff)
+            backoff = min(backoff * 2, self.INVOCATION_BACKOFF_MAX)
+
     @tornado.gen.coroutine
     def write_property(self, td, name, value, timeout=None):
         """Updates the value of a Property on a remote Thing.
@@ -177,7 +240,6 @@ class HTTPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        http_client = tornado.httpclient.AsyncHTTPClient()
         body = json.dumps({"value": value})
 
         try:
@@ -189,7 +251,7 @@ class HTTPClient(BaseProtocolClient):
         except HTTPTimeoutError:
             raise ClientRequestTimeout
 
-        yield http_client.fetch(http_request)
+        yield self._pool.fetch(http_request)
 
     @tornado.gen.coroutine
     def read_property(self, td, name, timeout=None):
@@ -204,8 +266,6 @@ class HTTPClient(BaseProtocolClient):
         if href is None:
             raise FormNotFoundException()
 
-        http_client = tornado.httpclient.AsyncHTTPClient()
-
         try:
             http_request = tornado.httpclient.HTTPRequest(
                 href, method="GET",
@@ -214,17 +274,164 @@ class HTTPClient(BaseProtocolClient):
         except HTTPTimeoutError:
             raise ClientRequestTimeout
 
-        response = yield http_client.fetch(http_request)
+        response = yield self._pool.fetch(http_request)
         result = json.loads(response.body)
         result = result.get("value", result)
 
         raise tornado.gen.Return(result)
 
+    @tornado.gen.coroutine
+    def read_properties(self, td, names=None, timeout=None):
+        """Reads the values of multiple Properties (all if names is undefined) on
+        a remote Thing with a single request to the Thing-level Form if available.
+        Returns a Future that resolves with a dict of Property names to values."""
+
+        op = InteractionVerbs.READ_ALL_PROPERTIES if names is None else InteractionVerbs.READ_MULTIPLE_PROPERTIES
+        href = self.pick_http_href(td, td.get_thing_forms(), op=op)
+
+        if href is None:
+            values = yield super(HTTPClient, self).read_properties(td, names=names, timeout=timeout)
+            raise tornado.gen.Return(values)
+
+        if names is not None:
+            href = "{}?{}".format(href, parse.urlencode([("name", name) for name in names]))
+
+        con_timeout = timeout if timeout else self._connect_timeout
+        req_timeout = timeout if timeout else self._request_timeout
+
+        try:
+            http_request = tornado.httpclient.HTTPRequest(
+                href, method="GET",
+                connect_timeout=con_timeout,
+                request_timeout=req_timeout)
+        except HTTPTimeoutError:
+            raise ClientRequestTimeout
+
+        response = yield self._pool.fetch(http_request)
+
+        raise tornado.gen.Return(json.loads(response.body).get("values"))
+
+    @tornado.gen.coroutine
+    def write_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing
+        with a single request to the Thing-level Form if available.
+        Returns a Future."""
+
+        href = self.pick_http_href(td, td.get_thing_forms(), op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        if href is None:
+            yield super(HTTPClient, self).write_properties(td, values, timeout=timeout)
+            return
+
+        con_timeout = timeout if timeout else self._connect_timeout
+        req_timeout = timeout if timeout else self._request_timeout
+
+        body = json.dumps({"values": values})
+
+        try:
+            http_request = tornado.httpclient.HTTPRequest(
+                href, method="PUT", body=body,
+                headers=self.JSON_HEADERS,
+                connect_timeout=con_timeout,
+                request_timeout=req_timeout)
+        except HTTPTimeoutError:
+            raise ClientRequestTimeout
+
+        yield self._pool.fetch(http_request)
+
+    def _build_stream_subscribe(self, href, next_item_builder):
+        """Builds the subscribe function that should be passed when constructing an
+        Observable to consume the Server-Sent Events stream in the given URL."""
+
+        def subscribe(observer):
+            """Subscription function that keeps a single request open and
+            passes each message in the stream to the Observer.
+            Streams ended by the server are reopened with an exponential backoff
+            that is reset each time a message is received.
+            The connection is closed as soon as the Observer unsubscribes."""
+
+            state = {"active": True, "close": None, "backoff": self.STREAM_BACKOFF_MIN}
+
+            def on_message(event, data):
+                state["backoff"] = self.STREAM_BACKOFF_MIN
+
+                if event == SSE_EVENT_ERROR:
+                    raise Exception(data.get("error"))
+
+                observer.on_next(next_item_builder(data))
+
+            @handle_observer_finalization(observer)
+            @tornado.gen.coroutine
+            def callback():
+                while state["active"]:
+                    buf = {"data": ""}
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+
+                    def streaming_callback(chunk):
+                        buf["data"] = (buf["data"] + decoder.decode(chunk)).replace("\r\n", "\n")
+                        raw_messages = buf["data"].split("\n\n")
+                        buf["data"] = raw_messages.pop()
+
+                        for raw_message in raw_messages:
+                            message = parse_sse_message(raw_message)
+                            message and on_message(*message)
+
+                    http_request = tornado.httpclient.HTTPRequest(
+                        href, method="GET",
+                        headers={"Accept": MediaTypes.EVENT_STREAM},
+                        connect_timeout=self._connect_timeout,
+                        request_timeout=0,
+                        streaming_callback=streaming_callback)
+
+                    future_response, state["close"] = self._pool.open_stream(http_request)
+
+                    try:
+                        yield future_response
+                    except Exception:
+                        if state["active"]:
+                            raise
+
+                    if not state["active"]:
+                        break
+
+                    self._logr.debug("Stream ended, reopening in {} s: {}".format(state["backoff"], href))
+
+                    yield tornado.gen.sleep(state["backoff"])
+                    state["backoff"] = min(state["backoff"] * 2, self.STREAM_BACKOFF_MAX)
+
+            def unsubscribe():
+                state["active"] = False
+
+                if state["close"] is not None:
+                    state["close"]()
+
+            tornado.ioloop.IOLoop.current().add_callback(callback)
+
+            return unsubscribe
+
+        return subscribe
+
     def on_event(self, td, name):
         """Subscribes to an event on a remote Thing.
+        The Server-Sent Events stream is consumed if available.
         Returns an Observable."""
 
-        href = self.pick_http_href(td, td.get_event_forms(name))
+        forms = td.get_event_forms(name)
+
+        href_stream = self.pick_http_href(
+            td, forms,
+            op=InteractionVerbs.SUBSCRIBE_EVENT,
+            subprotocol=HTTPSubprotocols.SSE)
+
+        if href_stream is not None:
+            subscribe = self._build_stream_subscribe(
+                href_stream,
+                lambda data: EmittedEvent(init=data.get("payload"), name=name))
+
+            # noinspection PyUnresolvedReferences
+            return Observable.create(subscribe)
+
+        href = self.pick_http_href(td, forms)
 
         if href is None:
             raise FormNotFoundException()
@@ -237,12 +444,11 @@ class HTTPClient(BaseProtocolClient):
             @handle_observer_finalization(observer)
             @tornado.gen.coroutine
             def callback():
-                http_client = tornado.httpclient.AsyncHTTPClient()
                 http_request = tornado.httpclient.HTTPRequest(href, method="GET")
 
                 while state["active"]:
                     try:
-                        response = yield http_client.fetch(http_request)
+                        response = yield self._pool.fetch(http_request)
                         payload = json.loads(response.body).get("payload")
                         observer.on_next(EmittedEvent(init=payload, name=name))
                     except HTTPTimeoutError:
@@ -260,9 +466,27 @@ class HTTPClient(BaseProtocolClient):
 
     def on_property_change(self, td, name):
         """Subscribes to property changes on a remote Thing.
+        The Server-Sent Events stream is consumed if available.
         Returns an Observable"""
 
-        href = self.pick_http_href(td, td.get_property_forms(name), op=InteractionVerbs.OBSERVE_PROPERTY)
+        forms = td.get_property_forms(name)
+
+        href_stream = self.pick_http_href(
+            td, forms,
+            op=InteractionVerbs.OBSERVE_PROPERTY,
+            subprotocol=HTTPSubprotocols.SSE)
+
+        if href_stream is not None:
+            def next_item_builder(data):
+                init = PropertyChangeEventInit(name=name, value=data.get("value"))
+                return PropertyChangeEmittedEvent(init=init)
+
+            subscribe = self._build_stream_subscribe(href_stream, next_item_builder)
+
+            # noinspection PyUnresolvedReferences
+            return Observable.create(subscribe)
+
+        href = self.pick_http_href(td, forms, op=InteractionVerbs.OBSERVE_PROPERTY)
 
         if href is None:
             raise FormNotFoundException()
@@ -275,12 +499,11 @@ class HTTPClient(BaseProtocolClient):
             @handle_observer_finalization(observer)
             @tornado.gen.coroutine
             def callback():
-                http_client = tornado.httpclient.AsyncHTTPClient()
                 http_request = tornado.httpclient.HTTPRequest(href, method="GET")
 
                 while state["active"]:
                     try:
-                        response = yield http_client.fetch(http_request)
+                        response = yield self._pool.fetch(http_request)
                         value = json.loads(response.body)
                         value = value.get("value", value)
                         init = PropertyChangeEventInit(name=name, value=value)
@@ -13,3 +13,10 @@ class HTTPSchemes(EnumListMixin):
 
     HTTP = "http"
     HTTPS = "https"
+
+
+class HTTPSubprotocols(EnumListMixin):
+    """Enumeration of the HTTP subprotocols used to observe Properties and Events."""
+
+    LONGPOLL = "longpoll"
+    SSE = "sse"
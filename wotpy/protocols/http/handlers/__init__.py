@@ -10,5 +10,6 @@ HTTP request handlers that implement each of the Interaction verbs.
     wotpy.protocols.http.handlers.action
     wotpy.protocols.http.handlers.event
     wotpy.protocols.http.handlers.property
+    wotpy.protocols.http.handlers.stream
     wotpy.protocols.http.handlers.utils
 """
@@ -5,17 +5,15 @@
 Request handler for Action interactions.
 """
 
+import datetime
 import logging
-import pprint
-import time
-import uuid
 
-import six
 import tornado.gen
 from tornado.web import HTTPError
 from tornado.web import RequestHandler
 
 import wotpy.protocols.http.handlers.utils as handler_utils
+from wotpy.protocols.invocations import InvocationRegistryFull
 
 
 # noinspection PyAbstractClass,PyAttributeOutsideInit
@@ -28,13 +26,40 @@ class ActionInvokeHandler(RequestHandler):
 
     @tornado.gen.coroutine
     def post(self, thing_name, name):
-        """Invokes the action and returns the invocation result."""
+        """Invokes the action and returns the invocation result if the action finishes
+        within the time the client is willing to wait (Prefer: wait header or wait argument).
+        Returns the URL to check the status of the pending invocation otherwise.
+        Responds with 503 without invoking the action if there are too many pending invocations."""
 
         exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+
+        try:
+            self._server.pending_actions.check_capacity()
+        except InvocationRegistryFull:
+            raise HTTPError(503, log_message="Too many pending invocations")
+
         input_value = handler_utils.get_argument(self, "input")
+        wait = handler_utils.get_wait_budget(self, self._server.action_max_wait)
         future_result = exposed_thing.actions[name].invoke(input_value)
-        invocation_id = uuid.uuid4().hex
-        self._server.pending_actions[invocation_id] = future_result
+
+        if wait is not None:
+            try:
+                result = yield tornado.gen.with_timeout(
+                    datetime.timedelta(seconds=wait), future_result,
+                    quiet_exceptions=(Exception,))
+                self.write({"done": True, "result": result})
+                return
+            except tornado.gen.TimeoutError:
+                pass
+            except Exception as ex:
+                self.write({"done": True, "error": str(ex)})
+                return
+
+        try:
+            invocation_id = self._server.pending_actions.add(future_result)
+        except InvocationRegistryFull:
+            raise HTTPError(503, log_message="Too many pending invocations")
+
         self.write({"invocation": "/invocation/{}".format(invocation_id)})
 
 
@@ -47,41 +72,28 @@ class PendingInvocationHandler(RequestHandler):
         self._server = http_server
         self._logr = logging.getLogger(__name__)
 
-    def _clean_expired(self):
-        """Removes the Action invocations that are expired and
-        have already been checked by at least one client."""
-
-        now = time.time()
-
-        expired_invocations = [
-            inv_id for inv_id, tstamp in six.iteritems(self._server.invocation_check_times)
-            if (now - tstamp) > self._server.action_ttl
-        ]
-
-        if len(expired_invocations):
-            self._logr.debug("Expired invocations: {}".format(pprint.pformat(expired_invocations)))
-
-        for invocation_id in expired_invocations:
-            self._server.invocation_check_times.pop(invocation_id)
-            fut_result = self._server.pending_actions.get(invocation_id, None)
-
-            if fut_result and fut_result.done():
-                self._logr.debug("Removing completed invocation Future: {}".format(invocation_id))
-                self._server.pending_actions.pop(invocation_id, None)
-
     @tornado.gen.coroutine
     def get(self, invocation_id):
-        """Checks and returns the status of the Future that represents an action invocation."""
+        """Checks and returns the status of the Future that represents an action invocation.
+        Waits for the invocation to finish for as long as the client is willing to wait
+        (Prefer: wait header or wait argument) or indefinitely if no budget is defined."""
+
+        future_result = self._server.pending_actions.get(invocation_id)
 
-        if invocation_id not in self._server.pending_actions:
+        if future_result is None:
             raise HTTPError(log_message="Unknown invocation: {}".format(invocation_id))
 
+        wait = handler_utils.get_wait_budget(self, self._server.action_max_wait)
+
         try:
-            result = yield self._server.pending_actions[invocation_id]
+            if wait is not None:
+                future_result = tornado.gen.with_timeout(
+                    datetime.timedelta(seconds=wait), future_result,
+                    quiet_exceptions=(Exception,))
+
+            result = yield future_result
             self.write({"done": True, "result": result})
+        except tornado.gen.TimeoutError:
+            self.write({"done": False})
         except Exception as ex:
             self.write({"done": True, "error": str(ex)})
-        finally:
-            self._logr.debug("Updating invocation check time: {}".format(invocation_id))
-            self._server.invocation_check_times[invocation_id] = time.time()
-            self._clean_expired()
@@ -9,7 +9,7 @@ import logging
 
 import tornado.gen
 from tornado.concurrent import Future
-from tornado.web import RequestHandler
+from tornado.web import RequestHandler, HTTPError
 
 import wotpy.protocols.http.handlers.utils as handler_utils
 
@@ -39,6 +39,50 @@ class PropertyReadWriteHandler(RequestHandler):
         yield exposed_thing.properties[name].write(value)
 
 
+# noinspection PyAbstractClass
+class PropertiesReadWriteHandler(RequestHandler):
+    """Handler for requests to get/set multiple Properties of a Thing at once."""
+
+    ARG_NAME = "name"
+
+    # noinspection PyMethodOverriding,PyAttributeOutsideInit
+    def initialize(self, http_server):
+        self._server = http_server
+
+    @classmethod
+    def _check_names(cls, exposed_thing, names):
+        """Raises a 400 HTTPError if any of the given names is not a Property of the Thing."""
+
+        unknown = [name for name in names if name not in exposed_thing.thing.properties]
+
+        if unknown:
+            raise HTTPError(400, log_message="Unknown Property: {}".format(", ".join(unknown)))
+
+    @tornado.gen.coroutine
+    def get(self, thing_name):
+        """Reads and returns the values of the Properties in the name query
+        arguments, or the values of all the Properties if there are none."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        names = self.get_query_arguments(self.ARG_NAME) or None
+        self._check_names(exposed_thing, names or [])
+        values = yield exposed_thing.read_properties(names)
+        self.write({"values": values})
+
+    @tornado.gen.coroutine
+    def put(self, thing_name):
+        """Updates the values of multiple Properties."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+        values = handler_utils.get_argument(self, "values")
+
+        if not isinstance(values, dict):
+            raise HTTPError(log_message="Not a JSON object: {}".format(values))
+
+        self._check_names(exposed_thing, values)
+        yield exposed_thing.write_properties(values)
+
+
 # noinspection PyAbstractClass,PyAttributeOutsideInit
 class PropertyObserverHandler(RequestHandler):
     """Handler for Property subscription requests."""
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Request handlers that stream Property updates and Event emissions as Server-Sent Events.
+"""
+
+import datetime
+import json
+import logging
+
+import six
+import tornado.gen
+import tornado.queues
+from tornado.iostream import StreamClosedError
+from tornado.web import RequestHandler
+
+import wotpy.protocols.http.handlers.utils as handler_utils
+from wotpy.codecs.enums import MediaTypes
+from wotpy.utils.utils import to_json_obj
+
+SSE_EVENT_PROPERTY = "property"
+SSE_EVENT_EVENT = "event"
+SSE_EVENT_ERROR = "error"
+
+
+def build_sse_message(event, data):
+    """Returns a Server-Sent Events message with the given event type and JSON data."""
+
+    return "event: {}\ndata: {}\n\n".format(event, json.dumps(data))
+
+
+def parse_sse_message(raw_message):
+    """Takes the raw text of a Server-Sent Events message and returns a tuple
+    with the event type and the parsed JSON data (None for comments)."""
+
+    event = "message"
+    data_lines = []
+
+    for line in raw_message.split("\n"):
+        field, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+
+        if field == "event":
+            event = value
+        elif field == "data":
+            data_lines.append(value)
+
+    if not data_lines:
+        return None
+
+    return event, json.loads("\n".join(data_lines))
+
+
+# noinspection PyAbstractClass,PyAttributeOutsideInit
+class BaseStreamHandler(RequestHandler):
+    """Base handler for requests that keep the subscriptions open and
+    send each item to the client as a Server-Sent Event (text/event-stream).
+    A comment line is sent periodically to detect closed connections."""
+
+    HEARTBEAT_SECS = 10
+
+    # noinspection PyMethodOverriding
+    def initialize(self, http_server):
+        self._server = http_server
+        self._logr = logging.getLogger(__name__)
+        self._messages = tornado.queues.Queue()
+        self._subscriptions = []
+        self._closed = False
+
+    def get_subscribers(self, exposed_thing, name):
+        """Returns a list of tuples with an interaction that can be subscribed to and
+        a function that builds the Server-Sent Event message for each of its items."""
+
+        raise NotImplementedError
+
+    def _subscribe(self, interaction, message_builder):
+        """Subscribes to the given interaction and enqueues its items as messages."""
+
+        def on_next(item):
+            self._messages.put_nowait(message_builder(item))
+
+        def on_error(err):
+            self._logr.warning("Error on subscription to {}: {}".format(interaction, err))
+            self._messages.put_nowait(build_sse_message(SSE_EVENT_ERROR, {"error": str(err)}))
+            self._messages.put_nowait(None)
+
+        self._subscriptions.append(interaction.subscribe(on_next=on_next, on_error=on_error))
+
+    @tornado.gen.coroutine
+    def get(self, thing_name, name=None):
+        """Subscribes to the interactions and streams the items until the client disconnects."""
+
+        exposed_thing = handler_utils.get_exposed_thing(self._server, thing_name)
+
+        for interaction, message_builder in self.get_subscribers(exposed_thing, name):
+            self._subscribe(interaction, message_builder)
+
+        self.set_header("Content-Type", MediaTypes.EVENT_STREAM)
+        self.set_header("Cache-Control", "no-cache")
+
+        timeout = datetime.timedelta(seconds=self.HEARTBEAT_SECS)
+
+        try:
+            yield self.flush()
+
+            while not self._closed:
+                try:
+                    messages = [(yield self._messages.get(timeout=timeout))]
+                except tornado.gen.TimeoutError:
+                    messages = [":\n\n"]
+
+                while self._messages.qsize():
+                    messages.append(self._messages.get_nowait())
+
+                for message in messages:
+                    if message is None:
+                        self._closed = True
+                        break
+
+                    self.write(message)
+
+                yield self.flush()
+        except StreamClosedError:
+            pass
+
+    def on_connection_close(self):
+        """Stops the stream when the client closes the connection."""
+
+        self._closed = True
+        self._messages.put_nowait(None)
+
+    def on_finish(self):
+        """Destroys the subscriptions when the request finishes."""
+
+        for subscription in self._subscriptions:
+            subscription.dispose()
+
+        self._subscriptions = []
+
+
+def _build_property_message(item):
+    """Builds the Server-Sent Event message for a Property update."""
+
+    return build_sse_message(SSE_EVENT_PROPERTY, {
+        "name": item.data.name,
+        "value": to_json_obj(item.data.value)
+    })
+
+
+def _build_event_message(item):
+    """Builds the Server-Sent Event message for an Event emission."""
+
+    return build_sse_message(SSE_EVENT_EVENT, {
+        "name": item.name,
+        "payload": to_json_obj(item.data)
+    })
+
+
+# noinspection PyAbstractClass
+class PropertyStreamHandler(BaseStreamHandler):
+    """Handler that streams the updates of a Property."""
+
+    def get_subscribers(self, exposed_thing, name):
+        return [(exposed_thing.properties[name], _build_property_message)]
+
+
+# noinspection PyAbstractClass
+class EventStreamHandler(BaseStreamHandler):
+    """Handler that streams the emissions of an Event."""
+
+    def get_subscribers(self, exposed_thing, name):
+        return [(exposed_thing.events[name], _build_event_message)]
+
+
+# noinspection PyAbstractClass
+class ThingStreamHandler(BaseStreamHandler):
+    """Handler that streams the updates of all observable
+    Properties and the emissions of all Events of a Thing."""
+
+    def get_subscribers(self, exposed_thing, name):
+        props = [
+            (exposed_thing.properties[prop_name], _build_property_message)
+            for prop_name, prop in six.iteritems(exposed_thing.thing.properties)
+            if prop.observable
+        ]
+
+        events = [
+            (exposed_thing.events[event_name], _build_event_message)
+            for event_name in six.iterkeys(exposed_thing.thing.events)
+        ]
+
+        return props + events
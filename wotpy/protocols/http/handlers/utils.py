@@ -6,10 +6,14 @@ Request handler for Property interactions.
 """
 
 import json
+import math
 
 from tornado.web import HTTPError
 
 APPLICATION_JSON = "application/json"
+HEADER_PREFER = "Prefer"
+PREFER_WAIT = "wait"
+ARG_WAIT = "wait"
 
 
 def get_exposed_thing(server, thing_name):
@@ -39,3 +43,37 @@ def get_argument(req_handler, name, default=None):
         raise HTTPError(log_message="Not a JSON object: {}".format(parsed_body))
 
     return parsed_body.get(name, default)
+
+
+def build_prefer_wait_header(wait_secs):
+    """Returns the headers to ask the server to wait up to the given
+    time (s) for a result before responding (RFC 7240 Prefer: wait)."""
+
+    return {HEADER_PREFER: "{}={}".format(PREFER_WAIT, wait_secs)}
+
+
+def get_wait_budget(req_handler, max_wait):
+    """Returns the time (s) that the client is willing to wait for a result, limited to max_wait.
+    It is read from the Prefer: wait header or the wait query argument.
+    Returns None if the client did not define a valid (positive, finite or infinite) budget."""
+
+    wait = req_handler.get_query_argument(ARG_WAIT, None)
+
+    for pref in req_handler.request.headers.get(HEADER_PREFER, "").split(","):
+        pref_name, _, pref_value = pref.strip().partition("=")
+
+        if pref_name.strip().lower() == PREFER_WAIT:
+            wait = pref_value.strip()
+
+    try:
+        wait = float(wait)
+    except (TypeError, ValueError):
+        return None
+
+    if math.isnan(wait) or wait <= 0:
+        return None
+
+    if math.isinf(wait):
+        return max_wait
+
+    return min(wait, max_wait)
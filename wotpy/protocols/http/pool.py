@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Connection pool shared by all the requests of the HTTP binding client.
+"""
+
+import collections
+import time
+
+import tornado.concurrent
+import tornado.gen
+import tornado.httpclient
+import tornado.ioloop
+import tornado.locks
+from six.moves.urllib import parse
+from tornado.simple_httpclient import SimpleAsyncHTTPClient
+from tornado.tcpclient import TCPClient
+
+from wotpy.protocols.exceptions import ClientRequestTimeout
+
+
+class _StreamTCPClient(TCPClient):
+    """TCP client that keeps the streams it connects so that they can be closed on demand."""
+
+    def __init__(self, *args, **kwargs):
+        super(_StreamTCPClient, self).__init__(*args, **kwargs)
+        self._streams = []
+        self._closed = False
+
+    @tornado.gen.coroutine
+    def connect(self, *args, **kwargs):
+        stream = yield super(_StreamTCPClient, self).connect(*args, **kwargs)
+        self._streams.append(stream)
+
+        if self._closed:
+            stream.close()
+
+        raise tornado.gen.Return(stream)
+
+    def close(self):
+        """Closes the streams that have been connected by this client."""
+
+        super(_StreamTCPClient, self).close()
+        self._closed = True
+        [stream.close() for stream in self._streams]
+
+
+class HTTPClientPool(object):
+    """Pool of HTTP connections that limits the number of concurrent requests,
+    both overall and per host, and keeps counters of the pool utilization
+    and the time requests spend waiting for a free connection.
+
+    The simple Tornado transport opens a new connection for each request,
+    while the curl transport (enabled with use_curl and requiring pycurl)
+    keeps connections alive and reuses them for subsequent requests."""
+
+    DEFAULT_MAX_CLIENTS = 100
+
+    def __init__(self, max_clients=DEFAULT_MAX_CLIENTS, max_clients_per_host=None, use_curl=False):
+        self._max_clients = max_clients
+        self._max_clients_per_host = max_clients_per_host
+        self._use_curl = use_curl
+        self._semaphore = tornado.locks.Semaphore(max_clients)
+        self._semaphores_host = {}
+        self._http_client = None
+        self._http_client_loop = None
+        self._active = 0
+        self._active_hosts = collections.Counter()
+        self._queued = 0
+        self._requests = 0
+        self._queue_timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._streams = 0
+
+    @property
+    def max_clients(self):
+        """Maximum number of concurrent requests."""
+
+        return self._max_clients
+
+    @property
+    def max_clients_per_host(self):
+        """Maximum number of concurrent requests to the same host (None if unlimited)."""
+
+        return self._max_clients_per_host
+
+    @property
+    def stats(self):
+        """Dict with the utilization of the pool and the time (s)
+        that requests have been waiting for a free connection."""
+
+        return {
+            "max_clients": self._max_clients,
+            "max_clients_per_host": self._max_clients_per_host,
+            "active": self._active,
+            "active_hosts": dict(self._active_hosts),
+            "queued": self._queued,
+            "utilization": float(self._active) / self._max_clients,
+            "requests": self._requests,
+            "queue_timeouts": self._queue_timeouts,
+            "wait_total": self._wait_total,
+            "wait_max": self._wait_max,
+            "wait_mean": self._wait_total / self._requests if self._requests else 0.0,
+            "streams": self._streams
+        }
+
+    @property
+    def http_client(self):
+        """Tornado HTTP client that is used by this pool in the current IOLoop.
+        Its own queue is sized to the pool so that requests are never queued twice.
+        The client of the previous IOLoop is closed when the IOLoop changes."""
+
+        io_loop = tornado.ioloop.IOLoop.current()
+
+        if self._http_client is not None and self._http_client_loop is io_loop:
+            return self._http_client
+
+        if self._http_client is not None:
+            self._http_client.close()
+
+        if self._use_curl:
+            # noinspection PyPackageRequirements
+            from tornado.curl_httpclient import CurlAsyncHTTPClient as client_cls
+        else:
+            client_cls = tornado.httpclient.AsyncHTTPClient
+
+        self._http_client = client_cls(force_instance=True, max_clients=self._max_clients)
+        self._http_client_loop = io_loop
+
+        return self._http_client
+
+    def _get_semaphores(self, host):
+        """Returns the list of semaphores that should be acquired to send a request to the given host."""
+
+        if self._max_clients_per_host is None:
+            return [self._semaphore]
+
+        if host not in self._semaphores_host:
+            self._semaphores_host[host] = tornado.locks.Semaphore(self._max_clients_per_host)
+
+        return [self._semaphores_host[host], self._semaphore]
+
+    @classmethod
+    def _get_queue_timeout(cls, request):
+        """Returns the maximum time (s) that the given request may wait in the queue."""
+
+        timeouts = [
+            item for item in (request.connect_timeout, request.request_timeout)
+            if item
+        ]
+
+        return min(timeouts) if timeouts else None
+
+    @tornado.gen.coroutine
+    def _acquire(self, host, timeout):
+        """Waits for a free connection to the given host.
+        Raises ClientRequestTimeout if the wait is longer than the timeout."""
+
+        deadline = None if timeout is None else tornado.ioloop.IOLoop.current().time() + timeout
+        acquired = []
+
+        try:
+            for semaphore in self._get_semaphores(host):
+                yield semaphore.acquire(timeout=deadline)
+                acquired.append(semaphore)
+        except tornado.gen.TimeoutError:
+            self._queue_timeouts += 1
+            [semaphore.release() for semaphore in acquired]
+            raise ClientRequestTimeout
+
+        raise tornado.gen.Return(acquired)
+
+    @tornado.gen.coroutine
+    def fetch(self, request):
+        """Sends the given HTTPRequest when a connection is available.
+        Returns a Future that resolves to the HTTPResponse."""
+
+        host = parse.urlparse(request.url).netloc
+        time_start = time.time()
+
+        self._queued += 1
+
+        try:
+            acquired = yield self._acquire(host, self._get_queue_timeout(request))
+        finally:
+            self._queued -= 1
+
+        time_wait = time.time() - time_start
+
+        self._requests += 1
+        self._wait_total += time_wait
+        self._wait_max = max(self._wait_max, time_wait)
+        self._active += 1
+        self._active_hosts[host] += 1
+
+        try:
+            response = yield self.http_client.fetch(request)
+        finally:
+            self._active -= 1
+            self._active_hosts[host] -= 1
+
+            if not self._active_hosts[host]:
+                del self._active_hosts[host]
+
+            [semaphore.release() for semaphore in acquired]
+
+        raise tornado.gen.Return(response)
+
+    def open_stream(self, request):
+        """Sends the given request (that should define a streaming_callback) on a dedicated
+        connection that is not limited by the pool, given that it stays open for as long as
+        the stream is consumed. Returns a tuple with the Future that resolves to the
+        HTTPResponse and a function that closes the connection right away."""
+
+        http_client = SimpleAsyncHTTPClient(force_instance=True)
+        tcp_client = _StreamTCPClient(resolver=http_client.resolver)
+        http_client.tcp_client.close()
+        http_client.tcp_client = tcp_client
+
+        state = {"open": True}
+
+        def close():
+            if not state["open"]:
+                return
+
+            state["open"] = False
+            self._streams -= 1
+            tcp_client.close()
+            http_client.close()
+
+        self._streams += 1
+        future_response = http_client.fetch(request)
+
+        # noinspection PyUnusedLocal
+        def on_done(fut):
+            close()
+
+        tornado.concurrent.future_add_done_callback(future_response, on_done)
+
+        return future_response, close
+
+    def close(self):
+        """Closes the underlying HTTP client and its connections."""
+
+        if self._http_client is not None:
+            self._http_client.close()
+
+        self._http_client = None
+        self._http_client_loop = None
@@ -11,10 +11,15 @@ import tornado.web
 
 from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.enums import Protocols, InteractionVerbs
-from wotpy.protocols.http.enums import HTTPSchemes
+from wotpy.protocols.http.enums import HTTPSchemes, HTTPSubprotocols
 from wotpy.protocols.http.handlers.action import ActionInvokeHandler, PendingInvocationHandler
 from wotpy.protocols.http.handlers.event import EventObserverHandler
-from wotpy.protocols.http.handlers.property import PropertyObserverHandler, PropertyReadWriteHandler
+from wotpy.protocols.http.handlers.property import \
+    PropertyObserverHandler, \
+    PropertyReadWriteHandler, \
+    PropertiesReadWriteHandler
+from wotpy.protocols.http.handlers.stream import EventStreamHandler, PropertyStreamHandler, ThingStreamHandler
+from wotpy.protocols.invocations import InvocationRegistry
 from wotpy.protocols.server import BaseProtocolServer
 from wotpy.wot.enums import InteractionTypes
 from wotpy.wot.form import Form
@@ -24,15 +29,21 @@ class HTTPServer(BaseProtocolServer):
     """HTTP binding server implementation."""
 
     DEFAULT_PORT = 80
+    DEFAULT_ACTION_MAX_WAIT_SECS = 30
 
-    def __init__(self, port=DEFAULT_PORT, ssl_context=None, action_ttl_secs=300):
+    def __init__(self, port=DEFAULT_PORT, ssl_context=None, action_ttl_secs=300,
+                 action_max_wait_secs=DEFAULT_ACTION_MAX_WAIT_SECS,
+                 action_max_pending=InvocationRegistry.DEFAULT_MAX_SIZE,
+                 action_overflow_policy=None):
         super(HTTPServer, self).__init__(port=port)
         self._server = None
         self._app = self._build_app()
         self._ssl_context = ssl_context
-        self._action_ttl_secs = action_ttl_secs
-        self._pending_actions = {}
-        self._invocation_check_times = {}
+        self._action_max_wait_secs = action_max_wait_secs
+        self._pending_actions = InvocationRegistry(
+            ttl_secs=action_ttl_secs,
+            max_size=action_max_pending,
+            overflow_policy=action_overflow_policy)
 
     @property
     def protocol(self):
@@ -61,21 +72,28 @@ class HTTPServer(BaseProtocolServer):
 
     @property
     def action_ttl(self):
-        """Returns the Action invocations Time-To-Live (seconds)."""
+        """Returns the Time-To-Live (seconds) of completed Action invocations."""
 
-        return self._action_ttl_secs
+        return self._pending_actions.ttl
+
+    @property
+    def action_max_wait(self):
+        """Returns the maximum time (seconds) that the server waits for an Action
+        invocation to finish before responding, regardless of the client budget."""
+
+        return self._action_max_wait_secs
 
     @property
     def pending_actions(self):
-        """Dict of pending action invocations represented as Futures."""
+        """Registry of pending action invocations represented as Futures."""
 
         return self._pending_actions
 
     @property
-    def invocation_check_times(self):
-        """Dict that contains the timestamp of the last time an invocation was checked by a client.."""
+    def stats(self):
+        """Dict with the gauges of the pending Action invocations registry."""
 
-        return self._invocation_check_times
+        return {"invocations": self._pending_actions.stats}
 
     def _build_app(self):
         """Builds and returns the Tornado application for the WebSockets server."""
@@ -88,6 +106,10 @@ class HTTPServer(BaseProtocolServer):
             r"/(?P<thing_name>[^\/]+)/property/(?P<name>[^\/]+)/subscription",
             PropertyObserverHandler,
             {"http_server": self}
+        ), (
+            r"/(?P<thing_name>[^\/]+)/property/(?P<name>[^\/]+)/stream",
+            PropertyStreamHandler,
+            {"http_server": self}
         ), (
             r"/(?P<thing_name>[^\/]+)/action/(?P<name>[^\/]+)",
             ActionInvokeHandler,
@@ -100,6 +122,18 @@ class HTTPServer(BaseProtocolServer):
             r"/(?P<thing_name>[^\/]+)/event/(?P<name>[^\/]+)/subscription",
             EventObserverHandler,
             {"http_server": self}
+        ), (
+            r"/(?P<thing_name>[^\/]+)/event/(?P<name>[^\/]+)/stream",
+            EventStreamHandler,
+            {"http_server": self}
+        ), (
+            r"/(?P<thing_name>[^\/]+)/properties",
+            PropertiesReadWriteHandler,
+            {"http_server": self}
+        ), (
+            r"/(?P<thing_name>[^\/]+)/stream",
+            ThingStreamHandler,
+            {"http_server": self}
         )])
 
     def _build_forms_property(self, proprty, hostname):
@@ -123,9 +157,20 @@ class HTTPServer(BaseProtocolServer):
             protocol=self.protocol,
             href=href_observe,
             content_type=MediaTypes.JSON,
-            op=[InteractionVerbs.OBSERVE_PROPERTY])
+            op=[InteractionVerbs.OBSERVE_PROPERTY],
+            subprotocol=HTTPSubprotocols.LONGPOLL)
 
-        return [form_read_write, form_observe]
+        href_stream = "{}/stream".format(href_read_write)
+
+        form_stream = Form(
+            interaction=proprty,
+            protocol=self.protocol,
+            href=href_stream,
+            content_type=MediaTypes.EVENT_STREAM,
+            op=[InteractionVerbs.OBSERVE_PROPERTY],
+            subprotocol=HTTPSubprotocols.SSE)
+
+        return [form_read_write, form_observe, form_stream]
 
     def _build_forms_action(self, action, hostname):
         """Builds and returns the HTTP Form instances for the given Action interaction."""
@@ -146,18 +191,27 @@ class HTTPServer(BaseProtocolServer):
     def _build_forms_event(self, event, hostname):
         """Builds and returns the HTTP Form instances for the given Event interaction."""
 
-        href_observe = "{}://{}:{}/{}/event/{}/subscription".format(
+        href_event = "{}://{}:{}/{}/event/{}".format(
             self.scheme, hostname.rstrip("/").lstrip("/"), self.port,
             event.thing.url_name, event.url_name)
 
         form_observe = Form(
             interaction=event,
             protocol=self.protocol,
-            href=href_observe,
+            href="{}/subscription".format(href_event),
             content_type=MediaTypes.JSON,
-            op=[InteractionVerbs.SUBSCRIBE_EVENT])
+            op=[InteractionVerbs.SUBSCRIBE_EVENT],
+            subprotocol=HTTPSubprotocols.LONGPOLL)
 
-        return [form_observe]
+        form_stream = Form(
+            interaction=event,
+            protocol=self.protocol,
+            href="{}/stream".format(href_event),
+            content_type=MediaTypes.EVENT_STREAM,
+            op=[InteractionVerbs.SUBSCRIBE_EVENT],
+            subprotocol=HTTPSubprotocols.SSE)
+
+        return [form_observe, form_stream]
 
     def build_forms(self, hostname, interaction):
         """Builds and returns a list with all Form that are
@@ -174,6 +228,37 @@ class HTTPServer(BaseProtocolServer):
 
         return intrct_type_map[interaction.interaction_type](interaction, hostname)
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns a list with all Form that are linked to this server
+        for the operations that apply to the whole Thing (e.g. readallproperties)."""
+
+        href_properties = "{}://{}:{}/{}/properties".format(
+            self.scheme, hostname.rstrip("/").lstrip("/"),
+            self.port, thing.url_name)
+
+        form_properties = Form(
+            interaction=None,
+            protocol=self.protocol,
+            href=href_properties,
+            content_type=MediaTypes.JSON,
+            op=[
+                InteractionVerbs.READ_ALL_PROPERTIES,
+                InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+            ])
+
+        form_stream = Form(
+            interaction=None,
+            protocol=self.protocol,
+            href="{}://{}:{}/{}/stream".format(
+                self.scheme, hostname.rstrip("/").lstrip("/"),
+                self.port, thing.url_name),
+            content_type=MediaTypes.EVENT_STREAM,
+            op=[InteractionVerbs.OBSERVE_PROPERTY, InteractionVerbs.SUBSCRIBE_EVENT],
+            subprotocol=HTTPSubprotocols.SSE)
+
+        return [form_properties, form_stream]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
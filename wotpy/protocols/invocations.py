@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Registry of the pending Action invocations that clients check asynchronously.
+"""
+
+import collections
+import uuid
+
+import tornado.concurrent
+import tornado.ioloop
+
+from wotpy.protocols.enums import InvocationOverflowPolicies
+
+
+class InvocationRegistryFull(Exception):
+    """Exception raised when an invocation is added to a full registry with the reject policy."""
+
+    pass
+
+
+class InvocationRegistry(object):
+    """Registry of the Futures of Action invocations indexed by invocation ID.
+
+    Invocations expire once the TTL has elapsed since they were completed,
+    regardless of whether a client ever checked them. All invocations share the
+    same TTL, so completed invocations are appended to a FIFO in expiry order and
+    a single timeout armed for the earliest deadline removes them in O(1) each.
+    The number of invocations is capped and the overflow policy decides whether
+    new invocations are rejected or the oldest invocations are evicted."""
+
+    DEFAULT_TTL_SECS = 300
+    DEFAULT_MAX_SIZE = 10000
+    DEFAULT_OVERFLOW_POLICY = InvocationOverflowPolicies.REJECT
+
+    def __init__(self, ttl_secs=DEFAULT_TTL_SECS, max_size=DEFAULT_MAX_SIZE, overflow_policy=None):
+        overflow_policy = self.DEFAULT_OVERFLOW_POLICY if overflow_policy is None else overflow_policy
+        assert max_size is None or max_size > 0
+        assert overflow_policy in InvocationOverflowPolicies.list()
+        self._ttl_secs = ttl_secs
+        self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        self._invocations = collections.OrderedDict()
+        self._expiry = collections.deque()
+        self._timer = None
+        self._timer_loop = None
+        self._completed = set()
+        self._expired = 0
+        self._evicted = 0
+        self._rejected = 0
+
+    @property
+    def ttl(self):
+        """Time (s) that completed invocations are kept in the registry."""
+
+        return self._ttl_secs
+
+    @property
+    def max_size(self):
+        """Maximum number of invocations in the registry (None if unlimited)."""
+
+        return self._max_size
+
+    @property
+    def overflow_policy(self):
+        """Policy applied when an invocation is added to a full registry.
+        A member of the InvocationOverflowPolicies enum."""
+
+        return self._overflow_policy
+
+    @property
+    def stats(self):
+        """Dict with the size of the registry and the counters of removed invocations."""
+
+        return {
+            "size": len(self._invocations),
+            "max_size": self._max_size,
+            "pending": len(self._invocations) - len(self._completed),
+            "completed": len(self._completed),
+            "expired": self._expired,
+            "evicted": self._evicted,
+            "rejected": self._rejected
+        }
+
+    def __len__(self):
+        return len(self._invocations)
+
+    def __contains__(self, invocation_id):
+        return invocation_id in self._invocations
+
+    def __getitem__(self, invocation_id):
+        return self._invocations[invocation_id]
+
+    def get(self, invocation_id, default=None):
+        """Returns the Future of the given invocation or the default if it does not exist."""
+
+        return self._invocations.get(invocation_id, default)
+
+    def full(self):
+        """Returns True if the registry has reached its maximum size."""
+
+        return self._max_size is not None and len(self._invocations) >= self._max_size
+
+    def check_capacity(self):
+        """Raises InvocationRegistryFull if a new invocation would be rejected right now.
+        Allows rejecting a request before the Action is actually invoked."""
+
+        self._remove_expired()
+
+        if self.full() and self._overflow_policy == InvocationOverflowPolicies.REJECT:
+            self._rejected += 1
+            raise InvocationRegistryFull("Too many pending invocations")
+
+    def add(self, future):
+        """Adds the Future of a new Action invocation and returns the invocation ID.
+        Raises InvocationRegistryFull if the registry is full and the policy is reject."""
+
+        self.check_capacity()
+
+        if self.full():
+            self._remove(next(iter(self._invocations)))
+            self._evicted += 1
+
+        invocation_id = uuid.uuid4().hex
+        self._invocations[invocation_id] = future
+
+        # noinspection PyUnusedLocal
+        def on_done(fut):
+            self._on_done(invocation_id, fut)
+
+        tornado.concurrent.future_add_done_callback(future, on_done)
+
+        return invocation_id
+
+    def remove(self, invocation_id):
+        """Removes the given invocation from the registry."""
+
+        if invocation_id in self._invocations:
+            self._remove(invocation_id)
+
+    def _remove(self, invocation_id):
+        """Removes an invocation that is known to be in the registry."""
+
+        self._invocations.pop(invocation_id)
+        self._completed.discard(invocation_id)
+
+    def _on_done(self, invocation_id, future):
+        """Starts the TTL of an invocation once it has been completed."""
+
+        if self._invocations.get(invocation_id) is not future:
+            return
+
+        self._completed.add(invocation_id)
+        deadline = tornado.ioloop.IOLoop.current().time() + self._ttl_secs
+        self._expiry.append((deadline, invocation_id, future))
+        self._schedule()
+
+    def _remove_expired(self):
+        """Removes the completed invocations whose TTL has elapsed."""
+
+        now = tornado.ioloop.IOLoop.current().time()
+
+        while self._expiry and self._expiry[0][0] <= now:
+            _, invocation_id, future = self._expiry.popleft()
+
+            if self._invocations.get(invocation_id) is future:
+                self._remove(invocation_id)
+                self._expired += 1
+
+    def _schedule(self):
+        """Arms the timeout that removes the invocation with the earliest deadline
+        (unless it is already armed in the current IOLoop)."""
+
+        io_loop = tornado.ioloop.IOLoop.current()
+
+        if not self._expiry or (self._timer is not None and self._timer_loop is io_loop):
+            return
+
+        def on_timeout():
+            self._timer = None
+            self._remove_expired()
+            self._schedule()
+
+        self._timer = io_loop.call_at(self._expiry[0][0], on_timeout)
+        self._timer_loop = io_loop
@@ -27,18 +27,27 @@ from wotpy.protocols.client import BaseProtocolClient
 from wotpy.protocols.enums import InteractionVerbs, Protocols
 from wotpy.protocols.exceptions import (ClientRequestTimeout,
                                         FormNotFoundException)
-from wotpy.protocols.mqtt.enums import MQTTSchemes
+from wotpy.protocols.mqtt.enums import MQTTSchemes, MQTTVocabularyKeys
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
 from wotpy.protocols.mqtt.handlers.property import PropertyMQTTHandler
 from wotpy.protocols.refs import ConnRefCounter
 from wotpy.protocols.utils import is_scheme_form
-from wotpy.utils.utils import handle_observer_finalization
 from wotpy.wot.events import (EmittedEvent, PropertyChangeEmittedEvent,
                               PropertyChangeEventInit)
 
 
 class MQTTClient(BaseProtocolClient):
-    """Implementation of the protocol client interface for the MQTT protocol."""
+    """Implementation of the protocol client interface for the MQTT protocol.
+    Requests that expect a response register a Future in a pending table keyed
+    by broker, topic and correlation ID (the action invocation ID or the write ACK).
+    Futures are resolved directly by the message delivery loop.
+    Observations reuse the same broker connection: each topic is subscribed once
+    and the delivery loop passes the messages to the observers of the topic.
+    Connection lifecycle changes are serialized with a lock per broker, while
+    publications and subscriptions on established connections do not lock.
+    If a property cache max-age is given, Property reads subscribe once to the
+    Property updates topic (which may contain retained messages published by the
+    server) and are served from the latest received value while it is fresh enough."""
 
     DELIVER_TERMINATE_LOOP_SLEEP_SECS = 0.1
     SLEEP_SECS_DELIVER_ERR = 1.0
@@ -62,19 +71,24 @@ class MQTTClient(BaseProtocolClient):
                  msg_ttl_secs=DEFAULT_MSG_TTL_SECS,
                  timeout_default=None,
                  hbmqtt_config=None,
-                 stop_loop_timeout_secs=DEFAULT_STOP_LOOP_TIMEOUT_SECS):
+                 stop_loop_timeout_secs=DEFAULT_STOP_LOOP_TIMEOUT_SECS,
+                 property_cache_max_age_secs=None):
         self._deliver_timeout_secs = deliver_timeout_secs
         self._msg_wait_timeout_secs = msg_wait_timeout_secs
         self._msg_ttl_secs = msg_ttl_secs
         self._timeout_default = timeout_default
         self._hbmqtt_config = hbmqtt_config
         self._stop_loop_timeout_secs = stop_loop_timeout_secs
-        self._lock_client = tornado.locks.Lock()
+        self._broker_locks = {}
         self._deliver_stop_events = {}
-        self._msg_conditions = {}
         self._clients = {}
-        self._messages = {}
+        self._pending = {}
+        self._observers = {}
         self._topics = {}
+        self._subscriptions = {}
+        self._property_cache_max_age_secs = property_cache_max_age_secs
+        self._property_cache = {}
+        self._property_cache_ref_id = uuid.uuid4().hex
         self._ref_counter = ConnRefCounter()
         self._logr = logging.getLogger(__name__)
 
@@ -92,26 +106,122 @@ class MQTTClient(BaseProtocolClient):
 
         return config
 
+    def _broker_lock(self, broker_url):
+        """Returns the lock that serializes the connection lifecycle changes for the given broker."""
+
+        if broker_url not in self._broker_locks:
+            self._broker_locks[broker_url] = tornado.locks.Lock()
+
+        return self._broker_locks[broker_url]
+
+    def _add_pending(self, broker_url, topic, field=None, value=None):
+        """Registers a Future that will be resolved with the data of the next message
+        in the topic whose correlation field matches the given value. If no field is given
+        the Future is resolved with the next message in the topic.
+        Returns a tuple with the key of the pending item and the Future."""
+
+        if broker_url not in self._pending:
+            self._pending[broker_url] = {}
+
+        if topic not in self._pending[broker_url]:
+            self._pending[broker_url][topic] = {"field": field, "futures": {}}
+
+        pending_topic = self._pending[broker_url][topic]
+
+        assert pending_topic["field"] == field, "Unexpected correlation field"
+
+        key = value if field is not None else uuid.uuid4().hex
+        future = tornado.concurrent.Future()
+        pending_topic["futures"][key] = future
+
+        return key, future
+
+    def _remove_pending(self, broker_url, topic, key):
+        """Removes an item from the pending table."""
+
+        pending_topic = self._pending.get(broker_url, {}).get(topic, None)
+
+        if pending_topic is None:
+            return
+
+        pending_topic["futures"].pop(key, None)
+
+        if not len(pending_topic["futures"]):
+            self._pending[broker_url].pop(topic)
+
+    @tornado.gen.coroutine
+    def _wait_pending(self, future, timeout=None):
+        """Waits for a pending Future to be resolved and returns its result.
+        Raises ClientRequestTimeout if the timeout expires."""
+
+        try:
+            if timeout:
+                result = yield tornado.gen.with_timeout(datetime.timedelta(seconds=timeout), future)
+            else:
+                result = yield future
+        except tornado.gen.TimeoutError:
+            raise ClientRequestTimeout
+
+        raise tornado.gen.Return(result)
+
+    def _add_observer(self, broker_url, topic, observer_id, callback):
+        """Adds a callback that is called with the data of each message in the topic."""
+
+        if broker_url not in self._observers:
+            self._observers[broker_url] = {}
+
+        if topic not in self._observers[broker_url]:
+            self._observers[broker_url][topic] = {}
+
+        self._observers[broker_url][topic][observer_id] = callback
+
+    def _remove_observer(self, broker_url, topic, observer_id):
+        """Removes an observer callback. Returns True if the
+        topic does not have any more observers afterwards."""
+
+        observers = self._observers.get(broker_url, {}).get(topic, None)
+
+        if observers is None or observer_id not in observers:
+            return False
+
+        observers.pop(observer_id)
+
+        if len(observers):
+            return False
+
+        self._observers[broker_url].pop(topic)
+
+        return True
+
     def _new_message(self, broker_url, msg):
-        """Adds the message to the internal queue and notifies all topic listeners."""
+        """Passes the given message to the observers of the topic and resolves the
+        pending requests that are waiting for it. Other messages are discarded."""
 
-        assert broker_url in self._msg_conditions, "Unknown broker in conditions"
-        assert msg.topic in self._msg_conditions[broker_url], "Unknown topic"
+        observers = self._observers.get(broker_url, {}).get(msg.topic, None)
+        pending_topic = self._pending.get(broker_url, {}).get(msg.topic, None)
 
-        if broker_url not in self._messages:
-            self._messages[broker_url] = {}
+        if observers is None and pending_topic is None:
+            return
 
-        if msg.topic not in self._messages[broker_url]:
-            self._messages[broker_url][msg.topic] = []
+        data = json.loads(msg.data.decode())
 
-        self._messages[broker_url][msg.topic].append({
-            "id": uuid.uuid4().hex,
-            "data": json.loads(msg.data.decode()),
-            "time": time.time()
-        })
+        for callback in list(observers.values()) if observers else []:
+            callback(data)
 
-        self._msg_conditions[broker_url][msg.topic].notify_all()
-        self._clean_messages(broker_url)
+        if pending_topic is None:
+            return
+
+        field = pending_topic["field"]
+
+        if field is None:
+            futures = list(pending_topic["futures"].values())
+        else:
+            future = pending_topic["futures"].get(data.get(field), None)
+            futures = [future] if future is not None else []
+
+        for future in futures:
+            if not future.done():
+                future.set_result(data)
 
     @tornado.gen.coroutine
     def _reconnect_client(self, broker_url):
@@ -123,7 +233,7 @@ class MQTTClient(BaseProtocolClient):
 
         yield self._clients[broker_url].reconnect(cleansession=False)
 
-        topics = self._topics.get(broker_url, set())
+        topics = self._topics.get(broker_url, {})
 
         if not len(topics):
             return
@@ -131,10 +241,10 @@ class MQTTClient(BaseProtocolClient):
         self._logr.info("Resubscribing MQTT client on {} to topics:\n{}".format(
             broker_url, pprint.pformat(topics)))
 
-        yield self._clients[broker_url].subscribe([(topic, qos) for topic, qos in topics])
+        yield self._clients[broker_url].subscribe([(topic, qos) for topic, qos in topics.items()])
 
     def _build_deliver(self, broker_url, stop_event):
-        """Factory for functions to get messages delivered by the broker into the messages queue."""
+        """Factory for functions to get messages delivered by the broker to the pending requests."""
 
         @tornado.gen.coroutine
         def reconnect():
@@ -228,7 +338,7 @@ class MQTTClient(BaseProtocolClient):
     def _init_client(self, broker_url, ref_id):
         """Initializes and connects a client to the given broker URL."""
 
-        with (yield self._lock_client.acquire()):
+        with (yield self._broker_lock(broker_url).acquire()):
             self._ref_counter.increase(broker_url, ref_id)
 
             if broker_url in self._clients:
@@ -250,7 +360,7 @@ class MQTTClient(BaseProtocolClient):
         """Decreases the reference counter for the client on the given broker and cleans
         all resources when the client does not have any more references pointing to it."""
 
-        with (yield self._lock_client.acquire()):
+        with (yield self._broker_lock(broker_url).acquire()):
             self._ref_counter.decrease(broker_url, ref_id)
 
             if self._ref_counter.has_any(broker_url):
@@ -275,93 +385,76 @@ class MQTTClient(BaseProtocolClient):
                     exc_info=True)
 
             self._clients.pop(broker_url, None)
-            self._messages.pop(broker_url, None)
-            self._msg_conditions.pop(broker_url, None)
+            self._pending.pop(broker_url, None)
+            self._observers.pop(broker_url, None)
             self._topics.pop(broker_url, None)
+            self._subscriptions.pop(broker_url, None)
+            self._property_cache.pop(broker_url, None)
 
     @tornado.gen.coroutine
     def _subscribe(self, broker_url, topic, qos):
-        """Subscribes to a topic."""
-
-        with (yield self._lock_client.acquire()):
-            if broker_url not in self._clients:
-                return
+        """Subscribes to a topic and waits for the subscription to be acknowledged.
+        Topics that are already subscribed with the same or higher QoS are skipped."""
 
-            if broker_url not in self._msg_conditions:
-                self._msg_conditions[broker_url] = {}
+        if broker_url not in self._clients:
+            return
 
-            if topic not in self._msg_conditions[broker_url]:
-                self._msg_conditions[broker_url][topic] = \
-                    tornado.locks.Condition()
+        topics = self._topics.setdefault(broker_url, {})
+        subscriptions = self._subscriptions.setdefault(broker_url, {})
 
-            if broker_url not in self._topics:
-                self._topics[broker_url] = set()
+        if topics.get(topic, -1) >= qos:
+            yield subscriptions[topic]
+            return
 
-            self._topics[broker_url].add((topic, qos))
+        topics[topic] = qos
+        future_sub = tornado.concurrent.Future()
+        subscriptions[topic] = future_sub
 
+        try:
             yield self._clients[broker_url].subscribe([(topic, qos)])
+        except Exception as ex:
+            if subscriptions.get(topic, None) is future_sub:
+                topics.pop(topic, None)
+                subscriptions.pop(topic, None)
 
-    @tornado.gen.coroutine
-    def _publish(self, broker_url, topic, payload, qos):
-        """Publishes a message with the given payload in a topic."""
+            # Concurrent callers waiting for this subscription fail with the same error.
+            # The exception is marked as retrieved as it is raised here anyway.
 
-        with (yield self._lock_client.acquire()):
-            if broker_url not in self._clients:
-                return
+            future_sub.set_exception(ex)
+            future_sub.exception()
+            raise
 
-            yield self._clients[broker_url].publish(topic, payload, qos=qos)
+        future_sub.set_result(None)
 
-    def _topic_messages(self, broker_url, topic, from_time=None, ignore_ids=None):
-        """Returns a generator that yields the messages in the
-        delivered messages queue for the given topic."""
+    @tornado.gen.coroutine
+    def _unsubscribe(self, broker_url, topic):
+        """Unsubscribes from a topic."""
 
-        if broker_url not in self._messages:
+        if broker_url not in self._clients:
             return
 
-        if topic not in self._messages[broker_url]:
+        if topic not in self._topics.get(broker_url, {}):
             return
 
-        for msg in self._messages[broker_url][topic]:
-            is_on_time = from_time is None or msg["time"] >= from_time
-            is_ignored = ignore_ids is not None and msg["id"] in ignore_ids
-
-            if is_on_time and not is_ignored:
-                yield msg["id"], msg["data"], msg["time"]
-
-    def _clean_messages(self, broker_url):
-        """Removes the messages that have expired according to the TTL."""
+        self._topics[broker_url].pop(topic)
+        self._subscriptions[broker_url].pop(topic, None)
 
-        if broker_url not in self._messages:
-            return
-
-        now = time.time()
-
-        self._messages[broker_url] = {
-            topic: [
-                msg for msg in self._messages[broker_url][topic]
-                if (now - msg["time"]) < self._msg_ttl_secs
-            ] for topic in self._messages[broker_url]
-        }
-
-    def _next_match(self, broker_url, topic, func):
-        """Returns the first message match in the internal messages queue or None."""
-
-        return next((item for item in self._topic_messages(broker_url, topic) if func(item)), None)
+        yield self._clients[broker_url].unsubscribe([topic])
 
     @tornado.gen.coroutine
-    def _wait_on_message(self, broker_url, topic):
-        """Waits for the arrival of a message in the given topic."""
+    def _publish(self, broker_url, topic, payload, qos):
+        """Publishes a message with the given payload in a topic."""
 
-        assert broker_url in self._msg_conditions, "Unknown broker URL"
-        assert topic in self._msg_conditions[broker_url], "Unknown topic"
+        client = self._clients.get(broker_url, None)
 
-        wait_timeout = datetime.timedelta(seconds=self._msg_wait_timeout_secs)
+        if client is None:
+            return
 
-        yield self._msg_conditions[broker_url][topic].wait(timeout=wait_timeout)
+        yield client.publish(topic, payload, qos=qos)
 
     @classmethod
-    def _pick_mqtt_href(cls, td, forms, op=None):
-        """Picks the most appropriate MQTT form href from the given list of forms."""
+    def _pick_mqtt_form(cls, td, forms, op=None):
+        """Picks the most appropriate MQTT form from the given list of forms."""
 
         def is_op_form(form):
             try:
@@ -370,10 +463,32 @@ class MQTTClient(BaseProtocolClient):
                 return False
 
         return next((
-            form.href for form in forms
+            form for form in forms
             if is_scheme_form(form, td.base, MQTTSchemes.MQTT) and is_op_form(form)
         ), None)
 
+    @classmethod
+    def _form_option(cls, form, option_name, default=None):
+        """Returns the value of the given MQTT option (e.g. mqtt:qos)
+        advertised in the form or the default if the option is missing."""
+
+        options = form.extensions.get(MQTTVocabularyKeys.OPTIONS, None) or []
+
+        return next((
+            item.get(MQTTVocabularyKeys.OPTION_VALUE) for item in options
+            if isinstance(item, dict) and item.get(MQTTVocabularyKeys.OPTION_NAME) == option_name
+        ), default)
+
+    @classmethod
+    def _form_qos(cls, form, qos, default):
+        """Returns the QoS level explicitly requested by the caller or, if
+        not defined, the QoS level advertised in the form or the default."""
+
+        if qos is not None:
+            return qos
+
+        return cls._form_option(form, MQTTVocabularyKeys.OPTION_NAME_QOS, default)
+
     @classmethod
     def _parse_href(cls, href):
         """Takes an MQTT form href and returns
@@ -409,19 +524,22 @@ class MQTTClient(BaseProtocolClient):
 
     @tornado.gen.coroutine
     def invoke_action(self, td, name, input_value, timeout=None,
-                      qos_publish=QOS_2, qos_subscribe=QOS_1):
+                      qos_publish=None, qos_subscribe=QOS_1):
         """Invokes an Action on a remote Thing.
+        The publish QoS level defaults to the one advertised in the Form.
         Returns a Future."""
 
         timeout = timeout if timeout else self._timeout_default
         ref_id = uuid.uuid4().hex
 
-        href = self._pick_mqtt_href(td, td.get_action_forms(name))
+        form = self._pick_mqtt_form(td, td.get_action_forms(name))
 
-        if href is None:
+        if form is None:
             raise FormNotFoundException()
 
-        parsed_href = self._parse_href(href)
+        qos_publish = self._form_qos(form, qos_publish, QOS_2)
+
+        parsed_href = self._parse_href(form.href)
         broker_url = parsed_href["broker_url"]
 
         topic_invoke = parsed_href["topic"]
@@ -438,55 +556,47 @@ class MQTTClient(BaseProtocolClient):
 
             input_payload = json.dumps(input_data).encode()
 
-            yield self._publish(broker_url, topic_invoke, input_payload, qos_publish)
-
-            ini = time.time()
-
-            while True:
-                self._logr.debug(
-                    "Checking invocation topic: {}".format(topic_result))
-
-                if timeout and (time.time() - ini) > timeout:
-                    self._logr.warning(
-                        "Timeout invoking Action: {}".format(topic_result))
-                    raise ClientRequestTimeout
+            pending_key, future_result = self._add_pending(
+                broker_url, topic_result, field="id", value=input_data["id"])
 
-                msg_match = self._next_match(
-                    broker_url, topic_result,
-                    lambda item: item[1].get("id") == input_data.get("id"))
-
-                if not msg_match:
-                    yield self._wait_on_message(broker_url, topic_result)
-                    continue
-
-                msg_id, msg_data, msg_time = msg_match
-
-                if msg_data.get("error", None) is not None:
-                    raise Exception(msg_data.get("error"))
-                else:
-                    raise tornado.gen.Return(msg_data.get("result"))
+            try:
+                yield self._publish(broker_url, topic_invoke, input_payload, qos_publish)
+                msg_data = yield self._wait_pending(future_result, timeout=timeout)
+            except ClientRequestTimeout:
+                self._logr.warning("Timeout invoking Action: {}".format(topic_result))
+                raise
+            finally:
+                self._remove_pending(broker_url, topic_result, pending_key)
+
+            if msg_data.get("error", None) is not None:
+                raise Exception(msg_data.get("error"))
+            else:
+                raise tornado.gen.Return(msg_data.get("result"))
         finally:
             yield self._disconnect_client(broker_url, ref_id)
 
     @tornado.gen.coroutine
     def write_property(self, td, name, value, timeout=None,
-                       qos_publish=QOS_2, qos_subscribe=QOS_1, wait_ack=True):
+                       qos_publish=None, qos_subscribe=QOS_1, wait_ack=True):
         """Updates the value of a Property on a remote Thing.
         Due to the MQTT binding design this coroutine yields as soon as the write message has
-        been published and will not wait for a custom write handler that yields to another coroutine
+        been published and will not wait for a custom write handler that yields to another coroutine.
+        The publish QoS level defaults to the one advertised in the Form.
         Returns a Future."""
 
         timeout = timeout if timeout else self._timeout_default
         ref_id = uuid.uuid4().hex
 
-        href_write = self._pick_mqtt_href(
+        form_write = self._pick_mqtt_form(
             td, td.get_property_forms(name),
             op=InteractionVerbs.WRITE_PROPERTY)
 
-        if href_write is None:
+        if form_write is None:
             raise FormNotFoundException()
 
-        parsed_href_write = self._parse_href(href_write)
+        qos_publish = self._form_qos(form_write, qos_publish, QOS_2)
+
+        parsed_href_write = self._parse_href(form_write.href)
         broker_url = parsed_href_write["broker_url"]
 
         topic_write = parsed_href_write["topic"]
@@ -504,37 +614,177 @@ class MQTTClient(BaseProtocolClient):
 
             write_payload = json.dumps(write_data).encode()
 
-            yield self._publish(broker_url, topic_write, write_payload, qos_publish)
-
             if not wait_ack:
+                yield self._publish(broker_url, topic_write, write_payload, qos_publish)
                 return
 
-            ini = time.time()
+            pending_key, future_ack = self._add_pending(
+                broker_url, topic_ack, field="ack", value=write_data["ack"])
 
-            while True:
-                self._logr.debug(
-                    "Checking write ACK topic: {}".format(topic_ack))
+            try:
+                yield self._publish(broker_url, topic_write, write_payload, qos_publish)
+                yield self._wait_pending(future_ack, timeout=timeout)
+            except ClientRequestTimeout:
+                self._logr.warning("Timeout writing Property: {}".format(topic_ack))
+                raise
+            finally:
+                self._remove_pending(broker_url, topic_ack, pending_key)
+        finally:
+            yield self._disconnect_client(broker_url, ref_id)
 
-                if timeout and (time.time() - ini) > timeout:
-                    self._logr.warning(
-                        "Timeout writing Property: {}".format(topic_ack))
-                    raise ClientRequestTimeout
+    @tornado.gen.coroutine
+    def _request_properties(self, form, request_data, timeout, qos_publish, qos_subscribe):
+        """Publishes a request in the Thing-level Properties topic
+        and waits for the message with the related result."""
+
+        timeout = timeout if timeout else self._timeout_default
+        ref_id = uuid.uuid4().hex
+
+        qos_publish = self._form_qos(form, qos_publish, QOS_2)
+
+        parsed_href = self._parse_href(form.href)
+        broker_url = parsed_href["broker_url"]
+
+        topic_request = parsed_href["topic"]
+        topic_result = PropertyMQTTHandler.to_properties_result_topic(topic_request)
+
+        try:
+            yield self._init_client(broker_url, ref_id)
+            yield self._subscribe(broker_url, topic_result, qos_subscribe)
 
-                msg_match = self._next_match(
-                    broker_url, topic_ack,
-                    lambda item: item[1].get("ack") == write_data.get("ack"))
+            request_data = dict(request_data, id=uuid.uuid4().hex)
+            request_payload = json.dumps(request_data).encode()
 
-                if msg_match:
-                    break
+            pending_key, future_result = self._add_pending(
+                broker_url, topic_result, field="id", value=request_data["id"])
 
-                yield self._wait_on_message(broker_url, topic_ack)
+            try:
+                yield self._publish(broker_url, topic_request, request_payload, qos_publish)
+                msg_data = yield self._wait_pending(future_result, timeout=timeout)
+            except ClientRequestTimeout:
+                self._logr.warning("Timeout on Properties request: {}".format(topic_result))
+                raise
+            finally:
+                self._remove_pending(broker_url, topic_result, pending_key)
+
+            if msg_data.get("error", None) is not None:
+                raise Exception(msg_data.get("error"))
+
+            raise tornado.gen.Return(msg_data)
         finally:
             yield self._disconnect_client(broker_url, ref_id)
 
+    @tornado.gen.coroutine
+    def read_properties(self, td, names=None, timeout=None, qos_publish=None, qos_subscribe=QOS_1):
+        """Reads the values of multiple Properties (all if names is undefined) on
+        a remote Thing with a single request to the Thing-level Form if available.
+        The publish QoS level defaults to the one advertised in the Form.
+        Returns a Future that resolves with a dict of Property names to values."""
+
+        op = InteractionVerbs.READ_ALL_PROPERTIES if names is None else InteractionVerbs.READ_MULTIPLE_PROPERTIES
+        form = self._pick_mqtt_form(td, td.get_thing_forms(), op=op)
+
+        if form is None:
+            values = yield super(MQTTClient, self).read_properties(td, names=names, timeout=timeout)
+            raise tornado.gen.Return(values)
+
+        request_data = {"action": "read"}
+
+        if names is not None:
+            request_data.update({"names": list(names)})
+
+        msg_data = yield self._request_properties(
+            form, request_data, timeout, qos_publish, qos_subscribe)
+
+        raise tornado.gen.Return(msg_data.get("values"))
+
+    @tornado.gen.coroutine
+    def write_properties(self, td, values, timeout=None, qos_publish=None, qos_subscribe=QOS_1):
+        """Updates the values of multiple Properties on a remote Thing
+        with a single request to the Thing-level Form if available.
+        The publish QoS level defaults to the one advertised in the Form.
+        Returns a Future."""
+
+        form = self._pick_mqtt_form(
+            td, td.get_thing_forms(),
+            op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        if form is None:
+            yield super(MQTTClient, self).write_properties(td, values, timeout=timeout)
+            return
+
+        yield self._request_properties(
+            form, {"action": "write", "values": values},
+            timeout, qos_publish, qos_subscribe)
+
+    def _get_cached_property(self, broker_url, topic):
+        """Returns the cached message data for the given Property updates
+        topic or None if the topic is not cached or the value is too old."""
+
+        entry = self._property_cache.get(broker_url, {}).get(topic, None)
+
+        if entry is None or entry["data"] is None:
+            return None
+
+        if (time.time() - entry["time"]) > self._property_cache_max_age_secs:
+            return None
+
+        return entry["data"]
+
+    @tornado.gen.coroutine
+    def _cache_property(self, broker_url, topic, qos):
+        """Keeps a long-lived subscription to the given Property updates
+        topic that stores the latest received value in the cache."""
+
+        if topic in self._property_cache.get(broker_url, {}):
+            return
+
+        yield self._init_client(broker_url, self._property_cache_ref_id)
+
+        if broker_url not in self._property_cache:
+            self._property_cache[broker_url] = {}
+
+        if topic in self._property_cache[broker_url]:
+            return
+
+        entry = {"data": None, "time": None}
+        self._property_cache[broker_url][topic] = entry
+
+        def on_message(msg_data):
+            entry.update({"data": msg_data, "time": time.time()})
+
+        self._add_observer(broker_url, topic, self._property_cache_ref_id, on_message)
+
+        yield self._subscribe(broker_url, topic, qos)
+
+    @tornado.gen.coroutine
+    def clear_property_cache(self):
+        """Removes the cached Property values and releases the
+        subscriptions and connections that were feeding the cache."""
+
+        cached = [
+            (broker_url, topic)
+            for broker_url, topics in list(self._property_cache.items())
+            for topic in list(topics)
+        ]
+
+        self._property_cache = {}
+
+        for broker_url, topic in cached:
+            is_last = self._remove_observer(broker_url, topic, self._property_cache_ref_id)
+
+            if is_last and topic not in self._pending.get(broker_url, {}):
+                yield self._unsubscribe(broker_url, topic)
+
+        for broker_url in set(broker_url for broker_url, _ in cached):
+            yield self._disconnect_client(broker_url, self._property_cache_ref_id)
+
     @tornado.gen.coroutine
     def read_property(self, td, name, timeout=None,
-                      qos_publish=QOS_1, qos_subscribe=QOS_1):
+                      qos_publish=None, qos_subscribe=None):
         """Reads the value of a Property on a remote Thing.
+        The value may be served from the Property cache if enabled.
+        The QoS levels default to those advertised in the read and observe Forms.
         Returns a Future."""
 
         timeout = timeout if timeout else self._timeout_default
@@ -542,19 +792,22 @@ class MQTTClient(BaseProtocolClient):
 
         forms = td.get_property_forms(name)
 
-        href_read = self._pick_mqtt_href(
+        form_read = self._pick_mqtt_form(
             td, forms,
             op=InteractionVerbs.READ_PROPERTY)
 
-        href_obsv = self._pick_mqtt_href(
+        form_obsv = self._pick_mqtt_form(
             td, forms,
             op=InteractionVerbs.OBSERVE_PROPERTY)
 
-        if href_read is None or href_obsv is None:
+        if form_read is None or form_obsv is None:
             raise FormNotFoundException()
 
-        parsed_href_read = self._parse_href(href_read)
-        parsed_href_obsv = self._parse_href(href_obsv)
+        qos_publish = self._form_qos(form_read, qos_publish, QOS_1)
+        qos_subscribe = self._form_qos(form_obsv, qos_subscribe, QOS_1)
+
+        parsed_href_read = self._parse_href(form_read.href)
+        parsed_href_obsv = self._parse_href(form_obsv.href)
 
         topic_read = parsed_href_read["topic"]
         topic_obsv = parsed_href_obsv["topic"]
@@ -562,39 +815,33 @@ class MQTTClient(BaseProtocolClient):
         broker_read = parsed_href_read["broker_url"]
         broker_obsv = parsed_href_obsv["broker_url"]
 
+        if self._property_cache_max_age_secs is not None:
+            cached_data = self._get_cached_property(broker_obsv, topic_obsv)
+
+            if cached_data is not None:
+                raise tornado.gen.Return(cached_data.get("value"))
+
+            yield self._cache_property(broker_obsv, topic_obsv, qos_subscribe)
+
         try:
             yield self._init_client(broker_read, ref_id)
             broker_obsv != broker_read and (yield self._init_client(broker_obsv, ref_id))
 
             yield self._subscribe(broker_obsv, topic_obsv, qos_subscribe)
 
-            read_time = time.time()
             read_payload = json.dumps({"action": "read"}).encode()
+            pending_key, future_value = self._add_pending(broker_obsv, topic_obsv)
 
-            yield self._publish(broker_read, topic_read, read_payload, qos_publish)
-
-            ini = time.time()
-
-            while True:
-                self._logr.debug(
-                    "Checking property update topic: {}".format(topic_obsv))
-
-                if timeout and (time.time() - ini) > timeout:
-                    self._logr.warning(
-                        "Timeout reading Property: {}".format(topic_obsv))
-                    raise ClientRequestTimeout
-
-                msg_match = self._next_match(
-                    broker_obsv, topic_obsv,
-                    lambda item: item[2] >= read_time)
-
-                if not msg_match:
-                    yield self._wait_on_message(broker_obsv, topic_obsv)
-                    continue
-
-                msg_id, msg_data, msg_time = msg_match
-
-                raise tornado.gen.Return(msg_data.get("value"))
+            try:
+                yield self._publish(broker_read, topic_read, read_payload, qos_publish)
+                msg_data = yield self._wait_pending(future_value, timeout=timeout)
+            except ClientRequestTimeout:
+                self._logr.warning("Timeout reading Property: {}".format(topic_obsv))
+                raise
+            finally:
+                self._remove_pending(broker_obsv, topic_obsv, pending_key)
+
+            raise tornado.gen.Return(msg_data.get("value"))
         finally:
             yield self._disconnect_client(broker_read, ref_id)
             broker_obsv != broker_read and (yield self._disconnect_client(broker_obsv, ref_id))
@@ -604,72 +851,79 @@ class MQTTClient(BaseProtocolClient):
         constructing an Observable to listen for messages on an MQTT topic."""
 
         def subscribe(observer):
-            """Subscriber function that listens for MQTT messages
-            on a given topic and passes them to the Observer."""
+            """Subscriber function that registers the Observer in the shared connection
+            to the MQTT broker and passes the messages of the topic to the Observer."""
 
+            ref_id = uuid.uuid4().hex
             state = {"active": True}
 
-            config = self._build_client_config()
-            client = hbmqtt.client.MQTTClient(config=config)
+            def on_message(msg_data):
+                try:
+                    observer.on_next(next_item_builder(msg_data))
+                except Exception as ex:
+                    self._logr.warning(
+                        "Subscription message error: {}".format(ex), exc_info=True)
 
-            @handle_observer_finalization(observer)
             @tornado.gen.coroutine
-            def callback():
-                self._logr.debug("Subscribing on <{}> to {} with config: {}".format(
-                    broker_url, topic, config))
-
-                yield client.connect(broker_url)
-                yield client.subscribe([(topic, qos)])
-
-                while state["active"]:
-                    try:
-                        msg = yield client.deliver_message(timeout=self._deliver_timeout_secs)
-                    except asyncio.TimeoutError:
-                        continue
-
-                    try:
-                        msg_data = json.loads(msg.data.decode())
-                        next_item = next_item_builder(msg_data)
-                        observer.on_next(next_item)
-                    except Exception as ex:
-                        self._logr.warning(
-                            "Subscription message error: {}".format(ex), exc_info=True)
+            def start():
+                self._logr.debug("Subscribing on <{}> to {}".format(broker_url, topic))
 
-            def unsubscribe():
-                """Disconnects from the MQTT broker and stops the message delivering loop."""
+                try:
+                    yield self._init_client(broker_url, ref_id)
 
-                @tornado.gen.coroutine
-                def disconnect():
-                    try:
-                        yield client.disconnect()
-                    except Exception as ex:
-                        self._logr.warning(
-                            "Subscription disconnection error: {}".format(ex))
+                    if not state["active"]:
+                        return
+
+                    self._add_observer(broker_url, topic, ref_id, on_message)
+                    yield self._subscribe(broker_url, topic, qos)
+                except Exception as ex:
+                    observer.on_error(ex)
+
+            @tornado.gen.coroutine
+            def stop():
+                try:
+                    is_last = self._remove_observer(broker_url, topic, ref_id)
+
+                    if is_last and topic not in self._pending.get(broker_url, {}):
+                        yield self._unsubscribe(broker_url, topic)
+                except Exception as ex:
+                    self._logr.warning(
+                        "Subscription unsubscribe error: {}".format(ex))
+                finally:
+                    yield self._disconnect_client(broker_url, ref_id)
+
+            def unsubscribe():
+                """Removes the Observer and unsubscribes from the
+                topic on the broker if this was the last Observer."""
 
-                tornado.ioloop.IOLoop.current().add_callback(disconnect)
+                if not state["active"]:
+                    return
 
                 state["active"] = False
+                tornado.ioloop.IOLoop.current().add_callback(stop)
 
-            tornado.ioloop.IOLoop.current().add_callback(callback)
+            start()
 
             return unsubscribe
 
         return subscribe
 
-    def on_property_change(self, td, name, qos=QOS_0):
+    def on_property_change(self, td, name, qos=None):
         """Subscribes to property changes on a remote Thing.
+        The QoS level defaults to the one advertised in the Form.
         Returns an Observable"""
 
         forms = td.get_property_forms(name)
 
-        href = self._pick_mqtt_href(
+        form = self._pick_mqtt_form(
             td, forms,
             op=InteractionVerbs.OBSERVE_PROPERTY)
 
-        if href is None:
+        if form is None:
             raise FormNotFoundException()
 
-        parsed_href = self._parse_href(href)
+        qos = self._form_qos(form, qos, QOS_0)
+        parsed_href = self._parse_href(form.href)
 
         broker_url = parsed_href["broker_url"]
         topic = parsed_href["topic"]
@@ -688,20 +942,22 @@ class MQTTClient(BaseProtocolClient):
         # noinspection PyUnresolvedReferences
         return Observable.create(subscribe)
 
-    def on_event(self, td, name, qos=QOS_0):
+    def on_event(self, td, name, qos=None):
         """Subscribes to an event on a remote Thing.
+        The QoS level defaults to the one advertised in the Form.
         Returns an Observable."""
 
         forms = td.get_event_forms(name)
 
-        href = self._pick_mqtt_href(
+        form = self._pick_mqtt_form(
             td, forms,
             op=InteractionVerbs.SUBSCRIBE_EVENT)
 
-        if href is None:
+        if form is None:
             raise FormNotFoundException()
 
-        parsed_href = self._parse_href(href)
+        qos = self._form_qos(form, qos, QOS_0)
+        parsed_href = self._parse_href(form.href)
 
         broker_url = parsed_href["broker_url"]
         topic = parsed_href["topic"]
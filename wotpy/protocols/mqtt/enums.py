@@ -47,3 +47,11 @@ class MQTTCodesACK(EnumListMixin):
 
     CON_OK = 0
     SUB_ERROR = 128
+
+
+class MQTTOverflowPolicies(EnumListMixin):
+    """Enumeration of policies applied when a bounded queue of outgoing MQTT messages is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
@@ -12,5 +12,6 @@ Entities that handle the MQTT operations needed to support each of the Interacti
     wotpy.protocols.mqtt.handlers.event
     wotpy.protocols.mqtt.handlers.ping
     wotpy.protocols.mqtt.handlers.property
+    wotpy.protocols.mqtt.handlers.queues
     wotpy.protocols.mqtt.handlers.subs
 """
@@ -13,8 +13,10 @@ import tornado.gen
 import tornado.ioloop
 from hbmqtt.mqtt.constants import QOS_2
 
+from wotpy.protocols.enums import InteractionVerbs
 from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
 from wotpy.utils.utils import to_json_obj
+from wotpy.wot.enums import InteractionTypes
 
 
 class ActionMQTTHandler(BaseMQTTHandler):
@@ -60,6 +62,23 @@ class ActionMQTTHandler(BaseMQTTHandler):
 
         return [(self.topic_wildcard_invocation, self._qos)]
 
+    def default_form_options(self, op):
+        """Returns a dict with the default QoS level and retain flag
+        of the Action invocation and result messages."""
+
+        return {"qos": self._qos, "retain": False}
+
+    def ordering_key(self, msg):
+        """Returns the URL name of the Thing targeted by the given request
+        message to keep the requests for the same Thing in order."""
+
+        topic_split = msg.topic.split("/")
+
+        if len(topic_split) != len(self.topic_wildcard_invocation.split("/")) + 1:
+            return None
+
+        return topic_split[-2]
+
     @tornado.gen.coroutine
     def handle_message(self, msg):
         """Listens to all Property request topics and responds to read and write requests."""
@@ -80,15 +99,15 @@ class ActionMQTTHandler(BaseMQTTHandler):
 
         thing_url_name, action_url_name = topic_split[-2], topic_split[-1]
 
-        try:
-            exp_thing = next(
-                item for item in self.mqtt_server.exposed_things
-                if item.url_name == thing_url_name)
-
-            action = next(
-                exp_thing.thing.actions[key] for key in exp_thing.thing.actions
-                if exp_thing.thing.actions[key].url_name == action_url_name)
-        except StopIteration:
+        exp_thing = self.mqtt_server.exposed_thing_set.find_by_thing_id(thing_url_name)
+
+        if exp_thing is None:
+            return
+
+        action = exp_thing.thing.find_interaction(
+            action_url_name, interaction_type=InteractionTypes.ACTION)
+
+        if action is None:
             return
 
         input_value = parsed_msg.get(self.KEY_INPUT, None)
@@ -105,9 +124,11 @@ class ActionMQTTHandler(BaseMQTTHandler):
             data.update({"error": str(ex)})
 
         topic = self.build_action_result_topic(exp_thing.thing, action)
+        options = self.mqtt_server.get_form_options(action, InteractionVerbs.INVOKE_ACTION)
 
         yield self.queue.put({
             "topic": topic,
             "data": json.dumps(data).encode(),
-            "qos": self._qos
+            "qos": options["qos"],
+            "retain": options["retain"]
         })
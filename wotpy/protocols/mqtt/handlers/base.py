@@ -43,6 +43,30 @@ class BaseMQTTHandler(object):
 
         return self._queue
 
+    @queue.setter
+    def queue(self, value):
+        """Replaces the publish queue (e.g. with the queue shared by all handlers in a runner)."""
+
+        self._queue = value
+
+    @property
+    def stats(self):
+        """Dict with the counters of the internal queues of this handler."""
+
+        return {}
+
+    def ordering_key(self, msg):
+        """Returns the key of the messages that should be handled in order relative to the given one
+        (e.g. the messages for the same Thing). None if the message may be handled in any order."""
+
+        return None
+
+    def default_form_options(self, op):
+        """Returns a dict with the default QoS level and retain flag of the messages
+        exchanged by this handler for the given operation (i.e. Interaction verb)."""
+
+        raise NotImplementedError
+
     @tornado.gen.coroutine
     def handle_message(self, msg):
         """Called each time the runner receives a message for one of the handler topics."""
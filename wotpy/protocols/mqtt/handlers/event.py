@@ -5,15 +5,18 @@
 MQTT handler for Event subscriptions.
 """
 
+import asyncio
 import json
 import time
 
 import tornado.gen
 import tornado.ioloop
 from hbmqtt.mqtt.constants import QOS_0
-from tornado.queues import QueueFull
 
+from wotpy.protocols.enums import InteractionVerbs
+from wotpy.protocols.mqtt.enums import MQTTOverflowPolicies
 from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
+from wotpy.protocols.mqtt.handlers.queues import OverflowQueue, forward_messages
 from wotpy.protocols.mqtt.handlers.subs import InteractionsSubscriber
 from wotpy.utils.utils import to_json_obj
 from wotpy.wot.enums import InteractionTypes
@@ -22,29 +25,42 @@ from wotpy.wot.enums import InteractionTypes
 class EventMQTTHandler(BaseMQTTHandler):
     """MQTT handler for Event subscriptions."""
 
-    DEFAULT_CALLBACK_MS = 2000
     DEFAULT_JITTER = 0.2
+    DEFAULT_QUEUE_SIZE = 500
+    DEFAULT_OVERFLOW_POLICY = MQTTOverflowPolicies.DROP_NEWEST
 
-    def __init__(self, mqtt_server, qos=QOS_0, callback_ms=None):
+    def __init__(self, mqtt_server, qos=QOS_0, callback_ms=None, queue_size=None,
+                 overflow_policy=None, overflow_timeout=None):
         super(EventMQTTHandler, self).__init__(mqtt_server)
 
-        callback_ms = self.DEFAULT_CALLBACK_MS if callback_ms is None else callback_ms
-
         self._qos = qos
         self._callback_ms = callback_ms
         self._subs = {}
 
+        self._events = OverflowQueue(
+            maxsize=self.DEFAULT_QUEUE_SIZE if queue_size is None else queue_size,
+            policy=self.DEFAULT_OVERFLOW_POLICY if overflow_policy is None else overflow_policy,
+            timeout=overflow_timeout)
+
+        self._events_forwarder = None
+
         self._interaction_subscriber = InteractionsSubscriber(
             interaction_type=InteractionTypes.EVENT,
             server=self.mqtt_server,
             on_next_builder=self._build_on_next)
 
-        @tornado.gen.coroutine
-        def refresh_subs():
-            self._interaction_subscriber.refresh()
+        # Subscriptions are updated as ExposedThings change. A periodic
+        # full reconciliation may be enabled as a safety net with callback_ms.
+
+        self._periodic_refresh_subs = None
 
-        self._periodic_refresh_subs = tornado.ioloop.PeriodicCallback(
-            refresh_subs, self._callback_ms, jitter=self.DEFAULT_JITTER)
+        if self._callback_ms:
+            @tornado.gen.coroutine
+            def refresh_subs():
+                self._interaction_subscriber.refresh()
+
+            self._periodic_refresh_subs = tornado.ioloop.PeriodicCallback(
+                refresh_subs, self._callback_ms, jitter=self.DEFAULT_JITTER)
 
     def build_event_topic(self, thing, event):
         """Returns the MQTT topic for Event emissions."""
@@ -54,13 +70,32 @@ class EventMQTTHandler(BaseMQTTHandler):
             thing.url_name,
             event.url_name)
 
+    def default_form_options(self, op):
+        """Returns a dict with the default QoS level and retain flag of the Event emission messages."""
+
+        return {"qos": self._qos, "retain": False}
+
+    @property
+    def stats(self):
+        """Dict with the counters of the Event emissions queue."""
+
+        return {
+            "events_queued": self._events.qsize(),
+            "events_dropped": self._events.dropped
+        }
+
     @tornado.gen.coroutine
     def init(self):
         """Initializes the MQTT handler.
         Called when the MQTT runner starts."""
 
-        self._interaction_subscriber.refresh()
-        self._periodic_refresh_subs.start()
+        self._interaction_subscriber.start()
+
+        if self._periodic_refresh_subs is not None:
+            self._periodic_refresh_subs.start()
+
+        if self._events_forwarder is None:
+            self._events_forwarder = asyncio.ensure_future(forward_messages(self._events, self.queue))
 
         yield None
 
@@ -69,9 +104,15 @@ class EventMQTTHandler(BaseMQTTHandler):
         """Destroys the MQTT handler.
         Called when the MQTT runner stops."""
 
-        self._periodic_refresh_subs.stop()
+        if self._periodic_refresh_subs is not None:
+            self._periodic_refresh_subs.stop()
+
         self._interaction_subscriber.dispose()
 
+        if self._events_forwarder is not None:
+            self._events_forwarder.cancel()
+            self._events_forwarder = None
+
         yield None
 
     def _build_on_next(self, exp_thing, event):
@@ -80,19 +121,19 @@ class EventMQTTHandler(BaseMQTTHandler):
         topic = self.build_event_topic(exp_thing, event)
 
         def on_next(item):
-            try:
-                data = {
-                    "name": item.name,
-                    "data": to_json_obj(item.data),
-                    "timestamp": int(time.time() * 1000)
-                }
-
-                self.queue.put_nowait({
-                    "topic": topic,
-                    "data": json.dumps(data).encode(),
-                    "qos": self._qos
-                })
-            except QueueFull:
-                pass
+            data = {
+                "name": item.name,
+                "data": to_json_obj(item.data),
+                "timestamp": int(time.time() * 1000)
+            }
+
+            options = self.mqtt_server.get_form_options(event, InteractionVerbs.SUBSCRIBE_EVENT)
+
+            self._events.offer({
+                "topic": topic,
+                "data": json.dumps(data).encode(),
+                "qos": options["qos"],
+                "retain": options["retain"]
+            })
 
         return on_next
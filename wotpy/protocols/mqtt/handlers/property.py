@@ -5,6 +5,7 @@
 MQTT handler for Property reads, writes and subscriptions to value updates.
 """
 
+import asyncio
 import json
 import time
 from json import JSONDecodeError
@@ -12,9 +13,10 @@ from json import JSONDecodeError
 import tornado.gen
 import tornado.ioloop
 from hbmqtt.mqtt.constants import QOS_0, QOS_2
-from tornado.queues import QueueFull
 
+from wotpy.protocols.enums import InteractionVerbs
 from wotpy.protocols.mqtt.handlers.base import BaseMQTTHandler
+from wotpy.protocols.mqtt.handlers.queues import LatestValueQueue, forward_messages
 from wotpy.protocols.mqtt.handlers.subs import InteractionsSubscriber
 from wotpy.utils.utils import to_json_obj
 from wotpy.wot.enums import InteractionTypes
@@ -26,32 +28,41 @@ class PropertyMQTTHandler(BaseMQTTHandler):
     KEY_ACTION = "action"
     KEY_VALUE = "value"
     KEY_ACK = "ack"
+    KEY_ID = "id"
+    KEY_NAMES = "names"
+    KEY_VALUES = "values"
     ACTION_READ = "read"
     ACTION_WRITE = "write"
-    DEFAULT_CALLBACK_MS = 2000
     DEFAULT_JITTER = 0.2
 
-    def __init__(self, mqtt_server, qos_observe=QOS_0, qos_rw=QOS_2, callback_ms=None):
+    def __init__(self, mqtt_server, qos_observe=QOS_0, qos_rw=QOS_2, callback_ms=None, retain_updates=False):
         super(PropertyMQTTHandler, self).__init__(mqtt_server)
 
-        callback_ms = self.DEFAULT_CALLBACK_MS if callback_ms is None else callback_ms
-
         self._qos_observe = qos_observe
         self._qos_rw = qos_rw
+        self._retain_updates = retain_updates
         self._callback_ms = callback_ms
         self._subs = {}
+        self._updates = LatestValueQueue()
+        self._updates_forwarder = None
 
         self._interaction_subscriber = InteractionsSubscriber(
             interaction_type=InteractionTypes.PROPERTY,
             server=self.mqtt_server,
             on_next_builder=self._build_on_next)
 
-        @tornado.gen.coroutine
-        def refresh_subs():
-            self._interaction_subscriber.refresh()
+        # Subscriptions are updated as ExposedThings change. A periodic
+        # full reconciliation may be enabled as a safety net with callback_ms.
+
+        self._periodic_refresh_subs = None
 
-        self._periodic_refresh_subs = tornado.ioloop.PeriodicCallback(
-            refresh_subs, self._callback_ms, jitter=self.DEFAULT_JITTER)
+        if self._callback_ms:
+            @tornado.gen.coroutine
+            def refresh_subs():
+                self._interaction_subscriber.refresh()
+
+            self._periodic_refresh_subs = tornado.ioloop.PeriodicCallback(
+                refresh_subs, self._callback_ms, jitter=self.DEFAULT_JITTER)
 
     @property
     def topic_wildcard_requests(self):
@@ -79,15 +90,64 @@ class PropertyMQTTHandler(BaseMQTTHandler):
             thing_name,
             prop_name)
 
+    @classmethod
+    def to_properties_result_topic(cls, requests_topic):
+        """Takes a Thing-level Properties requests topic and returns the related result topic."""
+
+        topic_split = requests_topic.split("/")
+        servient_id, thing_name = topic_split[-4], topic_split[-1]
+
+        return "{}/property/result/{}".format(servient_id, thing_name)
+
+    def build_properties_result_topic(self, thing):
+        """Returns the MQTT topic for the results of Thing-level Properties requests."""
+
+        return "{}/property/result/{}".format(self.servient_id, thing.url_name)
+
+    @property
+    def stats(self):
+        """Dict with the counters of the Property updates queue."""
+
+        return {
+            "updates_queued": self._updates.qsize(),
+            "updates_coalesced": self._updates.coalesced
+        }
+
+    def default_form_options(self, op):
+        """Returns a dict with the default QoS level and retain flag of the messages
+        exchanged for the given Property operation: updates are published with the
+        observe QoS (and retained if enabled) while requests use the read/write QoS."""
+
+        if op == InteractionVerbs.OBSERVE_PROPERTY:
+            return {"qos": self._qos_observe, "retain": self._retain_updates}
+
+        return {"qos": self._qos_rw, "retain": False}
+
     @property
     def topics(self):
         """List of topics that this MQTT handler wants to subscribe to."""
 
         return [(self.topic_wildcard_requests, self._qos_rw)]
 
+    def ordering_key(self, msg):
+        """Returns the URL name of the Thing targeted by the given request
+        message to keep the requests for the same Thing in order."""
+
+        topic_split = msg.topic.split("/")
+        splits_wildcard_len = len(self.topic_wildcard_requests.split("/"))
+
+        if len(topic_split) == splits_wildcard_len:
+            return topic_split[-1]
+
+        if len(topic_split) != splits_wildcard_len + 1:
+            return None
+
+        return topic_split[-2]
+
     @tornado.gen.coroutine
     def handle_message(self, msg):
-        """Listens to all Property request topics and responds to read and write requests."""
+        """Listens to all Property request topics and responds to read and write requests.
+        Requests to the Thing-level topic read or write multiple Properties at once."""
 
         try:
             parsed_msg = json.loads(msg.data.decode())
@@ -103,33 +163,74 @@ class PropertyMQTTHandler(BaseMQTTHandler):
 
         splits_expected_len = len(self.topic_wildcard_requests.split("/")) + 1
 
+        if len(topic_split) == splits_expected_len - 1:
+            yield self._handle_properties_request(topic_split[-1], action, parsed_msg)
+            return
+
         if len(topic_split) != splits_expected_len:
             return
 
         thing_url_name, prop_url_name = topic_split[-2], topic_split[-1]
 
-        try:
-            exp_thing = next(
-                item for item in self.mqtt_server.exposed_things
-                if item.url_name == thing_url_name)
-
-            prop = next(
-                exp_thing.thing.properties[key] for key in exp_thing.thing.properties
-                if exp_thing.thing.properties[key].url_name == prop_url_name)
-        except StopIteration:
+        exp_thing = self.mqtt_server.exposed_thing_set.find_by_thing_id(thing_url_name)
+
+        if exp_thing is None:
+            return
+
+        prop = exp_thing.thing.find_interaction(
+            prop_url_name, interaction_type=InteractionTypes.PROPERTY)
+
+        if prop is None:
             return
 
         if action == self.ACTION_READ:
             value = yield exp_thing.properties[prop.name].read()
             topic = self.build_property_updates_topic(exp_thing.thing, prop)
-            update_msg = self._build_update_message(topic, value)
+            update_msg = self._build_update_message(topic, prop, value)
             yield self.queue.put(update_msg)
         elif action == self.ACTION_WRITE and self.KEY_VALUE in parsed_msg:
             yield exp_thing.properties[prop.name].write(parsed_msg[self.KEY_VALUE])
-            yield self.publish_write_ack(msg)
+            yield self.publish_write_ack(msg, prop)
 
     @tornado.gen.coroutine
-    def publish_write_ack(self, msg):
+    def _handle_properties_request(self, thing_url_name, action, parsed_msg):
+        """Reads or writes multiple Properties of a Thing and
+        publishes the result in the Thing-level result topic."""
+
+        exp_thing = self.mqtt_server.exposed_thing_set.find_by_thing_id(thing_url_name)
+
+        if exp_thing is None:
+            return
+
+        values_write = parsed_msg.get(self.KEY_VALUES, None)
+
+        if action == self.ACTION_WRITE and not isinstance(values_write, dict):
+            return
+
+        data = {
+            self.KEY_ID: parsed_msg.get(self.KEY_ID, None),
+            "timestamp": int(time.time() * 1000)
+        }
+
+        try:
+            if action == self.ACTION_READ:
+                values = yield exp_thing.read_properties(parsed_msg.get(self.KEY_NAMES, None))
+                data.update({self.KEY_VALUES: to_json_obj(values)})
+            else:
+                yield exp_thing.write_properties(values_write)
+        except Exception as ex:
+            data.update({"error": str(ex)})
+
+        options = self.default_form_options(InteractionVerbs.READ_MULTIPLE_PROPERTIES)
+
+        yield self.queue.put({
+            "topic": self.build_properties_result_topic(exp_thing.thing),
+            "data": json.dumps(data).encode(),
+            "qos": options["qos"]
+        })
+
+    @tornado.gen.coroutine
+    def publish_write_ack(self, msg, prop):
         """Takes a Property write request message and publishes the related write ACK message."""
 
         try:
@@ -144,11 +245,12 @@ class PropertyMQTTHandler(BaseMQTTHandler):
             return
 
         topic_ack = self.to_write_ack_topic(msg.topic)
+        options = self.mqtt_server.get_form_options(prop, InteractionVerbs.WRITE_PROPERTY)
 
         yield self.queue.put({
             "topic": topic_ack,
             "data": json.dumps({self.KEY_ACK: ack_code}).encode(),
-            "qos": self._qos_rw
+            "qos": options["qos"]
         })
 
     @tornado.gen.coroutine
@@ -156,8 +258,13 @@ class PropertyMQTTHandler(BaseMQTTHandler):
         """Initializes the MQTT handler.
         Called when the MQTT runner starts."""
 
-        self._interaction_subscriber.refresh()
-        self._periodic_refresh_subs.start()
+        self._interaction_subscriber.start()
+
+        if self._periodic_refresh_subs is not None:
+            self._periodic_refresh_subs.start()
+
+        if self._updates_forwarder is None:
+            self._updates_forwarder = asyncio.ensure_future(forward_messages(self._updates, self.queue))
 
         yield None
 
@@ -166,15 +273,22 @@ class PropertyMQTTHandler(BaseMQTTHandler):
         """Destroys the MQTT handler.
         Called when the MQTT runner stops."""
 
-        self._periodic_refresh_subs.stop()
+        if self._periodic_refresh_subs is not None:
+            self._periodic_refresh_subs.stop()
+
         self._interaction_subscriber.dispose()
 
+        if self._updates_forwarder is not None:
+            self._updates_forwarder.cancel()
+            self._updates_forwarder = None
+
         yield None
 
-    def _build_update_message(self, topic, value):
+    def _build_update_message(self, topic, prop, value):
         """Builds an MQTT message to publish an update for a Property value."""
 
         now_ms = int(time.time() * 1000)
+        options = self.mqtt_server.get_form_options(prop, InteractionVerbs.OBSERVE_PROPERTY)
 
         return {
             "topic": topic,
@@ -182,7 +296,8 @@ class PropertyMQTTHandler(BaseMQTTHandler):
                 "value": to_json_obj(value),
                 "timestamp": now_ms
             }).encode(),
-            "qos": self._qos_observe
+            "qos": options["qos"],
+            "retain": options["retain"]
         }
 
     def _build_on_next(self, exp_thing, prop):
@@ -191,10 +306,7 @@ class PropertyMQTTHandler(BaseMQTTHandler):
         topic = self.build_property_updates_topic(exp_thing, prop)
 
         def on_next(item):
-            try:
-                msg = self._build_update_message(topic, item.data.value)
-                self.queue.put_nowait(msg)
-            except QueueFull:
-                pass
+            msg = self._build_update_message(topic, prop, item.data.value)
+            self._updates.put_nowait(msg)
 
         return on_next
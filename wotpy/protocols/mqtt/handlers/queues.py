@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Queues that buffer the messages produced by the MQTT handlers before they are published.
+"""
+
+import collections
+import datetime
+
+import tornado.util
+from tornado.queues import Queue, QueueFull
+
+from wotpy.protocols.mqtt.enums import MQTTOverflowPolicies
+
+
+class LatestValueQueue(Queue):
+    """Unbounded queue of MQTT messages where a new message replaces the message
+    for the same topic that is still waiting in the queue (the latest value wins).
+    The size of the queue is therefore bounded by the number of topics."""
+
+    def __init__(self):
+        super(LatestValueQueue, self).__init__()
+        self.coalesced = 0
+
+    def _init(self):
+        self._queue = collections.OrderedDict()
+
+    def _get(self):
+        return self._queue.popitem(last=False)[1]
+
+    def _put(self, item):
+        if item["topic"] in self._queue:
+            self.coalesced += 1
+
+        self._queue[item["topic"]] = item
+
+
+class OverflowQueue(Queue):
+    """Bounded queue of MQTT messages that applies an overflow
+    policy when a message is offered while the queue is full."""
+
+    def __init__(self, maxsize, policy=MQTTOverflowPolicies.DROP_NEWEST, timeout=None):
+        assert maxsize > 0
+        assert policy in MQTTOverflowPolicies.list()
+        super(OverflowQueue, self).__init__(maxsize=maxsize)
+        self._policy = policy
+        self._timeout = timeout
+        self.dropped = 0
+
+    def offer(self, item):
+        """Adds a message to the queue without waiting.
+        Depending on the overflow policy, a full queue will discard the oldest
+        message, discard the given message or wait until there is free space
+        (discarding the given message if the timeout expires first)."""
+
+        if self._policy == MQTTOverflowPolicies.DROP_OLDEST and self.full():
+            self.get_nowait()
+            self.dropped += 1
+
+        if self._policy != MQTTOverflowPolicies.BLOCK:
+            try:
+                self.put_nowait(item)
+            except QueueFull:
+                self.dropped += 1
+
+            return
+
+        timeout = datetime.timedelta(seconds=self._timeout) if self._timeout is not None else None
+
+        def on_done(fut):
+            try:
+                fut.result()
+            except tornado.util.TimeoutError:
+                self.dropped += 1
+
+        self.put(item, timeout=timeout).add_done_callback(on_done)
+
+
+async def forward_messages(source, target):
+    """Moves the messages in the source queue to the target queue, waiting for
+    free space in the target queue. Runs until the task is cancelled."""
+
+    while True:
+        item = await source.get()
+        await target.put(item)
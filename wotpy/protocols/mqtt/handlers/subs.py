@@ -10,12 +10,14 @@ import logging
 
 import six
 
-from wotpy.wot.enums import InteractionTypes
+from wotpy.wot.enums import InteractionTypes, TDChangeMethod, TDChangeType
 
 
 class InteractionsSubscriber(object):
     """Class that subscribes to all the Interactions of one kind for
-    all the ExposedThings contained by a Protocol Binding server."""
+    all the ExposedThings contained by a Protocol Binding server.
+    Once started, subscriptions are updated when ExposedThings are added to
+    or removed from the server and when their Thing Descriptions change."""
 
     def __init__(self, interaction_type, server, on_next_builder):
         assert interaction_type in [InteractionTypes.PROPERTY, InteractionTypes.EVENT]
@@ -23,11 +25,16 @@ class InteractionsSubscriber(object):
         self._server = server
         self._on_next_builder = on_next_builder
         self._subs = {}
+        self._subs_td_change = {}
+        self._sub_server = None
         self._logr = logging.getLogger(__name__)
 
     def _dispose_exposed_thing_subs(self, exp_thing):
         """Disposes of all currently active subscriptions for the given ExposedThing."""
 
+        if exp_thing in self._subs_td_change:
+            self._subs_td_change.pop(exp_thing).dispose()
+
         if exp_thing not in self._subs:
             return
 
@@ -36,6 +43,40 @@ class InteractionsSubscriber(object):
 
         self._subs.pop(exp_thing)
 
+    def _td_change_type(self):
+        """Returns the TDChangeType for the current type of interactions."""
+
+        return {
+            InteractionTypes.PROPERTY: TDChangeType.PROPERTY,
+            InteractionTypes.EVENT: TDChangeType.EVENT
+        }.get(self._interaction_type)
+
+    def _watch_exposed_thing(self, exp_thing):
+        """Subscribes to the TD changes of the given ExposedThing
+        to refresh its subscriptions when its interactions change."""
+
+        if self._sub_server is None or exp_thing in self._subs_td_change:
+            return
+
+        td_change_type = self._td_change_type()
+
+        def on_td_change(item):
+            if item.data.td_change_type == td_change_type and exp_thing in self._subs_td_change:
+                self._refresh_exposed_thing_subs(exp_thing)
+
+        self._subs_td_change[exp_thing] = exp_thing.on_td_change().subscribe(on_td_change)
+
+    def _on_exposed_thing_change(self, item):
+        """Updates the subscriptions when an ExposedThing is added to or removed from the server."""
+
+        method, exp_thing = item
+
+        if method == TDChangeMethod.ADD:
+            self._watch_exposed_thing(exp_thing)
+            self._refresh_exposed_thing_subs(exp_thing)
+        elif method == TDChangeMethod.REMOVE:
+            self._dispose_exposed_thing_subs(exp_thing)
+
     def _interaction_attr_name(self):
         """Returns the attribute name of the Thing and ExposedThing
         iterator for the current type of interactions."""
@@ -88,14 +129,28 @@ class InteractionsSubscriber(object):
 
             thing_subs[intrc] = exp_thing_intrc.subscribe(on_next=on_next, on_error=on_error)
 
+    def start(self):
+        """Subscribes to all the ExposedThings in the server and starts
+        reacting to changes in the server and in the ExposedThings."""
+
+        if self._sub_server is None:
+            self._sub_server = self._server.on_exposed_thing_change().subscribe(self._on_exposed_thing_change)
+
+        self.refresh()
+
     def dispose(self):
         """Disposes of all the currently active subscriptions."""
 
-        for exp_thing in list(six.iterkeys(self._subs)):
+        if self._sub_server is not None:
+            self._sub_server.dispose()
+            self._sub_server = None
+
+        for exp_thing in list(set(self._subs).union(self._subs_td_change)):
             self._dispose_exposed_thing_subs(exp_thing)
 
     def refresh(self):
-        """Refresh all subscriptions for the entire set of ExposedThings."""
+        """Refresh all subscriptions for the entire set of ExposedThings.
+        This full reconciliation is not needed once the subscriber has been started."""
 
         things_expected = set(self._server.exposed_things)
         things_current = set(self._subs.keys())
@@ -105,4 +160,5 @@ class InteractionsSubscriber(object):
             self._dispose_exposed_thing_subs(exp_thing)
 
         for exp_thing in things_expected:
+            self._watch_exposed_thing(exp_thing)
             self._refresh_exposed_thing_subs(exp_thing)
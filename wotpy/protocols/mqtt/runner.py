@@ -6,11 +6,12 @@ Base class for MQTT handlers.
 """
 
 import asyncio
+import collections
 import copy
-import datetime
 import logging
 import uuid
 
+import six
 import tornado.concurrent
 import tornado.gen
 import tornado.ioloop
@@ -22,13 +23,207 @@ from tornado.queues import Queue
 from wotpy.protocols.mqtt.enums import MQTTCodesACK
 
 
+def topic_matches(topic_filter, topic):
+    """Returns True if the given topic matches the (possibly wildcarded) MQTT topic filter."""
+
+    filter_levels = topic_filter.split("/")
+    topic_levels = topic.split("/")
+
+    for idx, level in enumerate(filter_levels):
+        if level == "#":
+            return True
+
+        if idx >= len(topic_levels):
+            return False
+
+        if level != "+" and level != topic_levels[idx]:
+            return False
+
+    return len(filter_levels) == len(topic_levels)
+
+
+class MQTTTopicRouter(object):
+    """Routes the messages delivered by the broker to the MQTT handler
+    that subscribed to a topic filter that matches the message topic.
+    Routes are indexed by the literal prefix of each topic filter."""
+
+    def __init__(self, mqtt_handlers):
+        self._routes = {}
+
+        for handler in mqtt_handlers:
+            for topic_filter, qos in (handler.topics or []):
+                prefix = self.filter_prefix(topic_filter)
+                self._routes.setdefault(prefix, []).append((topic_filter, handler))
+
+        self._prefixes = sorted(six.iterkeys(self._routes), key=len, reverse=True)
+
+    @classmethod
+    def filter_prefix(cls, topic_filter):
+        """Returns the literal part of a topic filter that precedes the first wildcard."""
+
+        levels = []
+
+        for level in topic_filter.split("/"):
+            if level in ["#", "+"]:
+                levels.append("")
+                break
+
+            levels.append(level)
+
+        return "/".join(levels)
+
+    def route(self, topic):
+        """Returns the MQTT handler for the given topic or None if no handler matches."""
+
+        for prefix in self._prefixes:
+            if not topic.startswith(prefix):
+                continue
+
+            for topic_filter, handler in self._routes[prefix]:
+                if topic_matches(topic_filter, topic):
+                    return handler
+
+        return None
+
+
+class MQTTHandlerPool(object):
+    """Runs the messages routed to an MQTT handler on a bounded number of concurrent
+    workers. Messages that share an ordering key (e.g. messages for the same Thing)
+    are optionally handled sequentially, while the rest are handled in parallel."""
+
+    def __init__(self, mqtt_handler, concurrency, max_queued, ordered=False, drop_on_full=False):
+        assert concurrency > 0 and max_queued > 0
+        self._mqtt_handler = mqtt_handler
+        self._concurrency = concurrency
+        self._max_queued = max_queued
+        self._ordered = ordered
+        self._drop_on_full = drop_on_full
+        self._queue = Queue()
+        self._keys_pending = {}
+        self._cond_space = tornado.locks.Condition()
+        self._worker_tasks = []
+        self._logr = logging.getLogger(__name__)
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.handled = 0
+        self.dropped = 0
+        self.errors = 0
+
+    @property
+    def stats(self):
+        """Dict with the current queue depth, in-flight count and cumulative counters of this pool."""
+
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "handled": self.handled,
+            "dropped": self.dropped,
+            "errors": self.errors
+        }
+
+    async def submit(self, message):
+        """Enqueues a message to be handled by the pool workers.
+        Waits for free space if the pool is full, unless the pool
+        has been configured to drop messages in that case."""
+
+        while self.queue_depth >= self._max_queued:
+            if self._drop_on_full:
+                self.dropped += 1
+                self._logr.debug("Dropped message (full pool): {}".format(message.topic))
+                return
+
+            await self._cond_space.wait()
+
+        self.queue_depth += 1
+
+        key = self._mqtt_handler.ordering_key(message) if self._ordered else None
+
+        if key is not None and key in self._keys_pending:
+            self._keys_pending[key].append(message)
+            return
+
+        if key is not None:
+            self._keys_pending[key] = collections.deque()
+
+        self._queue.put_nowait((key, message))
+
+    async def _handle(self, message):
+        """Passes a message to the MQTT handler and waits for it to be processed."""
+
+        self.queue_depth -= 1
+        self._cond_space.notify()
+        self.in_flight += 1
+
+        try:
+            await tornado.gen.convert_yielded(self._mqtt_handler.handle_message(message))
+            self.handled += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.errors += 1
+            self._logr.warning("MQTT handler error: {}".format(ex), exc_info=True)
+        finally:
+            self.in_flight -= 1
+
+    async def _worker(self):
+        """Handles the messages in the pool queue. Messages that share an ordering
+        key and arrive while another message with that key is being handled are
+        handled afterwards by the same worker."""
+
+        while True:
+            key, message = await self._queue.get()
+
+            await self._handle(message)
+
+            if key is None:
+                continue
+
+            pending = self._keys_pending[key]
+
+            while pending:
+                await self._handle(pending.popleft())
+
+            self._keys_pending.pop(key)
+
+    def start(self):
+        """Starts the pool workers."""
+
+        if self._worker_tasks:
+            return
+
+        self._worker_tasks = [
+            asyncio.ensure_future(self._worker())
+            for _ in range(self._concurrency)
+        ]
+
+    @tornado.gen.coroutine
+    def stop(self):
+        """Cancels the pool workers and discards the queued messages."""
+
+        worker_tasks, self._worker_tasks = self._worker_tasks, []
+
+        for task in worker_tasks:
+            task.cancel()
+
+        if worker_tasks:
+            yield asyncio.gather(*worker_tasks, return_exceptions=True)
+
+        self._queue = Queue()
+        self._keys_pending = {}
+        self.queue_depth = 0
+        self.in_flight = 0
+        self._cond_space.notify_all()
+
+
 class MQTTHandlerRunner(object):
-    """Class that wraps an MQTT handler. It handles connections to the
-    MQTT broker, delivers messages, and runs the handler in a loop."""
+    """Class that wraps a set of MQTT handlers. It handles the connection to the
+    MQTT broker, routes the delivered messages to each handler, and publishes
+    the messages queued by the handlers through a shared publish queue."""
 
-    DEFAULT_TIMEOUT_LOOPS_SECS = 0.1
     DEFAULT_SLEEP_ERR_RECONN = 2.0
     DEFAULT_MSGS_BUF_SIZE = 500
+    DEFAULT_HANDLER_CONCURRENCY = 100
+    DEFAULT_PUBLISH_WINDOW = 16
 
     # Highly permissive default keep_alive to avoid
     # disconnections from broker on high throughput scenarios:
@@ -38,28 +233,84 @@ class MQTTHandlerRunner(object):
         "keep_alive": 90
     }
 
-    def __init__(self, broker_url, mqtt_handler,
+    def __init__(self, broker_url, mqtt_handlers,
                  messages_buffer_size=DEFAULT_MSGS_BUF_SIZE,
-                 timeout_loops=DEFAULT_TIMEOUT_LOOPS_SECS,
                  sleep_error_reconnect=DEFAULT_SLEEP_ERR_RECONN,
-                 hbmqtt_config=None):
+                 hbmqtt_config=None,
+                 handler_concurrency=DEFAULT_HANDLER_CONCURRENCY,
+                 handler_ordered=False,
+                 handler_drop_on_full=False,
+                 publish_window=DEFAULT_PUBLISH_WINDOW):
+        assert publish_window > 0
+
         self._broker_url = broker_url
-        self._mqtt_handler = mqtt_handler
+        self._mqtt_handlers = list(mqtt_handlers)
+        self._router = MQTTTopicRouter(self._mqtt_handlers)
+        self._publish_queue = Queue(maxsize=messages_buffer_size)
         self._messages_buffer = Queue(maxsize=messages_buffer_size)
-        self._timeout_loops_secs = timeout_loops
         self._sleep_error_reconnect = sleep_error_reconnect
         self._hbmqtt_config = hbmqtt_config
         self._client = None
         self._client_id = uuid.uuid4().hex
         self._lock_conn = tornado.locks.Lock()
-        self._lock_run = tornado.locks.Lock()
-        self._event_stop_request = tornado.locks.Event()
+        self._loop_tasks = []
+        self._unrouted = 0
+        self._publish_window_size = publish_window
+        self._publish_window = tornado.locks.Semaphore(publish_window)
+        self._publish_in_flight = Queue()
+        self._publish_tasks = set()
+        self._published = 0
+        self._publish_retries = 0
         self._logr = logging.getLogger(__name__)
 
+        self._pools = {
+            handler: MQTTHandlerPool(
+                handler,
+                concurrency=handler_concurrency,
+                max_queued=messages_buffer_size,
+                ordered=handler_ordered,
+                drop_on_full=handler_drop_on_full)
+            for handler in self._mqtt_handlers
+        }
+
+        for handler in self._mqtt_handlers:
+            handler.queue = self._publish_queue
+
     def _log(self, level, msg, **kwargs):
         """Helper function to wrap all log messages."""
 
-        self._logr.log(level, "{} - {}".format(self._mqtt_handler.__class__.__name__, msg), **kwargs)
+        self._logr.log(level, "{} - {}".format(self._client_id, msg), **kwargs)
+
+    @property
+    def stats(self):
+        """Dict with the current depth of the internal messages buffer, the number
+        of messages without a matching handler, the stats of each handler pool
+        and the stats of the shared publish pipeline."""
+
+        return {
+            "buffer_depth": self._messages_buffer.qsize(),
+            "unrouted": self._unrouted,
+            "publish": {
+                "queue_depth": self._publish_queue.qsize(),
+                "in_flight": len(self._publish_tasks),
+                "published": self._published,
+                "retries": self._publish_retries
+            },
+            "handlers": {
+                handler.__class__.__name__: dict(pool.stats, **handler.stats)
+                for handler, pool in six.iteritems(self._pools)
+            }
+        }
+
+    @property
+    def topics(self):
+        """List of (topic, QoS) tuples for the union of the handlers subscriptions."""
+
+        return [
+            topic
+            for handler in self._mqtt_handlers
+            for topic in (handler.topics or [])
+        ]
 
     def _build_client_config(self):
         """Returns the config dict for a new hbmqtt client instance."""
@@ -93,9 +344,9 @@ class MQTTHandlerRunner(object):
         if ack_con != MQTTCodesACK.CON_OK:
             raise ConnectException("Error code in connection ACK: {}".format(ack_con))
 
-        if self._mqtt_handler.topics:
-            self._log(logging.DEBUG, "Subscribing to: {}".format(self._mqtt_handler.topics))
-            ack_sub = yield hbmqtt_client.subscribe(self._mqtt_handler.topics)
+        if self.topics:
+            self._log(logging.DEBUG, "Subscribing to: {}".format(self.topics))
+            ack_sub = yield hbmqtt_client.subscribe(self.topics)
 
             if MQTTCodesACK.SUB_ERROR in ack_sub:
                 raise ConnectException("Error code in subscription ACK: {}".format(ack_sub))
@@ -109,9 +360,9 @@ class MQTTHandlerRunner(object):
         try:
             self._log(logging.DEBUG, "Disconnecting MQTT client")
 
-            if self._mqtt_handler.topics:
-                self._log(logging.DEBUG, "Unsubscribing from: {}".format(self._mqtt_handler.topics))
-                yield self._client.unsubscribe([name for name, qos in self._mqtt_handler.topics])
+            if self.topics:
+                self._log(logging.DEBUG, "Unsubscribing from: {}".format(self.topics))
+                yield self._client.unsubscribe([name for name, qos in self.topics])
 
             yield self._client.disconnect()
         except Exception as ex:
@@ -142,123 +393,168 @@ class MQTTHandlerRunner(object):
 
             yield self._disconnect()
 
-    @tornado.gen.coroutine
-    def _deliver_messages(self):
-        """Receives messages from the MQTT broker and puts them in the internal buffer."""
+    async def _deliver_messages(self):
+        """Waits for messages from the MQTT broker and puts them in the internal buffer.
+        Runs until the task is cancelled."""
 
-        message = None
+        while True:
+            try:
+                message = await self._client.deliver_message()
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                self._log(logging.WARNING, "Error on MQTT deliver: {}".format(ex))
 
-        while not self._event_stop_request.is_set():
-            if message is None:
                 try:
-                    message = yield self._client.deliver_message(timeout=self._timeout_loops_secs)
-                except asyncio.TimeoutError:
-                    pass
+                    await tornado.gen.sleep(self._sleep_error_reconnect)
+                    await self.connect(force_reconnect=True)
+                except asyncio.CancelledError:
+                    raise
                 except Exception as ex:
-                    self._log(logging.WARNING, "Error on MQTT deliver: {}".format(ex))
+                    self._log(logging.ERROR, "Error reconnecting: {}".format(ex), exc_info=True)
+
+                continue
+
+            await self._messages_buffer.put(message)
+
+    async def _handle_messages(self):
+        """Waits for messages in the internal buffer and submits them to the pool of
+        the matching MQTT handler. Waits while that pool is full (i.e. backpressure).
+        Runs until the task is cancelled."""
+
+        while True:
+            message = await self._messages_buffer.get()
+            handler = self._router.route(message.topic)
+
+            if handler is None:
+                self._unrouted += 1
+                self._log(logging.DEBUG, "No handler for topic: {}".format(message.topic))
+                continue
+
+            self._log(logging.DEBUG, "Handling message: {}".format(message.data))
+            await self._pools[handler].submit(message)
+
+    async def _publish(self, message):
+        """Publishes a message on the broker and waits for the
+        handshake of the message QoS level to complete."""
+
+        await self._client.publish(
+            topic=message["topic"],
+            message=message["data"],
+            qos=message.get("qos", None),
+            retain=message.get("retain", None))
 
+    def _start_publish(self, message):
+        """Starts publishing a message and returns the publication task."""
+
+        task = asyncio.ensure_future(self._publish(message))
+        self._publish_tasks.add(task)
+        task.add_done_callback(self._publish_tasks.discard)
+
+        return task
+
+    async def _publish_queued_messages(self):
+        """Waits for messages in the shared publish queue and starts publishing them while
+        there are less than publish_window publications waiting for the broker handshake.
+        Runs until the task is cancelled."""
+
+        while True:
+            message = await self._publish_queue.get()
+            await self._publish_window.acquire()
+            self._publish_in_flight.put_nowait((message, self._start_publish(message)))
+
+    async def _confirm_published_messages(self):
+        """Waits for the in-flight publications in the order they were started.
+        Failed publications are retried (in that same order) before releasing
+        their slot in the in-flight window. Runs until the task is cancelled."""
+
+        while True:
+            message, task = await self._publish_in_flight.get()
+
+            try:
+                while True:
                     try:
-                        yield tornado.gen.sleep(self._sleep_error_reconnect)
-                        yield self.connect(force_reconnect=True)
+                        await task
+                        self._published += 1
+                        break
+                    except asyncio.CancelledError:
+                        raise
                     except Exception as ex:
-                        self._log(logging.ERROR, "Error reconnecting: {}".format(ex), exc_info=True)
+                        self._log(logging.WARNING, "Exception publishing: {}".format(ex), exc_info=True)
+                        await tornado.gen.sleep(self._sleep_error_reconnect)
+                        self._log(logging.WARNING, "Republish attempt: {}".format(message))
+                        self._publish_retries += 1
+                        task = self._start_publish(message)
+            finally:
+                self._publish_window.release()
 
-            if message is not None:
-                try:
-                    timeout_put = datetime.timedelta(seconds=self._timeout_loops_secs)
-                    yield self._messages_buffer.put(message, timeout=timeout_put)
-                    message = None
-                except tornado.util.TimeoutError:
-                    self._log(logging.DEBUG, "Full messages buffer")
+    def _start_loops(self):
+        """Starts the tasks that listen and handle the messages published in the
+        topics that are of interest to the handlers and publish the queued messages."""
 
-    @tornado.gen.coroutine
-    def _handle_messages(self):
-        """Gets messages from the internal buffer and
-        passes them to the MQTT handler to be processed."""
+        if self._loop_tasks:
+            self._log(logging.WARNING, "Cannot start MQTT runner loops while others are already running")
+            return
 
-        while not self._event_stop_request.is_set():
-            try:
-                timeout_get = datetime.timedelta(seconds=self._timeout_loops_secs)
-                message = yield self._messages_buffer.get(timeout=timeout_get)
-                self._log(logging.DEBUG, "Handling message: {}".format(message.data))
-                tornado.gen.convert_yielded(self._mqtt_handler.handle_message(message))
-            except tornado.util.TimeoutError:
-                pass
-            except Exception as ex:
-                self._log(logging.WARNING, "MQTT handler error: {}".format(ex), exc_info=True)
+        self._log(logging.DEBUG, "Starting MQTT runner loops")
+
+        for pool in six.itervalues(self._pools):
+            pool.start()
+
+        self._publish_window = tornado.locks.Semaphore(self._publish_window_size)
+        self._publish_in_flight = Queue()
+
+        self._loop_tasks = [
+            asyncio.ensure_future(self._deliver_messages()),
+            asyncio.ensure_future(self._handle_messages()),
+            asyncio.ensure_future(self._publish_queued_messages()),
+            asyncio.ensure_future(self._confirm_published_messages())
+        ]
 
     @tornado.gen.coroutine
-    def _publish_queued_messages(self):
-        """Gets the pending messages from the handler queue and publishes them on the broker."""
+    def _cancel_loops(self):
+        """Cancels the loop tasks and waits for them to finish."""
 
-        message = None
+        if not self._loop_tasks:
+            return
 
-        while not self._event_stop_request.is_set():
-            try:
-                if message is None:
-                    timeout_get = datetime.timedelta(seconds=self._timeout_loops_secs)
-                    message = yield self._mqtt_handler.queue.get(timeout=timeout_get)
-                else:
-                    self._log(logging.WARNING, "Republish attempt: {}".format(message))
-
-                yield self._client.publish(
-                    topic=message["topic"],
-                    message=message["data"],
-                    qos=message.get("qos", None),
-                    retain=message.get("retain", None))
-
-                message = None
-            except tornado.util.TimeoutError:
-                pass
-            except Exception as ex:
-                self._log(logging.WARNING, "Exception publishing: {}".format(ex), exc_info=True)
-                yield tornado.gen.sleep(self._sleep_error_reconnect)
+        self._log(logging.DEBUG, "Cancelling MQTT runner loops")
 
-    def _add_loop_callback(self):
-        """Adds the callback that will start the infinite loop
-        to listen and handle the messages published in the topics
-        that are of interest to this MQTT client."""
+        loop_tasks, self._loop_tasks = self._loop_tasks, []
 
-        @tornado.gen.coroutine
-        def run_loop():
-            try:
-                with (yield self._lock_run.acquire(timeout=0)):
-                    self._log(logging.DEBUG, "Entering MQTT runner loop")
+        for task in loop_tasks:
+            task.cancel()
 
-                    yield [
-                        self._deliver_messages(),
-                        self._handle_messages(),
-                        self._publish_queued_messages()
-                    ]
-            except tornado.util.TimeoutError:
-                self._log(logging.WARNING, "Cannot start MQTT handler loop while another is already running")
+        yield asyncio.gather(*loop_tasks, return_exceptions=True)
 
-        tornado.ioloop.IOLoop.current().spawn_callback(run_loop)
+        publish_tasks = list(self._publish_tasks)
+
+        for task in publish_tasks:
+            task.cancel()
+
+        if publish_tasks:
+            yield asyncio.gather(*publish_tasks, return_exceptions=True)
+
+        yield [pool.stop() for pool in six.itervalues(self._pools)]
 
     @tornado.gen.coroutine
     def start(self):
         """Starts listening for published messages."""
 
-        self._event_stop_request.set()
-
-        with (yield self._lock_run.acquire()):
-            self._event_stop_request.clear()
+        yield self._cancel_loops()
 
         yield self.connect(force_reconnect=True)
 
-        yield self._mqtt_handler.init()
+        yield [handler.init() for handler in self._mqtt_handlers]
 
-        self._add_loop_callback()
+        self._start_loops()
 
     @tornado.gen.coroutine
     def stop(self):
         """Stops listening for published messages."""
 
-        self._event_stop_request.set()
-
-        with (yield self._lock_run.acquire()):
-            pass
+        yield self._cancel_loops()
 
-        yield self._mqtt_handler.teardown()
+        yield [handler.teardown() for handler in self._mqtt_handlers]
 
         yield self.disconnect()
@@ -12,6 +12,7 @@ from slugify import slugify
 
 from wotpy.codecs.enums import MediaTypes
 from wotpy.protocols.enums import Protocols, InteractionVerbs
+from wotpy.protocols.mqtt.enums import MQTTCommandCodes, MQTTVocabularyKeys
 from wotpy.protocols.mqtt.handlers.action import ActionMQTTHandler
 from wotpy.protocols.mqtt.handlers.event import EventMQTTHandler
 from wotpy.protocols.mqtt.handlers.ping import PingMQTTHandler
@@ -27,22 +28,59 @@ class MQTTServer(BaseProtocolServer):
 
     DEFAULT_SERVIENT_ID = 'wotpy'
 
-    def __init__(self, broker_url, property_callback_ms=None, event_callback_ms=None, servient_id=None):
+    def __init__(self, broker_url, property_callback_ms=None, event_callback_ms=None, servient_id=None,
+                 handler_concurrency=MQTTHandlerRunner.DEFAULT_HANDLER_CONCURRENCY,
+                 handler_ordered=False, handler_drop_on_full=False,
+                 publish_window=MQTTHandlerRunner.DEFAULT_PUBLISH_WINDOW,
+                 event_queue_size=None, event_overflow_policy=None, event_overflow_timeout=None,
+                 property_retain=False):
         super(MQTTServer, self).__init__(port=None)
         self._broker_url = broker_url
         self._server_lock = tornado.locks.Lock()
         self._servient_id = servient_id
+        self._form_options = {}
+
+        # All handlers share a single broker connection: messages are
+        # routed by topic and published through a single queue.
+
+        # Handler messages are run on pools of at most handler_concurrency workers.
+        # Requests for the same Thing are handled in order if handler_ordered is set.
+        # Up to publish_window QoS 1/2 publications may wait for the broker handshake.
+        # Property updates are coalesced by topic, while Event emissions are kept in a
+        # bounded queue of event_queue_size with the given event_overflow_policy.
+        # Property updates are published as retained messages if property_retain is set.
+        # The QoS and retain flag of each Form may be overridden with set_form_options.
+
+        self._handlers = {
+            InteractionTypes.PROPERTY: PropertyMQTTHandler(
+                mqtt_server=self,
+                callback_ms=property_callback_ms,
+                retain_updates=property_retain),
+            InteractionTypes.EVENT: EventMQTTHandler(
+                mqtt_server=self,
+                callback_ms=event_callback_ms,
+                queue_size=event_queue_size,
+                overflow_policy=event_overflow_policy,
+                overflow_timeout=event_overflow_timeout),
+            InteractionTypes.ACTION: ActionMQTTHandler(mqtt_server=self)
+        }
 
-        def build_runner(handler):
-            return MQTTHandlerRunner(broker_url=self._broker_url, mqtt_handler=handler)
-
-        self._handler_runners = [
-            build_runner(PingMQTTHandler(mqtt_server=self)),
-            build_runner(PropertyMQTTHandler(mqtt_server=self, callback_ms=property_callback_ms)),
-            build_runner(EventMQTTHandler(mqtt_server=self, callback_ms=event_callback_ms)),
-            build_runner(ActionMQTTHandler(mqtt_server=self)),
+        mqtt_handlers = [PingMQTTHandler(mqtt_server=self)] + [
+            self._handlers[intrct_type] for intrct_type in [
+                InteractionTypes.PROPERTY,
+                InteractionTypes.EVENT,
+                InteractionTypes.ACTION
+            ]
         ]
 
+        self._runner = MQTTHandlerRunner(
+            broker_url=self._broker_url,
+            mqtt_handlers=mqtt_handlers,
+            handler_concurrency=handler_concurrency,
+            handler_ordered=handler_ordered,
+            handler_drop_on_full=handler_drop_on_full,
+            publish_window=publish_window)
+
     @property
     def servient_id(self):
         """Servient ID that is used to avoid topic collisions
@@ -50,6 +88,13 @@ class MQTTServer(BaseProtocolServer):
 
         return slugify(self._servient_id) if self._servient_id else self.DEFAULT_SERVIENT_ID
 
+    @property
+    def stats(self):
+        """Dict with the queue depths, in-flight counts and drop counters
+        of the MQTT handlers and the publish pipeline of this server."""
+
+        return self._runner.stats
+
     @property
     def protocol(self):
         """Protocol of this server instance.
@@ -57,6 +102,49 @@ class MQTTServer(BaseProtocolServer):
 
         return Protocols.MQTT
 
+    def set_form_options(self, interaction, op, qos=None, retain=None):
+        """Overrides the QoS level and retain flag of the messages exchanged through the
+        Form of the given Interaction and operation (e.g. QoS 0 for high-rate telemetry).
+        Should be called before the ExposedThing is exposed for the Forms to advertise the options."""
+
+        options = self._form_options.setdefault((interaction.thing.id, interaction.name, op), {})
+
+        if qos is not None:
+            options.update({"qos": qos})
+
+        if retain is not None:
+            options.update({"retain": retain})
+
+    def get_form_options(self, interaction, op):
+        """Returns a dict with the QoS level and retain flag of the
+        messages exchanged through the Form of the given Interaction and operation."""
+
+        options = dict(self._handlers[interaction.interaction_type].default_form_options(op))
+        options.update(self._form_options.get((interaction.thing.id, interaction.name, op), {}))
+
+        return options
+
+    def _build_form_terms(self, interaction, op, command_code):
+        """Returns the dict of MQTT vocabulary terms that describe
+        the Form of the given Interaction and operation."""
+
+        return self._build_options_terms(self.get_form_options(interaction, op), command_code)
+
+    @classmethod
+    def _build_options_terms(cls, options, command_code):
+        """Returns the dict of MQTT vocabulary terms for the given command code and options."""
+
+        return {
+            MQTTVocabularyKeys.COMMAND_CODE: command_code,
+            MQTTVocabularyKeys.OPTIONS: [{
+                MQTTVocabularyKeys.OPTION_NAME: MQTTVocabularyKeys.OPTION_NAME_QOS,
+                MQTTVocabularyKeys.OPTION_VALUE: options["qos"]
+            }, {
+                MQTTVocabularyKeys.OPTION_NAME: MQTTVocabularyKeys.OPTION_NAME_RETAIN,
+                MQTTVocabularyKeys.OPTION_VALUE: options["retain"]
+            }]
+        }
+
     def _build_forms_property(self, proprty):
         """Builds and returns the MQTT Form instances for the given Property interaction."""
 
@@ -71,14 +159,16 @@ class MQTTServer(BaseProtocolServer):
             protocol=self.protocol,
             href=href_rw,
             content_type=MediaTypes.JSON,
-            op=InteractionVerbs.READ_PROPERTY)
+            op=InteractionVerbs.READ_PROPERTY,
+            **self._build_form_terms(proprty, InteractionVerbs.READ_PROPERTY, MQTTCommandCodes.PUBLISH))
 
         form_write = Form(
             interaction=proprty,
             protocol=self.protocol,
             href=href_rw,
             content_type=MediaTypes.JSON,
-            op=InteractionVerbs.WRITE_PROPERTY)
+            op=InteractionVerbs.WRITE_PROPERTY,
+            **self._build_form_terms(proprty, InteractionVerbs.WRITE_PROPERTY, MQTTCommandCodes.PUBLISH))
 
         href_observe = "{}/{}/property/updates/{}/{}".format(
             self._broker_url.rstrip("/"),
@@ -91,7 +181,8 @@ class MQTTServer(BaseProtocolServer):
             protocol=self.protocol,
             href=href_observe,
             content_type=MediaTypes.JSON,
-            op=InteractionVerbs.OBSERVE_PROPERTY)
+            op=InteractionVerbs.OBSERVE_PROPERTY,
+            **self._build_form_terms(proprty, InteractionVerbs.OBSERVE_PROPERTY, MQTTCommandCodes.SUBSCRIBE))
 
         return [form_read, form_write, form_observe]
 
@@ -109,7 +200,8 @@ class MQTTServer(BaseProtocolServer):
             protocol=self.protocol,
             href=href,
             content_type=MediaTypes.JSON,
-            op=InteractionVerbs.INVOKE_ACTION)
+            op=InteractionVerbs.INVOKE_ACTION,
+            **self._build_form_terms(action, InteractionVerbs.INVOKE_ACTION, MQTTCommandCodes.PUBLISH))
 
         return [form]
 
@@ -127,7 +219,8 @@ class MQTTServer(BaseProtocolServer):
             protocol=self.protocol,
             href=href,
             content_type=MediaTypes.JSON,
-            op=InteractionVerbs.SUBSCRIBE_EVENT)
+            op=InteractionVerbs.SUBSCRIBE_EVENT,
+            **self._build_form_terms(event, InteractionVerbs.SUBSCRIBE_EVENT, MQTTCommandCodes.SUBSCRIBE))
 
         return [form]
 
@@ -146,6 +239,32 @@ class MQTTServer(BaseProtocolServer):
 
         return intrct_type_map[interaction.interaction_type](interaction)
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns a list with all Forms that are linked to this server
+        for the operations that apply to the whole Thing (e.g. readallproperties)."""
+
+        href = "{}/{}/property/requests/{}".format(
+            self._broker_url.rstrip("/"),
+            self.servient_id,
+            thing.url_name)
+
+        options = self._handlers[InteractionTypes.PROPERTY].default_form_options(
+            InteractionVerbs.READ_MULTIPLE_PROPERTIES)
+
+        form = Form(
+            interaction=None,
+            protocol=self.protocol,
+            href=href,
+            content_type=MediaTypes.JSON,
+            op=[
+                InteractionVerbs.READ_ALL_PROPERTIES,
+                InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+            ],
+            **self._build_options_terms(options, MQTTCommandCodes.PUBLISH))
+
+        return [form]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
@@ -157,11 +276,11 @@ class MQTTServer(BaseProtocolServer):
         that handle the WoT clients requests."""
 
         with (yield self._server_lock.acquire()):
-            yield [runner.start() for runner in self._handler_runners]
+            yield self._runner.start()
 
     @tornado.gen.coroutine
     def stop(self):
         """Stops the MQTT broker and the MQTT clients."""
 
         with (yield self._server_lock.acquire()):
-            yield [runner.stop() for runner in self._handler_runners]
+            yield self._runner.stop()
@@ -7,6 +7,9 @@ Class that represents the abstract server interface.
 
 from abc import ABCMeta, abstractmethod
 
+from rx.subjects import Subject
+
+from wotpy.wot.enums import TDChangeMethod
 from wotpy.wot.exposed.thing_set import ExposedThingSet
 
 
@@ -20,6 +23,7 @@ class BaseProtocolServer(object):
         self._port = port
         self._codecs = []
         self._exposed_thing_set = ExposedThingSet()
+        self._exposed_things_subject = Subject()
 
     @property
     @abstractmethod
@@ -47,6 +51,12 @@ class BaseProtocolServer(object):
 
         return self._exposed_thing_set.exposed_things
 
+    def on_exposed_thing_change(self):
+        """Returns an Observable that emits a (TDChangeMethod, ExposedThing) tuple
+        each time an ExposedThing is added to or removed from this server."""
+
+        return self._exposed_things_subject.as_observable()
+
     def codec_for_media_type(self, media_type):
         """Returns a BaseCodec to serialize or deserialize content for the given media type."""
 
@@ -64,12 +74,17 @@ class BaseProtocolServer(object):
         """Adds the given ExposedThing to this server."""
 
         self._exposed_thing_set.add(exposed_thing)
+        self._exposed_things_subject.on_next((TDChangeMethod.ADD, exposed_thing))
 
     def remove_exposed_thing(self, thing_id):
         """Removes the given ExposedThing from this server."""
 
+        exposed_thing = self._exposed_thing_set.find_by_thing_id(thing_id)
         self._exposed_thing_set.remove(thing_id)
 
+        if exposed_thing is not None:
+            self._exposed_things_subject.on_next((TDChangeMethod.REMOVE, exposed_thing))
+
     def get_exposed_thing(self, name):
         """Finds and returns an ExposedThing contained in this server by name.
         Raises ValueError if the ExposedThing is not present."""
@@ -88,6 +103,13 @@ class BaseProtocolServer(object):
 
         raise NotImplementedError()
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns a list with all Form that are linked to this server
+        for the operations that apply to the whole Thing (e.g. readallproperties).
+        Servers that do not support these operations return an empty list."""
+
+        return []
+
     @abstractmethod
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
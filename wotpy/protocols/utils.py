@@ -22,6 +22,13 @@ def is_scheme_form(form, base, scheme):
     return parsed_scheme in scheme if isinstance(scheme, list) else parsed_scheme == scheme
 
 
+def is_op_form(form, op):
+    """Returns True if the given Form supports the op interaction verb.
+    The op of the Form may be a single verb or a list of verbs."""
+
+    return form.op == op or (isinstance(form.op, list) and op in form.op)
+
+
 def pick_form(td, forms, schemes, op=None):
     """Picks the Form that will be used to connect to the remote Thing."""
 
@@ -32,7 +39,7 @@ def pick_form(td, forms, schemes, op=None):
         ]
 
         if op is not None:
-            scheme_forms = [form for form in scheme_forms if form.op == op]
+            scheme_forms = [form for form in scheme_forms if is_op_form(form, op)]
 
         if len(scheme_forms):
             return scheme_forms[0]
@@ -9,15 +9,15 @@ import datetime
 import logging
 import uuid
 
+import six
 import tornado.gen
 import tornado.ioloop
-import tornado.locks
 import tornado.websocket
 from rx import Observable
 from tornado.concurrent import Future
 
 from wotpy.protocols.client import BaseProtocolClient
-from wotpy.protocols.enums import Protocols
+from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.exceptions import FormNotFoundException, ClientRequestTimeout
 from wotpy.protocols.refs import ConnRefCounter
 from wotpy.protocols.utils import pick_form, is_scheme_form
@@ -34,135 +34,254 @@ from wotpy.wot.events import \
     PropertyChangeEventInit
 
 
+class WebsocketClientSubscription(object):
+    """Represents a subscription of a WebsocketClient
+    to an Observable exposed by a remote Thing."""
+
+    def __init__(self, ws_url, msg_id, on_next, on_error):
+        self.ws_url = ws_url
+        self.msg_id = msg_id
+        self.on_next = on_next
+        self.on_error = on_error
+        self.subscription_id = None
+        self.disposed = False
+
+
 class WebsocketClient(BaseProtocolClient):
-    """Implementation of the protocol client interface for the Websocket protocol."""
+    """Implementation of the protocol client interface for the Websocket protocol.
+    A single long-lived connection is kept for each WebSockets URL. Requests are
+    pipelined over that connection and responses are matched to the pending
+    requests by message ID. Subscriptions also share the connection and emitted
+    items are routed to their observers by subscription ID.
+    Connections are closed after being idle for a while."""
 
-    SLEEP_AFTER_ERR_SECS = 1.0
-    RECEIVE_LOOP_TERMINATE_SLEEP_SECS = 0.1
+    DEFAULT_IDLE_TIMEOUT_SECS = 30.0
 
-    def __init__(self, receive_timeout_secs=1.0, ping_interval=2000):
+    def __init__(self, receive_timeout_secs=1.0, ping_interval=2000,
+                 idle_timeout_secs=DEFAULT_IDLE_TIMEOUT_SECS):
         self._receive_timeout_secs = receive_timeout_secs
         self._ping_interval = ping_interval
+        self._idle_timeout_secs = idle_timeout_secs
         self._conns = {}
         self._ref_counter = ConnRefCounter()
-        self._lock_conn = tornado.locks.Lock()
-        self._msg_conditions = {}
-        self._messages = {}
-        self._receive_stop_events = {}
+        self._idle_handles = {}
+        self._pending = {}
+        self._pending_subscriptions = {}
+        self._subscriptions = {}
         self._logr = logging.getLogger(__name__)
 
     @tornado.gen.coroutine
-    def _init_conn(self, ws_url, ref_id):
-        """Initializes and connects the WebSockets connection."""
-
-        with (yield self._lock_conn.acquire()):
-            self._ref_counter.increase(ws_url, ref_id)
-
-            if ws_url in self._conns:
-                return
+    def _get_conn(self, ws_url):
+        """Returns the active WebSockets connection for the given URL.
+        A new connection is opened if there is no active connection.
+        Concurrent callers share the same connection attempt."""
 
+        if ws_url not in self._conns:
             self._logr.debug("Connecting to <{}>".format(ws_url))
 
-            self._conns[ws_url] = yield tornado.websocket.websocket_connect(
+            future_conn = tornado.websocket.websocket_connect(
                 ws_url,
-                ping_interval=self._ping_interval)
+                ping_interval=self._ping_interval,
+                on_message_callback=lambda raw_msg: self._on_message(ws_url, future_conn, raw_msg))
 
-            @tornado.gen.coroutine
-            def _start_receive_loop():
-                yield self._receive_loop(ws_url)
+            self._conns[ws_url] = future_conn
 
-            self._receive_stop_events[ws_url] = tornado.locks.Event()
-            tornado.ioloop.IOLoop.current().add_callback(_start_receive_loop)
+        future_conn = self._conns[ws_url]
 
-    @tornado.gen.coroutine
-    def _stop_conn(self, ws_url, ref_id):
-        """Disconnects the WebSockets connection."""
+        try:
+            conn = yield future_conn
+        except Exception:
+            if self._conns.get(ws_url, None) is future_conn:
+                self._conns.pop(ws_url)
 
-        with (yield self._lock_conn.acquire()):
-            self._ref_counter.decrease(ws_url, ref_id)
+            raise
 
-            if self._ref_counter.has_any(ws_url):
-                return
+        raise tornado.gen.Return(conn)
 
-            try:
-                if ws_url in self._conns:
-                    self._logr.debug("Disconnecting WS client: {}".format(ws_url))
-                    yield self._conns[ws_url].close()
-            except Exception as ex:
-                self._logr.warning("Error disconnecting: {}".format(ex), exc_info=True)
+    def _acquire_conn(self, ws_url, ref_id):
+        """Adds a reference to the connection for the given URL
+        and cancels the pending idle timeout (if any)."""
 
-            if ws_url in self._receive_stop_events:
-                self._logr.debug("Stopping message read loop: {}".format(ws_url))
+        self._ref_counter.increase(ws_url, ref_id)
 
-                self._receive_stop_events[ws_url].set()
+        idle_handle = self._idle_handles.pop(ws_url, None)
 
-                while self._receive_stop_events[ws_url].is_set():
-                    yield tornado.gen.sleep(self.RECEIVE_LOOP_TERMINATE_SLEEP_SECS)
+        if idle_handle is not None:
+            tornado.ioloop.IOLoop.current().remove_timeout(idle_handle)
 
-                self._receive_stop_events.pop(ws_url)
+    def _release_conn(self, ws_url, ref_id):
+        """Removes a reference to the connection for the given URL.
+        The connection is closed if it remains idle for the idle timeout."""
 
-            self._conns.pop(ws_url, None)
-            self._messages.pop(ws_url, None)
-            self._msg_conditions.pop(ws_url, None)
+        self._ref_counter.decrease(ws_url, ref_id)
 
-    @tornado.gen.coroutine
-    def _send_message(self, ws_url, msg_req):
-        """Sends a WebSockets message and returns the condition
-        that will be notified when the response arrives."""
+        if self._ref_counter.has_any(ws_url) or ws_url in self._idle_handles:
+            return
 
-        if ws_url not in self._conns:
-            self._logr.warning("<{}> is not an active connection".format(ws_url))
+        self._idle_handles[ws_url] = tornado.ioloop.IOLoop.current().call_later(
+            self._idle_timeout_secs, self._close_idle_conn, ws_url)
+
+    def _close_idle_conn(self, ws_url):
+        """Closes the connection for the given URL if there are no references pointing to it."""
+
+        self._idle_handles.pop(ws_url, None)
+
+        if self._ref_counter.has_any(ws_url) or ws_url not in self._conns:
             return
 
-        if ws_url not in self._msg_conditions:
-            self._msg_conditions[ws_url] = {}
+        future_conn = self._conns.pop(ws_url)
 
-        if msg_req.id in self._msg_conditions[ws_url]:
-            self._logr.warning("Message condition already exists")
+        if future_conn.done() and not future_conn.exception():
+            self._logr.debug("Closing idle WS connection: {}".format(ws_url))
+            future_conn.result().close()
 
-        yield self._conns[ws_url].write_message(msg_req.to_json())
+    def _on_message(self, ws_url, future_conn, raw_msg):
+        """Callback for each message received on the connection for the given URL.
+        Responses are used to resolve the pending request with the same ID."""
 
-        msg_condition = tornado.locks.Condition()
-        self._msg_conditions[ws_url][msg_req.id] = msg_condition
+        if raw_msg is None:
+            self._on_conn_closed(ws_url, future_conn)
+            return
 
-        raise tornado.gen.Return(msg_condition)
+        self._logr.debug("Read message: {}".format(raw_msg))
 
-    @tornado.gen.coroutine
-    def _receive_loop(self, ws_url):
-        """Starts the WebSockets message receiving loop."""
+        msg = self._parse_message(raw_msg)
 
-        if ws_url not in self._conns:
-            self._logr.warning("<{}> is not an active connection".format(ws_url))
+        if msg is None:
+            return
+
+        if isinstance(msg, WebsocketMessageEmittedItem):
+            self._on_emitted_item(ws_url, msg)
+        elif msg.id is None:
+            self._on_subscription_error(ws_url, msg)
+        else:
+            self._on_response(ws_url, msg)
+
+    def _on_response(self, ws_url, msg_res):
+        """Resolves the pending request or subscription with the ID of the given response."""
+
+        subscription = self._pending_subscriptions.get(ws_url, {}).pop(msg_res.id, None)
+
+        if subscription is not None:
+            self._on_subscription_response(ws_url, subscription, msg_res)
+            return
+
+        future_res = self._pending.get(ws_url, {}).pop(msg_res.id, None)
+
+        if future_res is not None and not future_res.done():
+            future_res.set_result(msg_res)
+
+    def _on_subscription_response(self, ws_url, subscription, msg_res):
+        """Activates a subscription once the server has returned the subscription ID."""
+
+        if isinstance(msg_res, WebsocketMessageError):
+            subscription.on_error(Exception(msg_res.message))
+            return
+
+        if subscription.disposed:
+            self._dispose_subscription(ws_url, msg_res.result)
+            return
+
+        if ws_url not in self._subscriptions:
+            self._subscriptions[ws_url] = {}
+
+        subscription.subscription_id = msg_res.result
+        self._subscriptions[ws_url][subscription.subscription_id] = subscription
+
+    def _on_emitted_item(self, ws_url, msg_item):
+        """Passes an emitted item to the subscription with the same subscription ID."""
+
+        subscription = self._subscriptions.get(ws_url, {}).get(msg_item.subscription_id, None)
+
+        if subscription is None:
+            self._logr.debug("Unknown subscription: {}".format(msg_item.subscription_id))
+            return
+
+        subscription.on_next(msg_item)
+
+    def _on_subscription_error(self, ws_url, msg_err):
+        """Passes a subscription error to the subscription with the same subscription ID.
+        The subscription has already been disposed on the server side."""
+
+        subscription_id = msg_err.data and msg_err.data.get("subscription")
+        subscription = self._subscriptions.get(ws_url, {}).pop(subscription_id, None)
+
+        if subscription is None:
+            self._logr.warning("Unexpected error message: {}".format(msg_err.message))
+            return
+
+        subscription.subscription_id = None
+        subscription.on_error(Exception(msg_err.message))
+
+    def _on_conn_closed(self, ws_url, future_conn):
+        """Called when the connection for the given URL has been closed.
+        Rejects all the requests that are waiting for a response."""
+
+        self._logr.debug("Closed WS connection: {}".format(ws_url))
+
+        if self._conns.get(ws_url, None) is not future_conn:
             return
 
-        if ws_url not in self._messages:
-            self._messages[ws_url] = {}
+        self._conns.pop(ws_url)
+        pending = self._pending.pop(ws_url, {})
+        pending_subscriptions = self._pending_subscriptions.pop(ws_url, {})
+        subscriptions = self._subscriptions.pop(ws_url, {})
+
+        for future_res in six.itervalues(pending):
+            if not future_res.done():
+                future_res.set_exception(Exception("WS connection closed"))
+
+        for subscription in list(pending_subscriptions.values()) + list(subscriptions.values()):
+            subscription.subscription_id = None
+            subscription.on_error(Exception("WS connection closed"))
+
+    @tornado.gen.coroutine
+    def _send_message(self, ws_url, msg_req):
+        """Sends a WebSockets request message and returns
+        the Future that will be resolved with the response."""
+
+        conn = yield self._get_conn(ws_url)
+
+        if ws_url not in self._pending:
+            self._pending[ws_url] = {}
 
-        while not self._receive_stop_events[ws_url].is_set():
-            try:
-                raw_res = yield self._conns[ws_url].read_message()
+        if msg_req.id in self._pending[ws_url]:
+            self._logr.warning("Pending request already exists: {}".format(msg_req.id))
 
-                self._logr.debug("Read message: {}".format(raw_res))
+        future_res = Future()
+        self._pending[ws_url][msg_req.id] = future_res
 
-                if raw_res is None:
-                    self._logr.debug("Cannot read message: Closed WS connection")
-                    yield tornado.gen.sleep(self.SLEEP_AFTER_ERR_SECS)
-                    continue
+        yield conn.write_message(msg_req.to_json())
 
-                msg_res = self._parse_msg_response(raw_res)
+        raise tornado.gen.Return(future_res)
 
-                if msg_res:
-                    self._messages[ws_url][msg_res.id] = msg_res
-                    conditions = self._msg_conditions.get(ws_url, None)
+    @tornado.gen.coroutine
+    def _request(self, ws_url, method, params, timeout=None):
+        """Sends a request over the shared connection for the given URL
+        and yields the result contained in the response message."""
+
+        ref_id = uuid.uuid4().hex
+        msg_req = WebsocketMessageRequest(method=method, params=params, msg_id=uuid.uuid4().hex)
 
-                    if conditions and msg_res.id in conditions:
-                        self._logr.debug("Notifying: {}".format(msg_res.id))
-                        conditions[msg_res.id].notify_all()
-            except Exception as ex:
-                self._logr.warning("Error in read loop: {}".format(ex), exc_info=True)
-                yield tornado.gen.sleep(self.SLEEP_AFTER_ERR_SECS)
+        self._acquire_conn(ws_url, ref_id)
 
-        self._receive_stop_events[ws_url].clear()
+        try:
+            future_res = yield self._send_message(ws_url, msg_req)
+
+            if timeout:
+                msg_res = yield tornado.gen.with_timeout(datetime.timedelta(seconds=timeout), future_res)
+            else:
+                msg_res = yield future_res
+        except tornado.gen.TimeoutError:
+            raise ClientRequestTimeout
+        finally:
+            self._pending.get(ws_url, {}).pop(msg_req.id, None)
+            self._release_conn(ws_url, ref_id)
+
+        if isinstance(msg_res, WebsocketMessageError):
+            raise Exception(msg_res.message)
+
+        raise tornado.gen.Return(msg_res.result)
 
     @classmethod
     def _parse_msg_response(cls, raw_msg):
@@ -183,29 +302,16 @@ class WebsocketClient(BaseProtocolClient):
         return None
 
     @classmethod
-    def _parse_emitted_item(cls, raw_msg, sub_id):
-        """Returns a parsed WS Emitted Item message instance if
-        the raw message format is valid and has the given ID.
-        Raises Exception if the WS message is an error."""
+    def _parse_message(cls, raw_msg):
+        """Returns a parsed WS Emitted Item, Response or Error message
+        instance if the raw message format is valid or None otherwise."""
 
         try:
-            msg = WebsocketMessageEmittedItem.from_raw(raw_msg)
-
-            if msg.subscription_id == sub_id:
-                return msg
+            return WebsocketMessageEmittedItem.from_raw(raw_msg)
         except WebsocketMessageException:
             pass
 
-        try:
-            err = WebsocketMessageError.from_raw(raw_msg)
-            err_sub_id = err.data and err.data.get("subscription")
-
-            if err_sub_id == sub_id:
-                raise Exception(err.message)
-        except WebsocketMessageException:
-            pass
-
-        return None
+        return cls._parse_msg_response(raw_msg)
 
     @property
     def protocol(self):
@@ -214,71 +320,81 @@ class WebsocketClient(BaseProtocolClient):
 
         return Protocols.WEBSOCKETS
 
-    def _build_subscribe(self, ws_url, msg_req, on_next):
-        """Builds the subscribe function that is passed
-        as an argument on the creation of an Observable."""
+    @tornado.gen.coroutine
+    def _start_subscription(self, ws_url, msg_req, subscription):
+        """Sends a subscription request over the shared connection for the given URL.
+        The subscription is activated when the response with the subscription ID arrives."""
 
-        def subscribe(observer):
-            """Connect to the WS server and start passing the received events to the Observer."""
+        if ws_url not in self._pending_subscriptions:
+            self._pending_subscriptions[ws_url] = {}
 
-            future_sub_id = Future()
-            future_ws_conn = Future()
+        self._pending_subscriptions[ws_url][msg_req.id] = subscription
 
-            def on_error(ex):
-                observer.on_error(ex)
+        try:
+            conn = yield self._get_conn(ws_url)
+            yield conn.write_message(msg_req.to_json())
+        except Exception as ex:
+            self._pending_subscriptions.get(ws_url, {}).pop(msg_req.id, None)
+            subscription.on_error(ex)
 
-            def on_next_event(raw_msg):
-                sub_id = future_sub_id.result()
+    @tornado.gen.coroutine
+    def _dispose_subscription(self, ws_url, subscription_id):
+        """Sends a dispose request for the given subscription ID.
+        The connection is not closed as it may be shared by other subscriptions."""
 
-                try:
-                    msg_item = self._parse_emitted_item(raw_msg, sub_id)
-                except Exception as ex:
-                    return on_error(ex)
+        if ws_url not in self._conns:
+            return
 
-                if msg_item is None:
-                    return
+        try:
+            yield self._request(
+                ws_url, WebsocketMethods.DISPOSE,
+                params={"subscription": subscription_id},
+                timeout=self._receive_timeout_secs)
+        except Exception as ex:
+            self._logr.warning("Error disposing subscription: {}".format(ex))
+
+    def _build_subscribe(self, ws_url, method, params, on_next):
+        """Builds the subscribe function that is passed
+        as an argument on the creation of an Observable."""
+
+        def subscribe(observer):
+            """Subscribe over the shared WS connection and start
+            passing the received events to the Observer."""
+
+            ref_id = uuid.uuid4().hex
+
+            msg_req = WebsocketMessageRequest(
+                method=method,
+                params=params,
+                msg_id=uuid.uuid4().hex)
 
+            def on_next_item(msg_item):
                 try:
                     on_next(observer, msg_item)
                 except Exception as ex:
-                    return on_error(ex)
+                    observer.on_error(ex)
 
-            def parse_subscription_id(raw_msg):
-                msg_res = self._parse_msg_response(raw_msg)
+            subscription = WebsocketClientSubscription(
+                ws_url=ws_url,
+                msg_id=msg_req.id,
+                on_next=on_next_item,
+                on_error=observer.on_error)
 
-                if isinstance(msg_res, WebsocketMessageError):
-                    return on_error(Exception(msg_res.message))
+            self._acquire_conn(ws_url, ref_id)
+            self._start_subscription(ws_url, msg_req, subscription)
 
-                if msg_res is None:
+            def unsubscribe():
+                if subscription.disposed:
                     return
 
-                sub_id = msg_res.result
-                future_sub_id.set_result(sub_id)
-
-            def on_msg(raw_msg):
-                if raw_msg is None:
-                    return on_error(Exception("WS connection closed"))
-
-                if future_sub_id.done():
-                    on_next_event(raw_msg)
-                else:
-                    parse_subscription_id(raw_msg)
+                subscription.disposed = True
+                subscription_id = subscription.subscription_id
 
-            def on_conn(ft):
-                try:
-                    ws_conn = ft.result()
-                except Exception as ex:
-                    return on_error(ex)
+                if subscription_id is not None:
+                    self._subscriptions.get(ws_url, {}).pop(subscription_id, None)
+                    self._dispose_subscription(ws_url, subscription_id)
 
-                future_ws_conn.set_result(ws_conn)
-                ws_conn.write_message(msg_req.to_json())
-
-            tornado.websocket.websocket_connect(ws_url, callback=on_conn, on_message_callback=on_msg)
-
-            def unsubscribe():
-                if future_ws_conn.done():
-                    ws_conn = future_ws_conn.result()
-                    ws_conn.close()
+                self._release_conn(ws_url, ref_id)
 
             return unsubscribe
 
@@ -302,20 +418,6 @@ class WebsocketClient(BaseProtocolClient):
 
         return len(forms_wss) or len(forms_ws)
 
-    def _raise_message(self, ws_url, msg_id):
-        """Raises the error or return Exception from the message
-        in the internal collection matching the given ID."""
-
-        assert ws_url in self._messages, "Unknown WS connection"
-        assert msg_id in self._messages[ws_url], "Unknown message ID"
-
-        msg = self._messages[ws_url][msg_id]
-
-        if isinstance(msg, WebsocketMessageError):
-            raise Exception(msg.message)
-        else:
-            raise tornado.gen.Return(msg.result)
-
     @tornado.gen.coroutine
     def invoke_action(self, td, name, input_value, timeout=None):
         """Invokes an Action on a remote Thing.
@@ -332,27 +434,12 @@ class WebsocketClient(BaseProtocolClient):
             raise FormNotFoundException()
 
         ws_url = form.resolve_uri(td.base)
-        ref_id = uuid.uuid4().hex
-
-        try:
-            yield self._init_conn(ws_url, ref_id)
-
-            msg_req = WebsocketMessageRequest(
-                method=WebsocketMethods.INVOKE_ACTION,
-                params={"name": name, "parameters": input_value},
-                msg_id=uuid.uuid4().hex)
-
-            condition = yield self._send_message(ws_url, msg_req)
 
-            timeout = datetime.timedelta(seconds=timeout) if timeout else None
-            cond_res = yield condition.wait(timeout=timeout)
+        result = yield self._request(
+            ws_url, WebsocketMethods.INVOKE_ACTION,
+            params={"name": name, "parameters": input_value}, timeout=timeout)
 
-            if not cond_res:
-                raise ClientRequestTimeout
-
-            self._raise_message(ws_url, msg_req.id)
-        finally:
-            yield self._stop_conn(ws_url, ref_id)
+        raise tornado.gen.Return(result)
 
     @tornado.gen.coroutine
     def write_property(self, td, name, value, timeout=None):
@@ -370,27 +457,12 @@ class WebsocketClient(BaseProtocolClient):
             raise FormNotFoundException()
 
         ws_url = form.resolve_uri(td.base)
-        ref_id = uuid.uuid4().hex
-
-        try:
-            yield self._init_conn(ws_url, ref_id)
-
-            msg_req = WebsocketMessageRequest(
-                method=WebsocketMethods.WRITE_PROPERTY,
-                params={"name": name, "value": value},
-                msg_id=uuid.uuid4().hex)
-
-            condition = yield self._send_message(ws_url, msg_req)
 
-            timeout = datetime.timedelta(seconds=timeout) if timeout else None
-            cond_res = yield condition.wait(timeout=timeout)
+        result = yield self._request(
+            ws_url, WebsocketMethods.WRITE_PROPERTY,
+            params={"name": name, "value": value}, timeout=timeout)
 
-            if not cond_res:
-                raise ClientRequestTimeout
-
-            self._raise_message(ws_url, msg_req.id)
-        finally:
-            yield self._stop_conn(ws_url, ref_id)
+        raise tornado.gen.Return(result)
 
     @tornado.gen.coroutine
     def read_property(self, td, name, timeout=None):
@@ -408,27 +480,54 @@ class WebsocketClient(BaseProtocolClient):
             raise FormNotFoundException()
 
         ws_url = form.resolve_uri(td.base)
-        ref_id = uuid.uuid4().hex
 
-        try:
-            yield self._init_conn(ws_url, ref_id)
+        result = yield self._request(
+            ws_url, WebsocketMethods.READ_PROPERTY,
+            params={"name": name}, timeout=timeout)
 
-            msg_req = WebsocketMessageRequest(
-                method=WebsocketMethods.READ_PROPERTY,
-                params={"name": name},
-                msg_id=uuid.uuid4().hex)
+        raise tornado.gen.Return(result)
+
+    @tornado.gen.coroutine
+    def read_properties(self, td, names=None, timeout=None):
+        """Reads the values of multiple Properties (all if names is undefined) on
+        a remote Thing with a single request to the Thing-level Form if available.
+        Returns a Future that resolves with a dict of Property names to values."""
 
-            condition = yield self._send_message(ws_url, msg_req)
+        op = InteractionVerbs.READ_ALL_PROPERTIES if names is None else InteractionVerbs.READ_MULTIPLE_PROPERTIES
+        form = pick_form(td, td.get_thing_forms(), WebsocketSchemes.list(), op=op)
 
-            timeout = datetime.timedelta(seconds=timeout) if timeout else None
-            cond_res = yield condition.wait(timeout=timeout)
+        if not form:
+            values = yield super(WebsocketClient, self).read_properties(td, names=names, timeout=timeout)
+            raise tornado.gen.Return(values)
 
-            if not cond_res:
-                raise ClientRequestTimeout
+        ws_url = form.resolve_uri(td.base)
+        params = {} if names is None else {"names": list(names)}
 
-            self._raise_message(ws_url, msg_req.id)
-        finally:
-            yield self._stop_conn(ws_url, ref_id)
+        result = yield self._request(
+            ws_url, WebsocketMethods.READ_PROPERTIES,
+            params=params, timeout=timeout)
+
+        raise tornado.gen.Return(result)
+
+    @tornado.gen.coroutine
+    def write_properties(self, td, values, timeout=None):
+        """Updates the values of multiple Properties on a remote Thing
+        with a single request to the Thing-level Form if available.
+        Returns a Future."""
+
+        form = pick_form(
+            td, td.get_thing_forms(), WebsocketSchemes.list(),
+            op=InteractionVerbs.WRITE_MULTIPLE_PROPERTIES)
+
+        if not form:
+            yield super(WebsocketClient, self).write_properties(td, values, timeout=timeout)
+            return
+
+        ws_url = form.resolve_uri(td.base)
+
+        yield self._request(
+            ws_url, WebsocketMethods.WRITE_PROPERTIES,
+            params={"values": values}, timeout=timeout)
 
     def on_event(self, td, name):
         """Subscribes to an event on a remote Thing.
@@ -448,15 +547,10 @@ class WebsocketClient(BaseProtocolClient):
 
         ws_url = form.resolve_uri(td.base)
 
-        msg_req = WebsocketMessageRequest(
-            method=WebsocketMethods.ON_EVENT,
-            params={"name": name},
-            msg_id=uuid.uuid4().hex)
-
         def on_next(observer, msg_item):
             observer.on_next(EmittedEvent(init=msg_item.data, name=name))
 
-        subscribe = self._build_subscribe(ws_url, msg_req, on_next)
+        subscribe = self._build_subscribe(ws_url, WebsocketMethods.ON_EVENT, {"name": name}, on_next)
 
         # noinspection PyUnresolvedReferences
         return Observable.create(subscribe)
@@ -479,18 +573,13 @@ class WebsocketClient(BaseProtocolClient):
 
         ws_url = form.resolve_uri(td.base)
 
-        msg_req = WebsocketMessageRequest(
-            method=WebsocketMethods.ON_PROPERTY_CHANGE,
-            params={"name": name},
-            msg_id=uuid.uuid4().hex)
-
         def on_next(observer, msg_item):
             init_name = msg_item.data["name"]
             init_value = msg_item.data["value"]
             init = PropertyChangeEventInit(name=init_name, value=init_value)
             observer.on_next(PropertyChangeEmittedEvent(init=init))
 
-        subscribe = self._build_subscribe(ws_url, msg_req, on_next)
+        subscribe = self._build_subscribe(ws_url, WebsocketMethods.ON_PROPERTY_CHANGE, {"name": name}, on_next)
 
         # noinspection PyUnresolvedReferences
         return Observable.create(subscribe)
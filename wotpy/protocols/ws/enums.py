@@ -13,6 +13,8 @@ class WebsocketMethods(EnumListMixin):
 
     READ_PROPERTY = "read_property"
     WRITE_PROPERTY = "write_property"
+    READ_PROPERTIES = "read_properties"
+    WRITE_PROPERTIES = "write_properties"
     INVOKE_ACTION = "invoke_action"
     ON_PROPERTY_CHANGE = "on_property_change"
     ON_TD_CHANGE = "on_td_change"
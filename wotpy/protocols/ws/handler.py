@@ -21,6 +21,8 @@ from wotpy.protocols.ws.messages import \
 from wotpy.protocols.ws.schemas import \
     SCHEMA_PARAMS_READ_PROPERTY, \
     SCHEMA_PARAMS_WRITE_PROPERTY, \
+    SCHEMA_PARAMS_READ_PROPERTIES, \
+    SCHEMA_PARAMS_WRITE_PROPERTIES, \
     SCHEMA_PARAMS_DISPOSE, \
     SCHEMA_PARAMS_INVOKE_ACTION, \
     SCHEMA_PARAMS_ON_PROPERTY_CHANGE, \
@@ -165,6 +167,48 @@ class WebsocketHandler(websocket.WebSocketHandler):
         res = WebsocketMessageResponse(result=None, msg_id=req.id)
         self.write_message(res.to_json())
 
+    @gen.coroutine
+    def _handle_get_properties(self, req):
+        """Handler for the 'read_properties' method."""
+
+        params = req.params
+
+        try:
+            validate(params, SCHEMA_PARAMS_READ_PROPERTIES)
+        except ValidationError as ex:
+            self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
+            return
+
+        try:
+            values = yield self.exposed_thing.read_properties(names=params.get("names"))
+        except Exception as ex:
+            self._write_error(str(ex), WebsocketErrors.INTERNAL_ERROR, msg_id=req.id)
+            return
+
+        res = WebsocketMessageResponse(result=values, msg_id=req.id)
+        self.write_message(res.to_json())
+
+    @gen.coroutine
+    def _handle_set_properties(self, req):
+        """Handler for the 'write_properties' method."""
+
+        params = req.params
+
+        try:
+            validate(params, SCHEMA_PARAMS_WRITE_PROPERTIES)
+        except ValidationError as ex:
+            self._write_error(str(ex), WebsocketErrors.INVALID_METHOD_PARAMS, msg_id=req.id)
+            return
+
+        try:
+            yield self.exposed_thing.write_properties(params["values"])
+        except Exception as ex:
+            self._write_error(str(ex), WebsocketErrors.INTERNAL_ERROR, msg_id=req.id)
+            return
+
+        res = WebsocketMessageResponse(result=None, msg_id=req.id)
+        self.write_message(res.to_json())
+
     @gen.coroutine
     def _handle_invoke_action(self, req):
         """Handler for the 'invoke_action' method."""
@@ -280,6 +324,8 @@ class WebsocketHandler(websocket.WebSocketHandler):
         handler_map = {
             WebsocketMethods.READ_PROPERTY: self._handle_get_property,
             WebsocketMethods.WRITE_PROPERTY: self._handle_set_property,
+            WebsocketMethods.READ_PROPERTIES: self._handle_get_properties,
+            WebsocketMethods.WRITE_PROPERTIES: self._handle_set_properties,
             WebsocketMethods.INVOKE_ACTION: self._handle_invoke_action,
             WebsocketMethods.ON_PROPERTY_CHANGE: self._handle_on_property_change,
             WebsocketMethods.ON_TD_CHANGE: self._handle_on_td_change,
@@ -137,6 +137,30 @@ SCHEMA_PARAMS_WRITE_PROPERTY = {
     ]
 }
 
+SCHEMA_PARAMS_READ_PROPERTIES = {
+    "$schema": "http://json-schema.org/schema#",
+    "id": "http://fundacionctic.org/schemas/wotpy-ws-params-read-properties.json",
+    "type": "object",
+    "properties": {
+        "names": {
+            "type": "array",
+            "items": {"type": "string"}
+        }
+    }
+}
+
+SCHEMA_PARAMS_WRITE_PROPERTIES = {
+    "$schema": "http://json-schema.org/schema#",
+    "id": "http://fundacionctic.org/schemas/wotpy-ws-params-write-properties.json",
+    "type": "object",
+    "properties": {
+        "values": {"type": "object"}
+    },
+    "required": [
+        "values"
+    ]
+}
+
 SCHEMA_PARAMS_INVOKE_ACTION = {
     "$schema": "http://json-schema.org/schema#",
     "id": "http://fundacionctic.org/schemas/wotpy-ws-params-invoke-action.json",
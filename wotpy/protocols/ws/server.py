@@ -10,7 +10,7 @@ from tornado import web
 from tornado.httpserver import HTTPServer
 
 from wotpy.codecs.enums import MediaTypes
-from wotpy.protocols.enums import Protocols
+from wotpy.protocols.enums import Protocols, InteractionVerbs
 from wotpy.protocols.server import BaseProtocolServer
 from wotpy.protocols.ws.enums import WebsocketSchemes
 from wotpy.protocols.ws.handler import WebsocketHandler
@@ -82,6 +82,25 @@ class WebsocketServer(BaseProtocolServer):
                 content_type=MediaTypes.JSON)
         ]
 
+    def build_thing_forms(self, hostname, thing):
+        """Builds and returns a list with all Form that are linked to this server
+        for the operations that apply to the whole Thing (e.g. readallproperties)."""
+
+        base_url = self.build_base_url(hostname=hostname, thing=thing)
+
+        return [
+            Form(
+                interaction=None,
+                protocol=self.protocol,
+                href=base_url,
+                content_type=MediaTypes.JSON,
+                op=[
+                    InteractionVerbs.READ_ALL_PROPERTIES,
+                    InteractionVerbs.READ_MULTIPLE_PROPERTIES,
+                    InteractionVerbs.WRITE_MULTIPLE_PROPERTIES
+                ])
+        ]
+
     def build_base_url(self, hostname, thing):
         """Returns the base URL for the given Thing in the context of this server."""
 
@@ -93,6 +93,44 @@ class ConsumedThing(object):
 
         raise tornado.gen.Return(value)
 
+    @tornado.gen.coroutine
+    def read_properties(self, names=None, timeout=None, client_kwargs=None):
+        """Reads the Properties with the given names (all the Properties if undefined)
+        in as few requests as the Protocol Binding allows.
+        Returns a Future that resolves with a dict of Property names to values."""
+
+        names = list(self.td.properties.keys()) if names is None else list(names)
+
+        if not len(names):
+            raise tornado.gen.Return({})
+
+        client = self.servient.select_client(self.td, names[0])
+        client_kwargs = client_kwargs if client_kwargs else {}
+
+        values = yield client.read_properties(
+            self.td, names,
+            timeout=timeout,
+            **client_kwargs.get(client.protocol, {}))
+
+        raise tornado.gen.Return(values)
+
+    @tornado.gen.coroutine
+    def write_properties(self, values, timeout=None, client_kwargs=None):
+        """Takes a dict of Property names to values and updates the Properties
+        in as few requests as the Protocol Binding allows.
+        Returns a Future that resolves on success or rejects with an Error."""
+
+        if not len(values):
+            return
+
+        client = self.servient.select_client(self.td, next(iter(values)))
+        client_kwargs = client_kwargs if client_kwargs else {}
+
+        yield client.write_properties(
+            self.td, values,
+            timeout=timeout,
+            **client_kwargs.get(client.protocol, {}))
+
     def on_event(self, name, client_kwargs=None):
         """Returns an Observable for the Event specified in the name argument,
         allowing subscribing to and unsubscribing from notifications."""
@@ -60,6 +60,22 @@ class FormDict(LinkDict):
 
         return [SecuritySchemeDict.build(item) for item in self._init.get("security")]
 
+    @property
+    def extensions(self):
+        """Dict of terms from other vocabularies (e.g. Protocol Binding Templates)
+        that are identified by a prefixed name such as mqtt:options."""
+
+        return {key: val for key, val in self._init.items() if ":" in key}
+
+    def to_dict(self):
+        """Returns the pure dict (JSON-serializable) representation of this WoT dictionary.
+        Prefixed terms from other vocabularies are kept as-is."""
+
+        ret = super(FormDict, self).to_dict()
+        ret.update(self.extensions)
+
+        return ret
+
     def resolve_uri(self, base=None):
         """Resolves and returns the Link URI.
         When the href does not contain a full URL the base URI is joined with said href."""
@@ -9,7 +9,7 @@ import six
 
 from wotpy.wot.dictionaries.base import WotBaseDict
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict, ActionFragmentDict, EventFragmentDict
-from wotpy.wot.dictionaries.link import LinkDict
+from wotpy.wot.dictionaries.link import LinkDict, FormDict
 from wotpy.wot.dictionaries.security import SecuritySchemeDict
 from wotpy.utils.utils import to_camel
 from wotpy.wot.dictionaries.version import VersioningDict
@@ -36,6 +36,7 @@ class ThingFragment(WotBaseDict):
             "actions",
             "events",
             "links",
+            "forms",
             "security",
             "securityDefinitions"
         }
@@ -66,6 +67,7 @@ class ThingFragment(WotBaseDict):
 
         fields_list = [
             "links",
+            "forms",
             "security"
         ]
 
@@ -168,6 +170,13 @@ class ThingFragment(WotBaseDict):
 
         return [LinkDict(item) for item in self._init.get("links", [])]
 
+    @property
+    def forms(self):
+        """The forms optional attribute represents an array of Form objects
+        for the operations that apply to the whole Thing (e.g. readallproperties)."""
+
+        return [FormDict(item) for item in self._init.get("forms", [])]
+
     @property
     def version(self):
         """Provides version information."""
@@ -11,6 +11,8 @@ from rx.concurrency import IOLoopScheduler
 from six.moves import UserDict
 from slugify import slugify
 
+from wotpy.wot.enums import InteractionTypes
+
 
 class ExposedThingInteractionDict(UserDict):
     """A dictionary that provides lazy access to the objects that implement
@@ -24,7 +26,13 @@ class ExposedThingInteractionDict(UserDict):
         """Takes a case-insensitive URL-safe interaction name and returns
         the actual name in the interaction dict."""
 
-        return next((key for key in six.iterkeys(self.interaction_dict) if slugify(key) == slugify(name)), None)
+        thing = self._exposed_thing.thing
+        interaction = thing.find_interaction(name, interaction_type=self.interaction_type)
+
+        if interaction is None:
+            interaction = thing.find_interaction(slugify(name), interaction_type=self.interaction_type)
+
+        return interaction.name if interaction is not None else None
 
     def __getitem__(self, name):
         """Lazily build and return an object that implements the Interaction interface."""
@@ -51,6 +59,12 @@ class ExposedThingInteractionDict(UserDict):
 
         raise NotImplementedError()
 
+    @property
+    def interaction_type(self):
+        """Returns the type of the interactions contained in this dict."""
+
+        raise NotImplementedError()
+
     @property
     def thing_interaction_class(self):
         """Returns the class that implements the
@@ -67,6 +81,10 @@ class ExposedThingPropertyDict(ExposedThingInteractionDict):
     def interaction_dict(self):
         return self._exposed_thing.thing.properties
 
+    @property
+    def interaction_type(self):
+        return InteractionTypes.PROPERTY
+
     @property
     def thing_interaction_class(self):
         return ExposedThingProperty
@@ -80,6 +98,10 @@ class ExposedThingActionDict(ExposedThingInteractionDict):
     def interaction_dict(self):
         return self._exposed_thing.thing.actions
 
+    @property
+    def interaction_type(self):
+        return InteractionTypes.ACTION
+
     @property
     def thing_interaction_class(self):
         return ExposedThingAction
@@ -93,6 +115,10 @@ class ExposedThingEventDict(ExposedThingInteractionDict):
     def interaction_dict(self):
         return self._exposed_thing.thing.events
 
+    @property
+    def interaction_type(self):
+        return InteractionTypes.EVENT
+
     @property
     def thing_interaction_class(self):
         return ExposedThingEvent
@@ -5,6 +5,7 @@
 Classes that represent Things exposed by a servient.
 """
 
+import six
 import tornado.gen
 from rx import Observable
 from rx.concurrency import IOLoopScheduler
@@ -14,7 +15,7 @@ from tornado.concurrent import Future
 from wotpy.utils.enums import EnumListMixin
 from wotpy.utils.utils import to_camel
 from wotpy.wot.dictionaries.interaction import PropertyFragmentDict, ActionFragmentDict, EventFragmentDict
-from wotpy.wot.enums import DefaultThingEvent, TDChangeMethod, TDChangeType
+from wotpy.wot.enums import DefaultThingEvent, TDChangeMethod, TDChangeType, InteractionTypes
 from wotpy.wot.events import \
     EmittedEvent, \
     PropertyChangeEmittedEvent, \
@@ -69,7 +70,7 @@ class ExposedThing(object):
             self.HandlerKeys.INVOKE_ACTION: {}
         }
 
-        self._events_stream = Subject()
+        self._events_subjects = {}
 
     def __str__(self):
         return "<{}> {}".format(self.__class__.__name__, self.id)
@@ -96,6 +97,26 @@ class ExposedThing(object):
 
         return self._thing.__setattr__(name, value)
 
+    def _events_subject(self, kind, name=None):
+        """Returns the Subject that dispatches the events of the given kind
+        and interaction name. Subjects are created on the first subscription."""
+
+        key = (kind, name)
+
+        if key not in self._events_subjects:
+            self._events_subjects[key] = Subject()
+
+        return self._events_subjects[key]
+
+    def _emit(self, emitted_event, kind, name=None):
+        """Dispatches an event only to the subscribers of the given kind and interaction
+        name. The cost of an emission does not depend on the subscribers of other interactions."""
+
+        subject = self._events_subjects.get((kind, name), None)
+
+        if subject is not None:
+            subject.on_next(emitted_event)
+
     def _set_property_value(self, prop, value):
         """Sets a Property value."""
 
@@ -235,7 +256,36 @@ class ExposedThing(object):
             yield self._default_update_property_handler(name, value)
 
         event_init = PropertyChangeEventInit(name=name, value=value)
-        self._events_stream.on_next(PropertyChangeEmittedEvent(init=event_init))
+        self._emit(PropertyChangeEmittedEvent(init=event_init), DefaultThingEvent.PROPERTY_CHANGE, name)
+
+    @tornado.gen.coroutine
+    def read_properties(self, names=None):
+        """Reads the Properties with the given names (all the Properties if undefined).
+        The read handlers are called concurrently.
+        Returns a Future that resolves with a dict of Property names to values."""
+
+        names = list(self.thing.properties.keys()) if names is None else list(names)
+
+        for name in names:
+            if name not in self.thing.properties:
+                raise KeyError("Unknown Property: {}".format(name))
+
+        values = yield [self.read_property(name) for name in names]
+
+        raise tornado.gen.Return(dict(zip(names, values)))
+
+    @tornado.gen.coroutine
+    def write_properties(self, values):
+        """Takes a dict of Property names to values and updates the Properties.
+        The write handlers are called concurrently after checking that all the
+        Properties are writable, so that no Property is updated if any is not.
+        Returns a Future that resolves on success or rejects with an Error."""
+
+        for name in six.iterkeys(values):
+            if not self.thing.properties[name].writable:
+                raise TypeError("Property is non-writable: {}".format(name))
+
+        yield [self.write_property(name, value) for name, value in six.iteritems(values)]
 
     @tornado.gen.coroutine
     def invoke_action(self, name, input_value=None):
@@ -253,7 +303,7 @@ class ExposedThing(object):
 
         event_init = ActionInvocationEventInit(action_name=name, return_value=result)
         emitted_event = ActionInvocationEmittedEvent(init=event_init)
-        self._events_stream.on_next(emitted_event)
+        self._emit(emitted_event, DefaultThingEvent.ACTION_INVOCATION, name)
 
         raise tornado.gen.Return(result)
 
@@ -265,11 +315,7 @@ class ExposedThing(object):
             # noinspection PyUnresolvedReferences
             return Observable.throw(Exception("Unknown event"))
 
-        def event_filter(item):
-            return item.name == name
-
-        # noinspection PyUnresolvedReferences
-        return self._events_stream.filter(event_filter)
+        return self._events_subject(InteractionTypes.EVENT, name).as_observable()
 
     def on_property_change(self, name):
         """Returns an Observable for the Property specified in the name argument,
@@ -285,22 +331,13 @@ class ExposedThing(object):
             # noinspection PyUnresolvedReferences
             return Observable.throw(Exception("Property is not observable"))
 
-        def property_change_filter(item):
-            return item.name == DefaultThingEvent.PROPERTY_CHANGE and \
-                   item.data.name == name
-
-        # noinspection PyUnresolvedReferences
-        return self._events_stream.filter(property_change_filter)
+        return self._events_subject(DefaultThingEvent.PROPERTY_CHANGE, interaction.name).as_observable()
 
     def on_td_change(self):
         """Returns an Observable, allowing subscribing to and unsubscribing
         from notifications to the Thing Description."""
 
-        def td_change_filter(item):
-            return item.name == DefaultThingEvent.DESCRIPTION_CHANGE
-
-        # noinspection PyUnresolvedReferences
-        return self._events_stream.filter(td_change_filter)
+        return self._events_subject(DefaultThingEvent.DESCRIPTION_CHANGE).as_observable()
 
     def expose(self):
         """Start serving external requests for the Thing, so that
@@ -321,7 +358,7 @@ class ExposedThing(object):
         if not self.thing.find_interaction(name=event_name):
             raise ValueError("Unknown event: {}".format(event_name))
 
-        self._events_stream.on_next(EmittedEvent(name=event_name, init=payload))
+        self._emit(EmittedEvent(name=event_name, init=payload), InteractionTypes.EVENT, event_name)
 
     def add_property(self, name, property_init, value=None):
         """Adds a Property defined by the argument and updates the Thing Description.
@@ -340,9 +377,9 @@ class ExposedThing(object):
             method=TDChangeMethod.ADD,
             name=name,
             data=property_init.to_dict(),
-            description=ThingDescription.from_thing(self.thing).to_dict())
+            description=ThingDescription.from_thing(self.thing, validate=False).to_dict())
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data), DefaultThingEvent.DESCRIPTION_CHANGE)
 
     def remove_property(self, name):
         """Removes the Property specified by the name argument,
@@ -355,7 +392,7 @@ class ExposedThing(object):
             method=TDChangeMethod.REMOVE,
             name=name)
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data), DefaultThingEvent.DESCRIPTION_CHANGE)
 
     def add_action(self, name, action_init, action_handler=None):
         """Adds an Action to the Thing object as defined by the action
@@ -373,9 +410,9 @@ class ExposedThing(object):
             method=TDChangeMethod.ADD,
             name=name,
             data=action_init.to_dict(),
-            description=ThingDescription.from_thing(self.thing).to_dict())
+            description=ThingDescription.from_thing(self.thing, validate=False).to_dict())
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data), DefaultThingEvent.DESCRIPTION_CHANGE)
 
         if action_handler:
             self.set_action_handler(name, action_handler)
@@ -391,7 +428,7 @@ class ExposedThing(object):
             method=TDChangeMethod.REMOVE,
             name=name)
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data), DefaultThingEvent.DESCRIPTION_CHANGE)
 
     def add_event(self, name, event_init):
         """Adds an event to the Thing object as defined by the event argument
@@ -409,9 +446,9 @@ class ExposedThing(object):
             method=TDChangeMethod.ADD,
             name=name,
             data=event_init.to_dict(),
-            description=ThingDescription.from_thing(self.thing).to_dict())
+            description=ThingDescription.from_thing(self.thing, validate=False).to_dict())
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data), DefaultThingEvent.DESCRIPTION_CHANGE)
 
     def remove_event(self, name):
         """Removes the event specified by the name argument,
@@ -424,7 +461,7 @@ class ExposedThing(object):
             method=TDChangeMethod.REMOVE,
             name=name)
 
-        self._events_stream.on_next(ThingDescriptionChangeEmittedEvent(init=event_data))
+        self._emit(ThingDescriptionChangeEmittedEvent(init=event_data), DefaultThingEvent.DESCRIPTION_CHANGE)
 
     def set_action_handler(self, name, action_handler):
         """Takes name as string argument and action_handler as argument of type ActionHandler.
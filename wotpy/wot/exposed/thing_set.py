@@ -5,13 +5,24 @@
 Class that represents a group or set of ExposedThing instances that exist in the same context.
 """
 
+import six
+
+UUID_STR_LEN = 36
+
 
 class ExposedThingSet(object):
     """Represents a group of ExposedThing objects.
-    A group cannot contain two ExposedThing with the same Thing ID."""
+    A group cannot contain two ExposedThing with the same Thing ID.
+    Lookups by Thing ID, URL-safe name and Thing are resolved
+    through secondary indexes that are updated on each add and remove."""
 
     def __init__(self):
         self._exposed_things = {}
+        self._index_uuid = {}
+        self._index_thing = {}
+
+    def __len__(self):
+        return len(self._exposed_things)
 
     @property
     def exposed_things(self):
@@ -23,7 +34,9 @@ class ExposedThingSet(object):
     def contains(self, exposed_thing):
         """Returns True if this group contains the given ExposedThing."""
 
-        return exposed_thing in self._exposed_things.values()
+        indexed = self._index_thing.get(exposed_thing.thing, None)
+
+        return indexed is not None and indexed == exposed_thing
 
     def add(self, exposed_thing):
         """Add a new ExposedThing to this set."""
@@ -32,6 +45,8 @@ class ExposedThingSet(object):
             raise ValueError("Duplicate Exposed Thing: {}".format(exposed_thing.title))
 
         self._exposed_things[exposed_thing.thing.id] = exposed_thing
+        self._index_uuid[exposed_thing.thing.uuid] = exposed_thing
+        self._index_thing[exposed_thing.thing] = exposed_thing
 
     def remove(self, thing_id):
         """Removes an existing ExposedThing by ID.
@@ -44,21 +59,38 @@ class ExposedThingSet(object):
 
         assert exposed_thing.thing.id in self._exposed_things
         self._exposed_things.pop(exposed_thing.thing.id)
+        self._index_uuid.pop(exposed_thing.thing.uuid, None)
+        self._index_thing.pop(exposed_thing.thing, None)
+
+    def _find_by_url_name(self, url_name):
+        """Finds an existing ExposedThing by URL-safe name.
+        The URL name of a Thing always ends with the UUID of the Thing, which
+        is derived from the (read-only) ID. The UUID index is therefore stable
+        even if the title (and thus the URL name) of the Thing is updated."""
+
+        if not isinstance(url_name, six.string_types) or len(url_name) < UUID_STR_LEN:
+            return None
+
+        exposed_thing = self._index_uuid.get(url_name[-UUID_STR_LEN:], None)
+
+        if exposed_thing is None or exposed_thing.thing.url_name != url_name:
+            return None
+
+        return exposed_thing
 
     def find_by_thing_id(self, thing_id):
         """Finds an existing ExposedThing by Thing ID.
         The ID argument may be the original Thing ID or the URL-safe name
         (which is also unique and based on the ID)."""
 
-        def is_match(exp_thing):
-            return exp_thing.thing.id == thing_id or exp_thing.thing.url_name == thing_id
+        exposed_thing = self._exposed_things.get(thing_id, None)
 
-        return next((item for item in self._exposed_things.values() if is_match(item)), None)
+        if exposed_thing is not None:
+            return exposed_thing
+
+        return self._find_by_url_name(thing_id)
 
     def find_by_interaction(self, interaction):
         """Finds the ExposedThing whose Thing contains the given Interaction."""
 
-        def is_match(exp_thing):
-            return exp_thing.thing is interaction.thing
-
-        return next((item for item in self._exposed_things.values() if is_match(item)), None)
+        return self._index_thing.get(interaction.thing, None)
@@ -30,7 +30,8 @@ class Form(object):
 
     @property
     def interaction(self):
-        """Interaction that contains this Form."""
+        """Interaction that contains this Form.
+        None for the Forms that apply to the whole Thing."""
 
         return self._interaction
 
@@ -28,6 +28,7 @@ class InteractionPattern(object):
 
         self._thing = thing
         self._name = name
+        self._url_name = slugify(name)
         self._forms = []
 
     def __getattr__(self, name):
@@ -66,7 +67,7 @@ class InteractionPattern(object):
     def url_name(self):
         """URL-safe version of the name."""
 
-        return slugify(self.name)
+        return self._url_name
 
     @property
     def forms(self):
@@ -78,6 +79,7 @@ class InteractionPattern(object):
         """Removes all the Forms from this Interaction."""
 
         self._forms = []
+        self._thing.invalidate_cache()
 
     def add_form(self, form):
         """Add a new Form."""
@@ -90,6 +92,7 @@ class InteractionPattern(object):
             raise ValueError("Duplicate Form: {}".format(form))
 
         self._forms.append(form)
+        self._thing.invalidate_cache()
 
     def remove_form(self, form):
         """Remove an existing Form."""
@@ -98,7 +101,9 @@ class InteractionPattern(object):
             pop_idx = self._forms.index(form)
             self._forms.pop(pop_idx)
         except ValueError:
-            pass
+            return
+
+        self._thing.invalidate_cache()
 
 
 class Property(InteractionPattern):
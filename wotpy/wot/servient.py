@@ -6,11 +6,13 @@ Class that represents a WoT servient.
 """
 
 import functools
+import hashlib
 import re
 import socket
 
 import six
 import tornado.concurrent
+import tornado.escape
 import tornado.gen
 import tornado.ioloop
 import tornado.locks
@@ -27,48 +29,76 @@ from wotpy.wot.td import ThingDescription
 from wotpy.wot.wot import WoT
 
 
-class TDHandler(tornado.web.RequestHandler):
-    """Handler that returns the TD document of a given Thing."""
+class BaseTDHandler(tornado.web.RequestHandler):
+    """Base class for the handlers that return serialized TD documents.
+    Responses carry a strong ETag and conditional requests that
+    match the current ETag are answered with 304 Not Modified."""
 
     def initialize(self, servient):
         self.servient = servient
 
+    def write_json_etag(self, body, etag):
+        """Writes the given serialized JSON body with its ETag.
+        The body is not written if the client already has the current version."""
+
+        self.set_header("Content-Type", "application/json; charset=UTF-8")
+        self.set_header("Etag", etag)
+
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+
+        self.write(body)
+
+
+class TDHandler(BaseTDHandler):
+    """Handler that returns the TD document of a given Thing."""
+
     def get(self, thing_url_name):
         exp_thing = self.servient.exposed_thing_set.find_by_thing_id(
             thing_url_name)
 
-        td_doc = ThingDescription.from_thing(exp_thing.thing).to_dict()
-        base_url = self.servient.get_thing_base_url(exp_thing)
+        if exp_thing is None:
+            raise tornado.web.HTTPError(404)
 
-        if base_url:
-            td_doc.update({"base": base_url})
+        td_json, etag = self.servient.get_thing_description_json(exp_thing)
 
-        self.write(td_doc)
+        self.write_json_etag(td_json, etag)
 
 
-class TDCatalogueHandler(tornado.web.RequestHandler):
+class TDCatalogueHandler(BaseTDHandler):
     """Handler that returns the entire catalogue of Things contained in this servient.
-    May return TDs in expanded format or URL pointers to the individual TDs."""
-
-    def initialize(self, servient):
-        self.servient = servient
+    May return TDs in expanded format or URL pointers to the individual TDs.
+    The expanded catalogue is assembled from the cached serialized TD of each Thing."""
 
     def get(self):
-        response = {}
+        if self.get_argument("expanded", False):
+            self.get_expanded()
+            return
 
-        for exp_thing in self.servient.enabled_exposed_things:
-            thing_id = exp_thing.thing.id
+        response = {
+            exp_thing.thing.id: "/{}".format(exp_thing.thing.url_name)
+            for exp_thing in self.servient.enabled_exposed_things
+        }
+
+        body = tornado.escape.json_encode(response)
 
-            if self.get_argument("expanded", False):
-                val = ThingDescription.from_thing(exp_thing.thing).to_dict()
-                val.update(
-                    {"base": self.servient.get_thing_base_url(exp_thing)})
-            else:
-                val = "/{}".format(exp_thing.thing.url_name)
+        self.write_json_etag(body, _build_etag(body))
 
-            response[thing_id] = val
+    def get_expanded(self):
+        """Writes the catalogue of Things in expanded format."""
 
-        self.write(response)
+        items = []
+        etags = []
+
+        for exp_thing in self.servient.enabled_exposed_things:
+            td_json, etag = self.servient.get_thing_description_json(exp_thing)
+            items.append("{}: {}".format(tornado.escape.json_encode(exp_thing.thing.id), td_json))
+            etags.append(etag)
+
+        etag = _build_etag("".join(etags))
+
+        self.write_json_etag("{" + ", ".join(items) + "}", etag)
 
 
 class ServientStateException(Exception):
@@ -98,6 +128,12 @@ def _stopped_servient_only(func):
 _REGEX_ARPA = r".*\.(ip6|in-addr)\.arpa$"
 
 
+def _build_etag(body):
+    """Returns a strong ETag for the given serialized body."""
+
+    return '"{}"'.format(hashlib.sha1(body.encode("utf-8")).hexdigest())
+
+
 def _get_hostname_fallback():
     """Tries to guess the hostname of the current host that should be used on TD Forms.
     Two strategies are used for this: First, the socket.getfqdn() method. If the returned
@@ -140,6 +176,7 @@ class Servient(object):
         self._dnssd_instance_name = dnssd_instance_name
         self._dnssd = None
         self._enabled_exposed_thing_ids = set()
+        self._td_cache = {}
 
         if not len(self._clients):
             self._build_default_clients()
@@ -348,12 +385,14 @@ class Servient(object):
         """Cleans all the Forms from all the ExposedThings contained in this Servient."""
 
         for exposed_thing in self._exposed_thing_set.exposed_things:
+            exposed_thing.thing.clean_forms()
+
             for interaction in exposed_thing.thing.interactions:
                 interaction.clean_forms()
 
     def _clean_protocol_forms(self, exposed_thing, protocol):
-        """Removes all interaction forms linked to this
-        server protocol for the given ExposedThing."""
+        """Removes all Thing and interaction forms linked
+        to this server protocol for the given ExposedThing."""
 
         assert self._exposed_thing_set.contains(exposed_thing)
         assert protocol in self._servers
@@ -367,6 +406,14 @@ class Servient(object):
             for form in forms_to_remove:
                 interaction.remove_form(form)
 
+        thing_forms_to_remove = [
+            form for form in exposed_thing.thing.forms
+            if form.protocol == protocol
+        ]
+
+        for form in thing_forms_to_remove:
+            exposed_thing.thing.remove_form(form)
+
     def _server_has_exposed_thing(self, server, exposed_thing):
         """Returns True if the given server contains the ExposedThing."""
 
@@ -388,15 +435,27 @@ class Servient(object):
             for form in forms:
                 interaction.add_form(form)
 
+        thing_forms = server.build_thing_forms(
+            hostname=self._hostname, thing=exposed_thing.thing)
+
+        for form in thing_forms:
+            exposed_thing.thing.add_form(form)
+
+    def _regenerate_exposed_thing_forms(self, server, exposed_thing):
+        """Cleans and regenerates Forms for the given server in a single ExposedThing."""
+
+        self._clean_protocol_forms(exposed_thing, server.protocol)
+
+        if self._server_has_exposed_thing(server, exposed_thing):
+            self._add_interaction_forms(server, exposed_thing)
+
     def _regenerate_server_forms(self, server):
         """Cleans and regenerates Forms for the given server in all ExposedThings."""
 
         assert server in self._servers.values()
 
         for exp_thing in self._exposed_thing_set.exposed_things:
-            self._clean_protocol_forms(exp_thing, server.protocol)
-            if self._server_has_exposed_thing(server, exp_thing):
-                self._add_interaction_forms(server, exp_thing)
+            self._regenerate_exposed_thing_forms(server, exp_thing)
 
     def get_thing_base_url(self, exposed_thing):
         """Return the base URL for the given ExposedThing
@@ -417,6 +476,30 @@ class Servient(object):
 
         return server.build_base_url(hostname=self.hostname, thing=exposed_thing.thing)
 
+    def get_thing_description_json(self, exposed_thing):
+        """Returns a tuple with the serialized TD document of the given ExposedThing
+        (including the base URL) and its ETag. Serialized TDs are cached and only
+        rebuilt when the Thing revision or its base URL change."""
+
+        thing = exposed_thing.thing
+        base_url = self.get_thing_base_url(exposed_thing)
+        cache_key = (thing.revision, base_url)
+        cached = self._td_cache.get(thing.id, None)
+
+        if cached is not None and cached[0] == cache_key:
+            return cached[1], cached[2]
+
+        td_doc = ThingDescription.from_thing(thing, validate=False).to_dict()
+
+        if base_url:
+            td_doc.update({"base": base_url})
+
+        td_json = tornado.escape.json_encode(td_doc)
+        etag = _build_etag(td_json)
+        self._td_cache[thing.id] = (cache_key, td_json, etag)
+
+        return td_json, etag
+
     def select_client(self, td, name):
         """Returns the Protocol Binding client instance to
         communicate with the given Interaction."""
@@ -458,15 +541,25 @@ class Servient(object):
 
     def enable_exposed_thing(self, thing_id):
         """Enables the ExposedThing with the given ID.
-        This is, the servers will listen for requests for this thing."""
+        This is, the servers will listen for requests for this thing.
+        Only the Forms of the enabled ExposedThing are regenerated."""
 
-        exposed_thing = self.get_exposed_thing(thing_id)
+        self.enable_exposed_things([thing_id])
+
+    def enable_exposed_things(self, thing_ids):
+        """Enables all the ExposedThings with the given IDs in one pass.
+        All IDs are resolved before any server is modified, so an unknown ID
+        raises ValueError and leaves the Servient untouched."""
+
+        exposed_things = [self.get_exposed_thing(thing_id) for thing_id in thing_ids]
 
         for server in self._servers.values():
-            server.add_exposed_thing(exposed_thing)
-            self._regenerate_server_forms(server)
+            for exposed_thing in exposed_things:
+                server.add_exposed_thing(exposed_thing)
+                self._regenerate_exposed_thing_forms(server, exposed_thing)
 
-        self._enabled_exposed_thing_ids.add(exposed_thing.id)
+        for exposed_thing in exposed_things:
+            self._enabled_exposed_thing_ids.add(exposed_thing.id)
 
     def disable_exposed_thing(self, thing_id):
         """Disables the ExposedThing with the given ID.
@@ -480,7 +573,7 @@ class Servient(object):
 
         for server in self._servers.values():
             server.remove_exposed_thing(exposed_thing.id)
-            self._regenerate_server_forms(server)
+            self._regenerate_exposed_thing_forms(server, exposed_thing)
 
         self._enabled_exposed_thing_ids.remove(exposed_thing.id)
 
@@ -489,6 +582,7 @@ class Servient(object):
         ExposedThings are disabled by default."""
 
         self._exposed_thing_set.add(exposed_thing)
+        self._td_cache.pop(exposed_thing.thing.id, None)
 
     def remove_exposed_thing(self, thing_id):
         """Disables and removes an ExposedThing from this Servient."""
@@ -496,7 +590,9 @@ class Servient(object):
         if thing_id in self._enabled_exposed_thing_ids:
             self.disable_exposed_thing(thing_id)
 
+        exposed_thing = self.get_exposed_thing(thing_id)
         self._exposed_thing_set.remove(thing_id)
+        self._td_cache.pop(exposed_thing.thing.id, None)
 
     def get_exposed_thing(self, thing_id):
         """Finds and returns an ExposedThing contained in this servient by Thing ID.
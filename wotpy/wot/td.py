@@ -12,21 +12,24 @@ import six
 
 from wotpy.wot.dictionaries.thing import ThingFragment
 from wotpy.wot.thing import Thing
-from wotpy.wot.validation import SCHEMA_THING, InvalidDescription
+from wotpy.wot.validation import VALIDATOR_THING, InvalidDescription
 
 
 class ThingDescription(object):
     """Class that represents a Thing Description document.
     Contains logic to validate and transform a Thing to a serialized TD and vice versa."""
 
-    def __init__(self, doc):
+    def __init__(self, doc, validate=True):
         """Constructor.
-        Validates that the document conforms to the TD schema."""
+        Validates that the document conforms to the TD schema.
+        Validation may be skipped with validate=False for documents
+        that come from a trusted source (e.g. generated by this servient)."""
 
         self._doc = json.loads(doc) if isinstance(doc, (six.string_types, bytes)) else doc
         self._thing_fragment = ThingFragment(self._doc)
 
-        self.validate(doc=self._thing_fragment.to_dict())
+        if validate:
+            self.validate(doc=self._thing_fragment.to_dict())
 
     @classmethod
     def validate(cls, doc):
@@ -34,15 +37,15 @@ class ThingDescription(object):
         Raises ValidationError if validation fails."""
 
         try:
-            jsonschema.validate(doc, SCHEMA_THING)
+            VALIDATOR_THING.validate(doc)
         except (jsonschema.ValidationError, TypeError) as ex:
             raise InvalidDescription(str(ex))
 
     @classmethod
-    def from_thing(cls, thing):
+    def from_thing(cls, thing, validate=True):
         """Builds an instance of a JSON-serialized Thing Description from a Thing object."""
 
-        return ThingDescription(thing.thing_fragment.to_dict())
+        return ThingDescription(thing.thing_fragment.to_dict(), validate=validate)
 
     def __getattr__(self, name):
         """Search for members that raised an AttributeError in
@@ -84,6 +87,11 @@ class ThingDescription(object):
 
         return []
 
+    def get_thing_forms(self):
+        """Returns a list of FormDict for the operations that apply to the whole Thing."""
+
+        return self._thing_fragment.forms
+
     def get_property_forms(self, name):
         """Returns a list of FormDict for the property that matches the given name."""
 
@@ -40,6 +40,10 @@ class Thing(object):
         self._properties = {}
         self._actions = {}
         self._events = {}
+        self._forms = []
+        self._interactions_index = {}
+        self._revision = 0
+        self._cache = {}
         self._init_fragment_interactions()
 
     def __getattr__(self, name):
@@ -56,7 +60,8 @@ class Thing(object):
         if name_camel not in self.THING_FRAGMENT_WRITABLE_FIELDS:
             return super(Thing, self).__setattr__(name, value)
 
-        return self._thing_fragment.__setattr__(name, value)
+        self._thing_fragment.__setattr__(name, value)
+        self.invalidate_cache()
 
     def _init_fragment_interactions(self):
         """Adds the interactions declared in the ThingFragment to the instance private dicts."""
@@ -73,9 +78,18 @@ class Thing(object):
             event = Event(thing=self, name=name, init_dict=event_fragment)
             self.add_interaction(event)
 
-    @property
-    def thing_fragment(self):
-        """The ThingFragment dictionary of this Thing."""
+    def _get_cached(self, key, builder):
+        """Returns the cached value for the given key,
+        calling the builder function if the value is missing."""
+
+        if key not in self._cache:
+            self._cache[key] = builder()
+
+        return self._cache[key]
+
+    def _build_thing_fragment(self):
+        """Builds the ThingFragment dictionary of this Thing
+        from the current set of interactions and forms."""
 
         def interaction_to_json(intrct):
             """Returns the JSON serialization of an Interaction instance."""
@@ -89,6 +103,12 @@ class Thing(object):
             return ret
 
         doc = self._thing_fragment.to_dict()
+        doc.pop("forms", None)
+
+        if len(self._forms):
+            doc.update({
+                "forms": [form.form_dict.to_dict() for form in self._forms]
+            })
 
         doc.update({
             "properties": {
@@ -113,17 +133,54 @@ class Thing(object):
 
         return ThingFragment(doc)
 
+    def _build_uuid(self):
+        """Builds the UUID of this Thing from the Thing ID."""
+
+        hasher = hashlib.md5()
+        hasher.update(self.id.encode())
+        bytes_id_hash = hasher.digest()
+
+        return str(uuid.UUID(bytes=bytes_id_hash))
+
+    def _build_url_name(self):
+        """Builds the URL-safe name of this Thing from the title and the UUID."""
+
+        return slugify("{}-{}".format(self.title, self.uuid))
+
+    @property
+    def revision(self):
+        """Counter that is increased each time this Thing is modified.
+        Can be used to detect changes in the Thing Description."""
+
+        return self._revision
+
+    def invalidate_cache(self):
+        """Discards the cached ThingFragment and derived identifiers
+        and increases the revision counter of this Thing.
+        Should be called each time the Thing or its interactions are modified."""
+
+        self._revision += 1
+        self._cache = {}
+
+    @property
+    def thing_fragment(self):
+        """The ThingFragment dictionary of this Thing.
+        The returned instance is cached until the Thing is modified
+        and therefore should be treated as read-only."""
+
+        return self._get_cached("thing_fragment", self._build_thing_fragment)
+
     @property
     def id(self):
         """Thing ID."""
 
-        return self.thing_fragment.id
+        return self._thing_fragment.id
 
     @property
     def title(self):
         """Thing title."""
 
-        return self.thing_fragment.title
+        return self._thing_fragment.title
 
     @property
     def uuid(self):
@@ -131,18 +188,14 @@ class Thing(object):
         This value is deterministic and derived from the Thing ID.
         It may be of use when URL-unsafe chars are not acceptable."""
 
-        hasher = hashlib.md5()
-        hasher.update(self.id.encode())
-        bytes_id_hash = hasher.digest()
-
-        return str(uuid.UUID(bytes=bytes_id_hash))
+        return self._get_cached("uuid", self._build_uuid)
 
     @property
     def url_name(self):
         """Returns the URL-safe name of this Thing.
         The URL name of a Thing is always unique and stable as long as the ID is unique."""
 
-        return slugify("{}-{}".format(self.title, self.uuid))
+        return self._get_cached("url_name", self._build_url_name)
 
     @property
     def properties(self):
@@ -171,14 +224,57 @@ class Thing(object):
             self._actions.values(),
             self._events.values())
 
-    def find_interaction(self, name):
+    @property
+    def forms(self):
+        """Sequence of forms for the operations that apply to the whole Thing."""
+
+        return self._forms
+
+    def clean_forms(self):
+        """Removes all the Thing-level Forms from this Thing."""
+
+        self._forms = []
+        self.invalidate_cache()
+
+    def add_form(self, form):
+        """Add a new Thing-level Form."""
+
+        assert form.interaction is None
+
+        existing = next((True for item in self._forms if item.id == form.id), False)
+
+        if existing:
+            raise ValueError("Duplicate Form: {}".format(form))
+
+        self._forms.append(form)
+        self.invalidate_cache()
+
+    def remove_form(self, form):
+        """Remove an existing Thing-level Form."""
+
+        try:
+            pop_idx = self._forms.index(form)
+            self._forms.pop(pop_idx)
+        except ValueError:
+            return
+
+        self.invalidate_cache()
+
+    def find_interaction(self, name, interaction_type=None):
         """Finds an existing Interaction by name.
-        The name argument may be the original name or the URL-safe version."""
+        The name argument may be the original name or the URL-safe version.
+        If the interaction_type argument is defined the Interaction
+        is only returned when it matches the given type."""
+
+        interaction = self._interactions_index.get(name, None)
+
+        if interaction is None:
+            return None
 
-        def is_match(intrct):
-            return intrct.name == name or intrct.url_name == name
+        if interaction_type is not None and interaction.interaction_type != interaction_type:
+            return None
 
-        return next((intrct for intrct in self.interactions if is_match(intrct)), None)
+        return interaction
 
     def add_interaction(self, interaction):
         """Add a new Interaction."""
@@ -203,6 +299,10 @@ class Thing(object):
             if isinstance(interaction, klass))
 
         interaction_dict_map[interaction_class][interaction.name] = interaction
+        self._interactions_index[interaction.name] = interaction
+        self._interactions_index[interaction.url_name] = interaction
+
+        self.invalidate_cache()
 
     def remove_interaction(self, name):
         """Removes an existing Interaction by name.
@@ -216,3 +316,7 @@ class Thing(object):
         self._properties.pop(interaction.name, None)
         self._actions.pop(interaction.name, None)
         self._events.pop(interaction.name, None)
+        self._interactions_index.pop(interaction.name, None)
+        self._interactions_index.pop(interaction.url_name, None)
+
+        self.invalidate_cache()
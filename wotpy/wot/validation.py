@@ -7,6 +7,8 @@ Schemas following the JSON Schema specification used to validate the shape of Th
 
 import re
 
+import jsonschema
+
 from wotpy.wot.enums import InteractionTypes
 
 REGEX_SAFE_NAME = r"^[a-zA-Z0-9_-]+$"
@@ -250,6 +252,10 @@ SCHEMA_THING = {
             "type": "array",
             "items": SCHEMA_LINK
         },
+        "forms": {
+            "type": "array",
+            "items": SCHEMA_FORM
+        },
         "security": {
             "type": "array",
             "items": {"type": "string"}
@@ -284,6 +290,17 @@ def interaction_schema_for_type(interaction_type):
     return type_schema_dict[interaction_type]
 
 
+def build_validator(schema):
+    """Checks the given JSON schema and returns a validator instance for it.
+    Validator instances may be reused to avoid the cost
+    of building a new validator each time a document is validated."""
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+
+    return validator_cls(schema)
+
+
 def is_valid_uri(val):
     """Returns True if the given value is a valid URI."""
 
@@ -296,6 +313,9 @@ def is_valid_safe_name(val):
     return False if re.match(REGEX_SAFE_NAME, val) is None else True
 
 
+VALIDATOR_THING = build_validator(SCHEMA_THING)
+
+
 class InvalidDescription(Exception):
     """Exception raised when a document for an object
     in the TD hierarchy has an invalid format."""
@@ -52,9 +52,9 @@ class WoT(object):
         td = None
 
         if isinstance(item, ExposedThing):
-            td = ThingDescription.from_thing(item.thing)
+            td = ThingDescription.from_thing(item.thing, validate=False)
         elif isinstance(item, Thing):
-            td = ThingDescription.from_thing(item)
+            td = ThingDescription.from_thing(item, validate=False)
         elif isinstance(item, ThingDescription):
             td = item
 
@@ -70,7 +70,7 @@ class WoT(object):
         """Builds an Observable to discover Things using the local method."""
 
         found_tds = [
-            ThingDescription.from_thing(exposed_thing.thing).to_str()
+            ThingDescription.from_thing(exposed_thing.thing, validate=False).to_str()
             for exposed_thing in self._servient.exposed_things
             if self._is_fragment_match(exposed_thing, thing_filter)
         ]